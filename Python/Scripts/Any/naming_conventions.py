@@ -0,0 +1,25 @@
+###
+### This script checks table, collection, primary key, foreign key and index names
+### against naming conventions in a single pass
+###
+### Notes:
+### 1. Conventions are passed as check arguments: TABLE, COLLECTION, PK, FK, INDEX
+### 2. Only configured kinds are checked (e.g., TABLE=UPPERCASE, PK=PK_{table}, FK=FK_{table}_{parent})
+### 3. See policychecks/naming.py for supported conventions and statements
+###
+### Rule logic lives in policychecks/any/naming_conventions.py
+###
+import os
+import sys
+import liquibase_utilities
+
+scripts_path = os.path.dirname(os.path.dirname(os.path.abspath(liquibase_utilities.get_script_path())))
+if scripts_path not in sys.path:
+    sys.path.append(scripts_path)
+from policychecks.any import naming_conventions
+naming_conventions.run()
+
+###
+### Default return code
+###
+False
@@ -3,56 +3,21 @@
 ###
 ### Notes:
 ### 1. Only basic CREATE statements are supported
-
+### 2. The convention can be changed with the TABLE argument (see policychecks/naming.py)
 ###
-### Helpers come from Liquibase
+### Rule logic lives in policychecks/any/table_names_uppercase.py
 ###
+import os
 import sys
 import liquibase_utilities
 
-###
-### Retrieve log handler
-### Ex. liquibase_logger.info(message)
-###
-liquibase_logger = liquibase_utilities.get_logger()
-
-###
-### Retrieve status handler
-###
-liquibase_status = liquibase_utilities.get_status()
-
-###
-### Retrieve all changes in changeset
-###
-changes = liquibase_utilities.get_changeset().getChanges()
-
-###
-### Loop through all changes
-###
-for change in changes:
-    ###
-    ### LoadData change types are not currently supported
-    ###
-    if "loaddatachange" in change.getClass().getSimpleName().lower():
-        continue
-    ###
-    ### Split sql into a list of strings to remove whitespace
-    ###
-    sql_list = liquibase_utilities.generate_sql(change).split()
-    ###
-    ### Locate create (or replace) table in list
-    ###
-    if "create" in map(str.casefold, sql_list) and "table" in map(str.casefold, sql_list):
-        index_table = [token.lower() for token in sql_list].index("table")
-        if index_table + 1 < len(sql_list):
-            table_name = sql_list[index_table + 1]
-            if not table_name.isupper():
-                liquibase_status.fired = True
-                status_message = str(liquibase_utilities.get_script_message()).replace("__TABLE_NAME__", f"\"{table_name}\"")
-                liquibase_status.message = status_message
-                sys.exit(1)
+scripts_path = os.path.dirname(os.path.dirname(os.path.abspath(liquibase_utilities.get_script_path())))
+if scripts_path not in sys.path:
+    sys.path.append(scripts_path)
+from policychecks.any import table_names_uppercase
+table_names_uppercase.run()
 
 ###
 ### Default return code
 ###
-False
\ No newline at end of file
+False
@@ -0,0 +1,23 @@
+###
+### This script checks collection validators against data domain rules in a single pass
+###
+### Notes:
+### 1. Rules are read from the JSON (or YAML) file named by the RULES_FILE argument
+### 2. See policychecks/mongodb/collection_data_domains.py for the rule file format
+###
+### Rule logic lives in policychecks/mongodb/collection_data_domains.py
+###
+import os
+import sys
+import liquibase_utilities
+
+scripts_path = os.path.dirname(os.path.dirname(os.path.abspath(liquibase_utilities.get_script_path())))
+if scripts_path not in sys.path:
+    sys.path.append(scripts_path)
+from policychecks.mongodb import collection_data_domains
+collection_data_domains.run()
+
+###
+### Default return code
+###
+False
@@ -0,0 +1,23 @@
+###
+### This script evaluates the Regex/MongoDB rules natively, parsing each change only once
+###
+### Notes:
+### 1. Select rules with the RULES argument (comma separated), all rules are evaluated by default
+### 2. See policychecks/mongodb/mongo_rules.py for the list of rules
+###
+### Rule logic lives in policychecks/mongodb/mongo_rules.py
+###
+import os
+import sys
+import liquibase_utilities
+
+scripts_path = os.path.dirname(os.path.dirname(os.path.abspath(liquibase_utilities.get_script_path())))
+if scripts_path not in sys.path:
+    sys.path.append(scripts_path)
+from policychecks.mongodb import mongo_rules
+mongo_rules.run()
+
+###
+### Default return code
+###
+False
@@ -0,0 +1,7 @@
+###
+### Shared helpers for the Liquibase Python policy checks
+###
+### Notes:
+### 1. Scripts add the folder containing this package to sys.path before importing it
+### 2. Modules stay loaded in sys.modules, so module level values are built once per run
+###
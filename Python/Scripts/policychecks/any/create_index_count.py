@@ -0,0 +1,454 @@
+###
+### This script ensures a table has less than x indexes
+###
+### Notes:
+### 1. The index count of a table is seeded once from the snapshot, the first time the table is seen,
+###    then kept up to date as changesets are processed:
+###      CREATE INDEX                        +1
+###      DROP INDEX                          -1 (the table is found by name for DROP INDEX without ON)
+###      CREATE TABLE                        PRIMARY KEY, UNIQUE, INDEX and KEY definitions of the table,
+###                                          column constraints included
+###      ALTER TABLE ... ADD                 PRIMARY KEY, UNIQUE, INDEX and KEY definitions
+###      ALTER TABLE ... DROP                -1 for PRIMARY KEY, UNIQUE, INDEX name and KEY name, and for
+###                                          CONSTRAINT name when the constraint has an index (primary key or
+###                                          unique constraint of the changelog or snapshot index of that name)
+###      DROP TABLE                          the table is forgotten until it is created again
+### 2. Counters are kept in the create_index_count run cache namespace (see policychecks/cache.py)
+###    and are never evicted. A changeset checked again (e.g., the check is configured twice with
+###    the same arguments) reuses its verdict instead of counting its indexes twice.
+### 3. Tables neither in the snapshot nor created in the changelog are skipped
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import cache, model, snapshot, statements
+
+###
+### Words allowed between CREATE and INDEX or TABLE
+###
+INDEX_MODIFIERS = frozenset(["unique", "bitmap", "clustered", "nonclustered", "fulltext", "spatial", "hash", "multivalue", "search", "vector"])
+TABLE_MODIFIERS = frozenset(["or", "replace", "global", "local", "private", "temporary", "temp", "unlogged", "sharded", "duplicated", "immutable", "blockchain"])
+
+###
+### Words starting an index definition inside CREATE TABLE or ALTER TABLE ... ADD
+###
+INDEX_DEFINITIONS = frozenset(["primary", "unique", "index", "key", "fulltext", "spatial"])
+
+class IndexCounter:
+    """
+    Index count of each table for one snapshot and MAX_INDEX.
+
+    Tables are keyed by casefolded name, each update is a dictionary operation.
+    """
+    def __init__(self, snapshot_model):
+        self.snapshot_model = snapshot_model
+        ###
+        ### casefolded table name -> [table name, index count], None for a table dropped in the changelog
+        ###
+        self.counts = {}
+        ###
+        ### casefolded index name -> casefolded table name, for indexes and constraints created in the changelog
+        ###
+        self.index_tables = {}
+        ###
+        ### casefolded index name -> table name, for snapshot indexes (read on the first DROP INDEX without ON or DROP CONSTRAINT)
+        ###
+        self.snapshot_index_tables = None
+        ###
+        ### changeset key -> verdict
+        ###
+        self.changesets = {}
+
+    def entry(self, table_name):
+        """Returns the [table name, index count] of a table, seeding it from the snapshot, None if the table is unknown or dropped."""
+        key = table_name.casefold()
+        if key in self.counts:
+            return self.counts[key]
+        table = self.snapshot_model.table(table_name)
+        if table is None:
+            return None
+        found = self.counts[key] = [table.name, table.index_count]
+        return found
+
+    def create_table(self, table_name, index_count):
+        """Records a new table with its inline indexes."""
+        self.counts[table_name.casefold()] = [table_name, index_count]
+        return self.counts[table_name.casefold()]
+
+    def add(self, table_name, index_name=None, count=1):
+        """Adds indexes to a table, returns its entry or None if the table is unknown."""
+        found = self.entry(table_name)
+        if found is None:
+            return None
+        found[1] += count
+        if index_name is not None:
+            self.index_tables[index_name.casefold()] = table_name.casefold()
+        return found
+
+    def name_index(self, table_name, index_name):
+        """Records the table of an index or constraint created inline (CREATE TABLE, ALTER TABLE ... ADD)."""
+        self.index_tables[index_name.casefold()] = table_name.casefold()
+
+    def remove(self, table_name, count=1):
+        """Removes indexes of a table, returns its entry or None if the table is unknown."""
+        found = self.entry(table_name)
+        if found is not None:
+            found[1] = max(found[1] - count, 0)
+        return found
+
+    def drop(self, index_name, table_name=None):
+        """Removes an index, returns the entry of its table or None if the table is unknown."""
+        key = index_name.casefold()
+        if table_name is None:
+            table_name = self.index_tables.pop(key, None) or self._snapshot_index_tables().pop(key, None)
+            if table_name is None:
+                return None
+        else:
+            self.index_tables.pop(key, None)
+            if self.snapshot_index_tables is not None:
+                self.snapshot_index_tables.pop(key, None)
+        return self.remove(table_name)
+
+    def drop_constraint(self, table_name, constraint_name):
+        """Removes the index of a primary key or unique constraint, None if the constraint has no known index (e.g., a foreign key)."""
+        key = constraint_name.casefold()
+        index_table = self.index_tables.get(key) or self._snapshot_index_tables().get(key)
+        if index_table is None or index_table.casefold() != table_name.casefold():
+            return None
+        return self.drop(constraint_name, table_name)
+
+    def drop_table(self, table_name):
+        """Forgets a dropped table and its indexes."""
+        key = table_name.casefold()
+        self.counts[key] = None
+        self.index_tables = {index: table for index, table in self.index_tables.items() if table != key}
+        if self.snapshot_index_tables is not None:
+            self.snapshot_index_tables = {index: table for index, table in self.snapshot_index_tables.items() if table.casefold() != key}
+
+    def _snapshot_index_tables(self):
+        if self.snapshot_index_tables is None:
+            table_names = {table.snapshot_id: table.name for table in self.snapshot_model.tables}
+            self.snapshot_index_tables = {}
+            for attributes in snapshot.objects(snapshot.load(["Index"]), "Index") or []:
+                table_name = table_names.get(snapshot.reference_id(attributes.get("relation") or ""))
+                if attributes.get("name") and table_name is not None:
+                    self.snapshot_index_tables[attributes["name"].casefold()] = table_name
+        return self.snapshot_index_tables
+
+###
+### Functions
+###
+def get_counter(snapshot_model, max_index):
+    """Returns the IndexCounter of the snapshot and MAX_INDEX, created once per run."""
+    counters = cache.namespace("create_index_count")
+    return counters.get_or_create((liquibase_utilities.get_arg("SNAPSHOT_FILE") or "", max_index), lambda: IndexCounter(snapshot_model))
+
+def changeset_key(changeset):
+    """Returns the file, id and author of a changeset, None if they are not available."""
+    try:
+        return (str(changeset.getFilePath()), str(changeset.getId()), str(changeset.getAuthor()))
+    except Exception:
+        return None
+
+def unquote(token):
+    """Returns an identifier without its quotes."""
+    if token[:1] in "\"`[" and len(token) > 1:
+        return token[1:-1]
+    return token
+
+def is_name(token):
+    return token[:1] in "\"`[" or token[:1].isalnum() or token[:1] in "_$#@"
+
+def read_name(tokens, position):
+    """Returns the last part of the [schema.]name at position (None if there is none) and the position after it."""
+    if position >= len(tokens) or not is_name(tokens[position]):
+        return None, position
+    name = unquote(tokens[position])
+    position += 1
+    while position + 1 < len(tokens) and tokens[position] == "." and is_name(tokens[position + 1]):
+        name = unquote(tokens[position + 1])
+        position += 2
+    return name, position
+
+def skip_words(words, tokens, position):
+    """Returns the position after the given casefolded words, unchanged if they do not follow."""
+    if [token.casefold() for token in tokens[position:position + len(words)]] == words:
+        return position + len(words)
+    return position
+
+def definitions(tokens, position):
+    """Yields the comma separated definitions in the parentheses at position, as lists of casefolded tokens at that depth."""
+    depth = 0
+    element = []
+    for token in tokens[position:]:
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            if depth == 0:
+                break
+        elif depth == 1:
+            if token == ",":
+                yield element
+                element = []
+            else:
+                element.append(token.casefold())
+    if element:
+        yield element
+
+def index_definitions(element):
+    """Returns the number of indexes a table element (column or constraint definition) creates."""
+    if element[:1] == ["constraint"]:
+        element = element[2:]
+    if element[:1] and element[0] in INDEX_DEFINITIONS:
+        return 1
+    return element.count("primary") + element.count("unique")
+
+def definition_name(element):
+    """Returns the constraint or index name of a table element (CONSTRAINT name ..., INDEX name ..., UNIQUE KEY name ...), None if it has none."""
+    if element[:1] == ["constraint"] and len(element) > 1:
+        return unquote(element[1])
+    position = 1 if element[:1] == ["unique"] else 0
+    if element[position:position + 1] in (["index"], ["key"]) and len(element) > position + 1 and is_name(element[position + 1]):
+        return unquote(element[position + 1])
+    return None
+
+def index_names(element):
+    """Returns the names of the indexes a table element creates: its INDEX or KEY name and the names of its primary key and unique constraints, column constraints included (id int CONSTRAINT pk PRIMARY KEY)."""
+    names = []
+    if element[:1] != ["constraint"]:
+        name = definition_name(element)
+        if name is not None:
+            names.append(name)
+    starts = [position for position, token in enumerate(element) if token == "constraint"]
+    for number, start in enumerate(starts):
+        end = starts[number + 1] if number + 1 < len(starts) else len(element)
+        body = element[start + 2:end]
+        if start + 1 < end and ("primary" in body or "unique" in body):
+            names.append(unquote(element[start + 1]))
+    return names
+
+def drop_definition(table_name, element):
+    """Returns the index change of an ALTER TABLE ... DROP element (element without DROP), None if it drops no index."""
+    if element[:2] == ["primary", "key"]:
+        return ("remove", table_name, None, 1)
+    if element[:1] == ["unique"]:
+        return ("remove", table_name, None, 1)
+    if element[:1] in (["index"], ["key"]) and len(element) > 1:
+        index_name, position = read_name(element, 1)
+        return ("drop", table_name, index_name, [index_name]) if index_name is not None else None
+    if element[:1] == ["constraint"]:
+        constraint_name, position = read_name(element, skip_words(["if", "exists"], element, 1))
+        return ("drop_constraint", table_name, constraint_name, None) if constraint_name is not None else None
+    return None
+
+def index_changes(statement):
+    """
+    Returns the index changes of a statement as a list of (action, table name, index name, detail).
+
+    action is create_table, add, name_index, drop, drop_constraint, remove or drop_table. detail is the
+    number of indexes created or removed (create_table, add, remove) or the parts of the qualified index
+    name (drop). Table or index names are None when the statement does not give them.
+    """
+    tokens = [token for token in statement.tokens if token != ";"]
+    words = [token.casefold() for token in tokens]
+    if len(words) < 3:
+        return []
+    ###
+    ### CREATE [UNIQUE ...] INDEX [CONCURRENTLY] [IF NOT EXISTS] [name] ON [ONLY] [schema.]table
+    ###
+    if words[0] == "create":
+        position = 1
+        while position < len(words) and words[position] in INDEX_MODIFIERS:
+            position += 1
+        if position < len(words) and words[position] == "index":
+            position = skip_words(["if", "not", "exists"], tokens, skip_words(["concurrently"], tokens, position + 1))
+            index_name = None
+            if position < len(words) and words[position] != "on":
+                index_name, position = read_name(tokens, position)
+            if position >= len(words) or words[position] != "on":
+                return []
+            table_name, position = read_name(tokens, skip_words(["only"], tokens, position + 1))
+            return [("add", table_name, index_name, 1)] if table_name is not None else []
+        ###
+        ### CREATE [GLOBAL TEMPORARY ...] TABLE [IF NOT EXISTS] [schema.]table (definitions)
+        ###
+        position = 1
+        while position < len(words) and words[position] in TABLE_MODIFIERS:
+            position += 1
+        if position < len(words) and words[position] == "table":
+            table_name, position = read_name(tokens, skip_words(["if", "not", "exists"], tokens, position + 1))
+            if table_name is None:
+                return []
+            elements = list(definitions(tokens, position)) if position < len(tokens) and tokens[position] == "(" else []
+            changes = [("create_table", table_name, None, sum(index_definitions(element) for element in elements))]
+            for element in elements:
+                if index_definitions(element) > 0:
+                    changes.extend(("name_index", table_name, index_name, None) for index_name in index_names(element))
+            return changes
+        return []
+    ###
+    ### DROP TABLE [IF EXISTS] [schema.]table [, ...] [CASCADE ...]
+    ###
+    if words[0] == "drop" and words[1] == "table":
+        position = skip_words(["if", "exists"], tokens, 2)
+        changes = []
+        while position < len(tokens):
+            table_name, position = read_name(tokens, position)
+            if table_name is None:
+                break
+            changes.append(("drop_table", table_name, None, None))
+            if position >= len(tokens) or tokens[position] != ",":
+                break
+            position += 1
+        return changes
+    ###
+    ### DROP INDEX [CONCURRENTLY] [IF EXISTS] [schema.]name [, ...] [ON [schema.]table]
+    ### SQL Server also accepts DROP INDEX table.name
+    ###
+    if words[0] == "drop" and words[1] == "index":
+        position = skip_words(["if", "exists"], tokens, skip_words(["concurrently"], tokens, 2))
+        names = []
+        while position < len(tokens):
+            start = position
+            index_name, position = read_name(tokens, position)
+            if index_name is None:
+                break
+            names.append((index_name, [unquote(token) for token in tokens[start:position] if token != "."]))
+            if position < len(tokens) and tokens[position] == ",":
+                position += 1
+                continue
+            break
+        table_name = None
+        if position < len(words) and words[position] == "on":
+            table_name, position = read_name(tokens, position + 1)
+        return [("drop", table_name, index_name, parts) for index_name, parts in names]
+    ###
+    ### ALTER TABLE [schema.]table ADD [CONSTRAINT name] PRIMARY KEY | UNIQUE | INDEX | KEY ...
+    ### ALTER TABLE [schema.]table DROP PRIMARY KEY | UNIQUE (...) | INDEX name | KEY name | CONSTRAINT name
+    ###
+    if words[0] == "alter" and words[1] == "table":
+        table_name, position = read_name(tokens, skip_words(["if", "exists"], tokens, 2))
+        if table_name is None:
+            return []
+        changes = []
+        for element in definitions(["("] + tokens[position:] + [")"], 0):
+            if element[:1] == ["add"]:
+                definition = element[2:] if element[1:2] == ["column"] else element[1:]
+                count = index_definitions(definition)
+                if count > 0:
+                    names = index_names(definition)
+                    changes.append(("add", table_name, names[0] if names else None, count))
+                    changes.extend(("name_index", table_name, index_name, None) for index_name in names[1:])
+            elif element[:1] == ["drop"]:
+                change = drop_definition(table_name, element[1:])
+                if change is not None:
+                    changes.append(change)
+        return changes
+    return []
+
+def apply(counter, statement, liquibase_logger):
+    """Applies the index changes of a statement, returns the entries of the tables that gained indexes."""
+    updated = []
+    for action, table_name, index_name, detail in index_changes(statement):
+        if action == "create_table":
+            updated.append(counter.create_table(table_name, detail))
+        elif action == "name_index":
+            counter.name_index(table_name, index_name)
+        elif action == "drop_table":
+            counter.drop_table(table_name)
+        elif action == "remove":
+            counter.remove(table_name, detail)
+        elif action == "drop_constraint":
+            counter.drop_constraint(table_name, index_name)
+        elif action == "add":
+            found = counter.add(table_name, index_name, detail)
+            if found is None:
+                liquibase_logger.warning(f"Table \"{table_name}\" not found in snapshot. Statement skipped.")
+            else:
+                updated.append(found)
+        else:
+            found = counter.drop(index_name, table_name)
+            ###
+            ### DROP INDEX table.name (SQL Server)
+            ###
+            if found is None and table_name is None and len(detail) >= 2:
+                found = counter.drop(index_name, detail[-2]) if counter.entry(detail[-2]) is not None else None
+            if found is None:
+                liquibase_logger.warning(f"Table of index \"{index_name}\" not found. Statement skipped.")
+    return updated
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve snapshot tables (built once per run)
+    ###
+    snapshot_model = model.get_model()
+
+    ###
+    ### Exit if table data is missing
+    ###
+    if len(snapshot_model.tables) == 0:
+        liquibase_status.fired = False
+        liquibase_logger.warning("Table data missing from snapshot. Check skipped.")
+        return
+
+    ###
+    ### Retrive maximum size from check definition
+    ###
+    max_index = int(liquibase_utilities.get_arg("MAX_INDEX"))
+
+    ###
+    ### Retrieve the index counts of this run, reuse the verdict of a changeset already counted
+    ###
+    counter = get_counter(snapshot_model, max_index)
+    changeset = liquibase_utilities.get_changeset()
+    key = changeset_key(changeset)
+    if key is not None and key in counter.changesets:
+        violation = counter.changesets[key]
+    else:
+        violation = None
+        ###
+        ### Loop through all changes, count every statement of the changeset before reporting
+        ###
+        for change in changeset.getChanges():
+            ###
+            ### LoadData change types are not currently supported
+            ###
+            if "loaddatachange" in change.getClass().getSimpleName().lower():
+                liquibase_logger.info("LoadData change type not supported. Statement skipped.")
+                continue
+            ###
+            ### Split sql into statements, without comments (see policychecks/statements.py)
+            ###
+            for statement in statements.of_change(change):
+                for table_name, index_total in apply(counter, statement, liquibase_logger):
+                    if index_total > max_index and violation is None:
+                        violation = (table_name, index_total)
+        if key is not None:
+            counter.changesets[key] = violation
+
+    ###
+    ### Check for maximum
+    ###
+    if violation is not None:
+        table_name, index_total = violation
+        liquibase_status.fired = True
+        status_message = str(liquibase_utilities.get_script_message()).replace("__TABLE_NAME__", f"\"{table_name}\"")
+        status_message = status_message.replace("__INDEX_COUNT__", str(index_total))
+        liquibase_status.message = status_message
@@ -0,0 +1,71 @@
+###
+### This script checks for the phrase "DELETE FROM" without "WHERE"
+###
+### Notes:
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import memo, statements
+
+###
+### Functions
+###
+def has_where(statement):
+    """Returns True if the statement has a WHERE clause outside of parentheses."""
+    depth = 0
+    for token in statement.tokens:
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif depth == 0 and token.casefold() == "where":
+            return True
+    return False
+
+def is_delete_without_where(statement):
+    """Returns True for a DELETE FROM statement without a WHERE clause."""
+    return statement.keywords[:2] == ("delete", "from") and not has_where(statement)
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### LoadData change types are not currently supported
+        ###
+        if "loaddatachange" in change.getClass().getSimpleName().lower():
+            continue
+        ###
+        ### Split sql into statements, without comments (see policychecks/statements.py)
+        ###
+        for statement in statements.of_change(change):
+            ###
+            ### Look for delete, repeated statements reuse their verdict (see policychecks/memo.py)
+            ###
+            if memo.verdict("delete_without_where", (), statement.fingerprint, lambda: is_delete_without_where(statement)):
+                liquibase_status.fired = True
+                liquibase_status.message = liquibase_utilities.get_script_message()
+                return
@@ -0,0 +1,63 @@
+###
+### This script ensures all foreign key names have the pattern FK_<child table>_<parent table>
+###
+### Notes:
+### 1. Only basic CREATE or ALTER statements are supported
+### 2. Constraint names must be provided (not auto-generated)
+### 3. The convention can be changed with the FK argument (see policychecks/naming.py)
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import naming, statements
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve convention from check definition, names are compared in lowercase
+    ###
+    conventions = {"fk": naming.convention("fk", (liquibase_utilities.get_arg("FK") or "fk_{table}_{parent}").casefold())}
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### LoadData change types are not currently supported
+        ###
+        if "loaddatachange" in change.getClass().getSimpleName().lower():
+            liquibase_logger.info("LoadData change type not supported. Statement skipped.")
+            continue
+        ###
+        ### Split sql into statements, check foreign key names, without comments and extra whitespace (see policychecks/statements.py)
+        ###
+        for statement in statements.of_change(change):
+            raw_statement = statement.casefolded
+            violation = naming.find_violation(naming.extract_identifiers(raw_statement), conventions)
+            if violation is not None:
+                identifier, convention = violation
+                liquibase_status.fired = True
+                status_message = str(liquibase_utilities.get_script_message()).replace("__NAME_CURRENT__", f"\"{identifier.name}\"")
+                status_message = status_message.replace("__NAME_STANDARD__", f"\"{convention.expected(identifier)}\"")
+                liquibase_status.message = status_message
+                return
@@ -0,0 +1,75 @@
+###
+### This script checks for quotes in identifier names
+###
+### Notes:
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import memo, statements
+
+###
+### Functions
+###
+def quoted_identifier(raw_statement):
+    """Returns the first quoted identifier of a statement, None if there is none."""
+    ###
+    ### Skip statements without quotes, sqlparse is only imported when needed
+    ###
+    if "\"" not in raw_statement:
+        return None
+    import sqlparse
+    # Get list of token objects
+    tokens = liquibase_utilities.tokenize(raw_statement)
+    identifiers = [str(token) for token in tokens if isinstance(token, sqlparse.sql.Identifier)]
+    # Check each string for quotes
+    for identifier in identifiers:
+        if "\"" in identifier:
+            return identifier
+    return None
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### LoadData change types are not currently supported
+        ###
+        if "loaddatachange" in change.getClass().getSimpleName().lower():
+            liquibase_logger.info("LoadData change type not supported. Statement skipped.")
+            continue
+        ###
+        ### Split sql into statements, without comments and extra whitespace (see policychecks/statements.py)
+        ###
+        for statement in statements.of_change(change):
+            ###
+            ### Repeated statements reuse their verdict (see policychecks/memo.py)
+            ###
+            identifier = memo.verdict("identifiers_without_quotes", (), statement.fingerprint, lambda: quoted_identifier(statement.normalized))
+            if identifier is not None:
+                liquibase_status.fired = True
+                status_message = str(liquibase_utilities.get_script_message()).replace("__ID_NAME__", identifier)
+                liquibase_status.message = status_message
+                return
@@ -0,0 +1,72 @@
+###
+### This script checks table, collection, primary key, foreign key and index names
+### against naming conventions in a single pass
+###
+### Notes:
+### 1. Conventions are passed as check arguments: TABLE, COLLECTION, PK, FK, INDEX
+### 2. Only configured kinds are checked (e.g., TABLE=UPPERCASE, PK=PK_{table}, FK=FK_{table}_{parent})
+### 3. See policychecks/naming.py for supported conventions and statements
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import naming, statements
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve conventions from check definition
+    ###
+    conventions = naming.load_conventions(liquibase_utilities.get_arg)
+    if len(conventions) == 0:
+        liquibase_logger.warning("No naming conventions in check definition. Check skipped.")
+        return
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### LoadData change types are not currently supported
+        ###
+        if "loaddatachange" in change.getClass().getSimpleName().lower():
+            liquibase_logger.info("LoadData change type not supported. Statement skipped.")
+            continue
+        ###
+        ### Split sql into statements, check all identifiers in one pass, without comments and extra whitespace (see policychecks/statements.py)
+        ###
+        for statement in statements.of_change(change):
+            raw_statement = statement.normalized
+            violation = naming.find_violation(naming.extract_identifiers(raw_statement), conventions)
+            if violation is not None:
+                identifier, convention = violation
+                name_standard = convention.expected(identifier)
+                liquibase_status.fired = True
+                status_message = str(liquibase_utilities.get_script_message() or "")
+                if len(status_message.strip()) == 0:
+                    status_message = "Name of __OBJECT_TYPE__ __OBJECT_NAME__ does not follow the naming standard (__NAME_STANDARD__)."
+                status_message = status_message.replace("__OBJECT_TYPE__", identifier.kind)
+                status_message = status_message.replace("__OBJECT_NAME__", f"\"{identifier.name}\"")
+                status_message = status_message.replace("__NAME_STANDARD__", f"\"{name_standard}\"")
+                liquibase_status.message = status_message
+                return
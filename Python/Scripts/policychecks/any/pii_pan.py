@@ -0,0 +1,91 @@
+###
+### This script checks for raw PANs in data fixes
+###
+### Notes:
+### 1. This script only checks INSERT and UPDATE statements.
+
+###
+### Utilities come from Liquibase
+###
+import liquibase_utilities
+from policychecks import memo, patterns, statements
+
+###
+### Regex pattern for raw PANs (13–19 digits), compiled once in policychecks/patterns.py
+###
+PAN_PATTERN = patterns.PII_PAN
+
+###
+### Functions
+###
+def find_pans(sql_text):
+    """Returns the type and matches of the first INSERT or UPDATE statement with a raw PAN, None if there is none."""
+    import sqlparse
+    ###
+    ### Split into statements
+    ###
+    parsed_statements = sqlparse.parse(sql_text)
+    for stmt in parsed_statements:
+        ###
+        ### Get the type of SQL statement (INSERT, UPDATE, etc.)
+        ###
+        stmt_type = stmt.get_type()
+        if stmt_type in ("INSERT", "UPDATE"):
+            ###
+            ### Convert statement to string for regex search
+            ###
+            stmt_str = str(stmt)
+            # Search for raw PANs
+            matches = PAN_PATTERN.findall(stmt_str)
+            if matches:
+                return stmt_type, tuple(matches)
+    return None
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### LoadData change types are not currently supported
+        ###
+        if "loaddatachange" in change.getClass().getSimpleName().lower():
+            continue
+        ###
+        ### Retrieve raw sql
+        ###
+        sql_text = liquibase_utilities.generate_sql(change)
+        ###
+        ### Skip changes without a match, sqlparse is only imported when needed
+        ###
+        if not PAN_PATTERN.search(sql_text):
+            continue
+        ###
+        ### Repeated changes reuse their verdict (see policychecks/memo.py)
+        ###
+        found = memo.verdict("pii_pan", (), statements.fingerprint(sql_text), lambda: find_pans(sql_text))
+        if found is not None:
+            stmt_type, matches = found[0], list(found[1])
+            liquibase_logger.warning(f"Raw PAN detected in {stmt_type}: {matches}")
+            liquibase_status.fired = True
+            liquibase_status.message = f"Raw PAN detected in {stmt_type}. Matches: {matches}"
+            return
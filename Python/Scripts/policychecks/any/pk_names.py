@@ -0,0 +1,64 @@
+###
+### This script ensures all primary key names have the pattern PK_tablename
+###
+### Notes:
+### 1. The convention can be changed with the PK argument (see policychecks/naming.py)
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import batch, naming
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve database object
+    ###
+    database_object = liquibase_utilities.get_database_object()
+
+    ###
+    ### Skip if not a table
+    ###
+    if not liquibase_utilities.is_table(database_object):
+        return
+    table_name = database_object.getName()
+    pk_convention = naming.convention("pk", liquibase_utilities.get_arg("PK") or "PK_{table}")
+
+    ###
+    ### All tables in the snapshot are evaluated on the first call, look up this table
+    ###
+    results = batch.verdicts(f"pk_names_verdicts:{pk_convention.standard}", lambda: batch.primary_key_verdicts(pk_convention))
+    table_key = (batch.schema_name(database_object), table_name)
+    if table_key in results:
+        verdict = results[table_key]
+    else:
+        pk_object = database_object.getPrimaryKey()
+        ###
+        ### Skip if table doesn't have PK
+        ###
+        if pk_object is None:
+            liquibase_logger.info(f"Table \"{table_name}\" does not have a primary key. Check skipped.")
+            return
+        verdict = naming.check(pk_convention, naming.Identifier("pk", pk_object.getName(), table_name, None))
+    if verdict is not None:
+        pk_name_current, pk_name_standard = verdict
+        liquibase_status.fired = True
+        status_message = str(liquibase_utilities.get_script_message()).replace("__CURRENT_NAME__", f"\"{pk_name_current}\"")
+        status_message = status_message.replace("__NAME_STANDARD__", f"\"{pk_name_standard}\"")
+        liquibase_status.message = status_message
+        return
@@ -0,0 +1,68 @@
+###
+### This script ensures all tables and column names are under a maximum size
+###
+### Notes:
+### 1. The check is a len() of the object name, it is not batched (see policychecks/batch.py): looking
+###    up a verdict costs as much as the check itself
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+
+###
+### Functions
+###
+def check_size(object_name, max_size):
+    """Returns the name size if it is over the maximum, otherwise None."""
+    size = len(object_name)
+    return size if size > max_size else None
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve database object
+    ###
+    database_object = liquibase_utilities.get_database_object()
+
+    ###
+    ### Retrive maximum size from check definition
+    ###
+    max_size = int(liquibase_utilities.get_arg("MAX_SIZE"))
+
+    ###
+    ### Check column and table names
+    ###
+    if liquibase_utilities.is_column(database_object) or liquibase_utilities.is_table(database_object):
+        object_name = database_object.getName()
+        object_type = database_object.getObjectTypeName()
+    else:
+        liquibase_status.fired = False
+        liquibase_logger.info("Object not table or column. Check skipped.")
+        return
+
+    ###
+    ### Check size
+    ###
+    current_size = check_size(object_name, max_size)
+    if current_size is not None:
+        liquibase_status.fired = True
+        status_message = str(liquibase_utilities.get_script_message()).replace("__OBJECT_TYPE__", object_type)
+        status_message = status_message.replace("__OBJECT_NAME__", f"\"{object_name}\"")
+        status_message = status_message.replace("__CURRENT_SIZE__", str(current_size))
+        liquibase_status.message = status_message
+        return
@@ -0,0 +1,59 @@
+###
+### This script checks for camelCase table names during CREATE TABLE
+###
+### Notes:
+### 1. Only basic CREATE TABLE statements are supported
+### 2. The convention can be changed with the TABLE argument (see policychecks/naming.py)
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import naming, statements
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve convention from check definition, camelCase by default
+    ###
+    conventions = naming.load_conventions(liquibase_utilities.get_arg, {"table": "camelCase"})
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### LoadData change types are not currently supported
+        ###
+        if "loaddatachange" in change.getClass().getSimpleName().lower():
+            continue
+        ###
+        ### Split sql into statements, check table names, without comments and extra whitespace (see policychecks/statements.py)
+        ###
+        for statement in statements.of_change(change):
+            raw_statement = statement.normalized
+            violation = naming.find_violation(naming.extract_identifiers(raw_statement), conventions)
+            if violation is not None:
+                identifier, convention = violation
+                liquibase_status.fired = True
+                status_message = "Table name \"" + f"{identifier.name}" + "\" is NOT " + f"{convention.expected(identifier)}" + "."
+                liquibase_status.message = status_message
+                return
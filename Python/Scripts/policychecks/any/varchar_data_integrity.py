@@ -0,0 +1,141 @@
+###
+### This script checks for numeric characters in VARCHAR columns
+###
+### Notes:
+### 1. INSERT ... VALUES (one or many rows) and UPDATE ... SET statements are supported
+### 2. Values are read by a single pass literal tokenizer (policychecks/literals.py), rows are
+###    checked as they are read. Only string and number literals are data, NULL, function calls
+###    and other expressions are not checked
+### 3. LoadData change types are not supported by checks
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import literals, model, statements
+
+###
+### Functions
+###
+def check_data(string_data):
+    """Returns True if data is valid."""
+    return not any(char.isdigit() for char in string_data)
+
+def is_varchar(column_object):
+    return column_object is not None and "varchar" in (column_object.type_name or "").lower()
+
+def find_invalid_value(rows, column_objects):
+    """
+    Returns the column name of the first string or number value with numeric characters in a VARCHAR column.
+
+    Args:
+        rows: Iterable of rows (lists of literals.Value)
+        column_objects: Snapshot column of each value position (None if not found)
+
+    Returns:
+        (column name of the first invalid value or None, True if a row did not match the columns)
+    """
+    checked = [(position, column_object.name) for position, column_object in enumerate(column_objects) if is_varchar(column_object)]
+    mismatch = False
+    for row in rows:
+        if len(row) != len(column_objects):
+            mismatch = True
+            continue
+        for position, column_name in checked:
+            value = row[position]
+            if (value.kind == "string" or value.kind == "number") and not check_data(value.text):
+                return column_name, mismatch
+    return None, mismatch
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve snapshot tables and columns (built once per run)
+    ###
+    snapshot_model = model.get_model()
+
+    ###
+    ### Exit if column or table data is missing
+    ###
+    if len(snapshot_model.tables) == 0 or len(snapshot_model.columns) == 0:
+        liquibase_status.fired = False
+        liquibase_logger.warning("Column or Table data missing from snapshot. Check skipped.")
+        return
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### LoadData change types are not currently supported
+        ###
+        if "loaddatachange" in change.getClass().getSimpleName().lower():
+            liquibase_logger.info("LoadData change type not supported. Statement skipped.")
+            continue
+        ###
+        ### Split sql into statements, without comments (see policychecks/statements.py)
+        ###
+        for statement in statements.of_change(change):
+            raw_statement = statement.code
+            backslash_escapes = statement.family == "mysql"
+            ###
+            ### INSERT INTO TABLE [(column1, column2, ...)] VALUES (value1, value2, ...), (...), ...
+            ###
+            parsed = literals.insert(raw_statement, backslash_escapes)
+            if parsed is not None:
+                table_name, column_names, rows = parsed
+            else:
+                ###
+                ### UPDATE TABLE SET column1 = value1, column2 = value2, ...
+                ###
+                parsed = literals.update(raw_statement, backslash_escapes)
+                if parsed is None:
+                    liquibase_logger.info(f"Non Insert/Update statement skipped: {statement.normalized}")
+                    continue
+                table_name, assignments = parsed
+                column_names = [column_name for column_name, value in assignments]
+                rows = [[value for column_name, value in assignments]]
+            ###
+            ### Locate table, then the columns once per statement
+            ###
+            table_object = snapshot_model.table(table_name)
+            if table_object is None:
+                liquibase_logger.warning(f"Table \"{table_name}\" not found in snapshot. Statement skipped.")
+                continue
+            if column_names is None:
+                column_objects = list(table_object.columns)
+            else:
+                column_objects = [table_object.column(column_name) for column_name in column_names]
+            if len(column_objects) == 0:
+                liquibase_logger.warning("Column/data count mismatch. Statement skipped.")
+                continue
+            ###
+            ### Check for numeric characters in varchar columns, row by row
+            ###
+            column_name, mismatch = find_invalid_value(rows, column_objects)
+            if mismatch:
+                liquibase_logger.warning("Column/data count mismatch. Rows skipped.")
+            if column_name is not None:
+                liquibase_status.fired = True
+                status_message = str(liquibase_utilities.get_script_message()).replace("__COLUMN_NAME__", f"\"{column_name}\"")
+                liquibase_status.message = status_message
+                return
@@ -0,0 +1,159 @@
+###
+### Bounded, namespaced run cache
+###
+### liquibase_utilities.get_cache/put_cache is one dictionary for the whole run: keys of different
+### scripts can collide and nothing is ever evicted. Scripts keep their entries in a Namespace
+### instead, a least recently used dictionary stored in the run cache under "policychecks:<name>".
+###
+### Limits of a namespace (set by the first caller, None is no limit):
+###   max_entries  number of entries
+###   max_weight   total weight of the entries, weigh(value) gives the weight of one entry
+###                (e.g., len of a text), an entry heavier than max_weight is not kept
+###   ttl          seconds an entry stays valid after it is stored
+###
+### Notes:
+### 1. Hits, misses and evictions are counted per namespace and logged every STATS_INTERVAL lookups,
+###    stats() returns them for all namespaces of the run (the offline runner, policychecks/runner.py,
+###    reports them at the end of a run)
+### 2. Namespaces are per run, like the Liquibase cache they are stored in
+###
+from collections import OrderedDict
+import time
+try:
+    import liquibase_utilities
+except ImportError:
+    ###
+    ### Scripts run from a Python virtual environment use the liquibase-checks-python package
+    ###
+    from liquibase_checks_python import liquibase_utilities
+
+###
+### Run cache keys and statistics interval
+###
+NAMESPACE_CACHE_PREFIX = "policychecks:"
+NAMESPACES_CACHE_KEY = "policychecks_namespaces"
+STATS_INTERVAL = 10000
+
+_MISSING = object()
+
+class Namespace:
+    """
+    Least recently used dictionary with entry, weight and age limits.
+
+    Use namespace() to get the Namespace of a script, it is created on first use.
+    """
+    __slots__ = ("name", "max_entries", "max_weight", "weigh", "ttl", "weight", "hits", "misses", "evictions", "_entries")
+
+    def __init__(self, name, max_entries=None, max_weight=None, weigh=None, ttl=None):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.ttl = ttl
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        ###
+        ### key -> (value, weight, expiry time)
+        ###
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        """Returns the value of a key, default if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and (entry[2] is None or entry[2] > time.monotonic()):
+            self._entries.move_to_end(key)
+            self._count(True)
+            return entry[0]
+        if entry is not None:
+            self._remove(key)
+        self._count(False)
+        return default
+
+    def put(self, key, value):
+        """Stores a value, evicting the least recently used entries beyond the limits."""
+        if key in self._entries:
+            self._remove(key)
+        weight = self.weigh(value) if self.weigh is not None else 0
+        if self.max_weight is not None and weight > self.max_weight:
+            return
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, weight, expiry)
+        self.weight += weight
+        while (self.max_entries is not None and len(self._entries) > self.max_entries) or \
+              (self.max_weight is not None and self.weight > self.max_weight):
+            evicted_key, (evicted_value, evicted_weight, evicted_expiry) = self._entries.popitem(last=False)
+            self.weight -= evicted_weight
+            self.evictions += 1
+
+    def get_or_create(self, key, create):
+        """Returns the value of a key, storing create() on a miss. None is a valid value."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = create()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self.weight = 0
+
+    def stats(self):
+        """Returns the entry count, weight, hits, misses and evictions of the namespace."""
+        return {"entries": len(self._entries), "weight": self.weight, "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def _remove(self, key):
+        value, weight, expiry = self._entries.pop(key)
+        self.weight -= weight
+
+    def _count(self, hit):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if (self.hits + self.misses) % STATS_INTERVAL == 0:
+            stats = self.stats()
+            liquibase_utilities.get_logger().info(
+                f"Cache {self.name}: {stats['entries']} entries, {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+
+def namespace(name, max_entries=None, max_weight=None, weigh=None, ttl=None):
+    """
+    Returns the Namespace of a name for this run, creating it on first use.
+
+    Args:
+        name: Namespace name, usually the script or module name
+        max_entries: Maximum number of entries, None for no limit
+        max_weight: Maximum total weight, None for no limit
+        weigh: Function returning the weight of a value, required with max_weight
+        ttl: Seconds an entry stays valid, None for no limit
+
+    Returns:
+        The Namespace, the limits of an existing namespace are not changed.
+    """
+    cache_key = NAMESPACE_CACHE_PREFIX + name
+    found = liquibase_utilities.get_cache(cache_key, None)
+    if found is None:
+        found = Namespace(name, max_entries, max_weight, weigh, ttl)
+        liquibase_utilities.put_cache(cache_key, found)
+        names = liquibase_utilities.get_cache(NAMESPACES_CACHE_KEY, None)
+        if names is None:
+            names = []
+            liquibase_utilities.put_cache(NAMESPACES_CACHE_KEY, names)
+        names.append(name)
+    return found
+
+def stats():
+    """Returns the statistics of every namespace of the run, by name."""
+    results = {}
+    for name in liquibase_utilities.get_cache(NAMESPACES_CACHE_KEY, None) or []:
+        found = liquibase_utilities.get_cache(NAMESPACE_CACHE_PREFIX + name, None)
+        if found is not None:
+            results[name] = found.stats()
+    return results
@@ -0,0 +1,214 @@
+###
+### SQL literal tokenizer for data changes (INSERT ... VALUES, UPDATE ... SET)
+###
+### The statement is scanned once, left to right. Rows of VALUES (...), (...), ... and SET assignments
+### are yielded one at a time, so a data fix with 100k rows is checked without building all rows.
+### Each value is a Value tuple:
+###   string      'text', N'text', E'text' (text is the unescaped content)
+###   number      123, -1.5, 2e10
+###   null        NULL
+###   call        function call, e.g. upper('x'), to_date('2024-01-01', 'YYYY-MM-DD')
+###   expression  anything else, e.g. a + 1, DEFAULT, (select ...)
+### call and expression text is the source text of the value.
+###
+### Notes:
+### 1. '' is a quote inside a string. Backslash escapes are understood when requested (MySQL) and in
+###    E'...' strings (PostgreSQL)
+### 2. Statements are expected without comments (Statement.code, see policychecks/statements.py)
+###
+import re
+from collections import namedtuple
+
+###
+### A value of a row or assignment
+###
+Value = namedtuple("Value", "kind text")
+
+###
+### One alternative per token, whitespace before a token is part of the match
+###
+_TOKENS = r"""\s*(?:
+    (?P<string>(?P<escaped>[eE]'(?:[^'\\]|\\.|'')*'?)|(?P<prefix>[nN])?'{string_body}'?)
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<word>[^\W\d][\w$#@]*)
+  | (?P<quoted>"(?:[^"]|"")*"?|`[^`]*`?|\[[^\]]*\]?)
+  | (?P<punct>[(),.=;])
+  | (?P<other>\S)
+)"""
+TOKEN_PATTERN = re.compile(_TOKENS.format(string_body=r"(?:[^']|'')*"), re.VERBOSE | re.DOTALL)
+BACKSLASH_TOKEN_PATTERN = re.compile(_TOKENS.format(string_body=r"(?:[^'\\]|\\.|'')*"), re.VERBOSE | re.DOTALL)
+ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "0": "\0", "Z": "\x1a"}
+
+def _unescape(match):
+    return ESCAPES.get(match.group(1), match.group(1))
+
+def tokens(text, backslash_escapes=False):
+    """Yields (kind, value, start, end) tokens of a text, whitespace removed. String values are unescaped."""
+    pattern = BACKSLASH_TOKEN_PATTERN if backslash_escapes else TOKEN_PATTERN
+    for match in pattern.finditer(text):
+        kind = match.lastgroup
+        start, end = match.span(kind)
+        if kind == "string":
+            escaped = match.group("escaped") is not None
+            opening = 2 if escaped or match.group("prefix") is not None else 1
+            value = text[start + opening:end - 1 if end - start > opening and text[end - 1] == "'" else end]
+            if "''" in value:
+                value = value.replace("''", "'")
+            if (backslash_escapes or escaped) and "\\" in value:
+                value = ESCAPE_PATTERN.sub(_unescape, value)
+            yield kind, value, start, end
+        else:
+            yield kind, text[start:end], start, end
+
+def unquote(name):
+    """Returns an identifier without its quotes."""
+    if name[:1] in "\"`[" and len(name) > 1:
+        return name[1:-1]
+    return name
+
+def _value(text, parts):
+    """Returns the Value of the (kind, value, start, end) tokens of one value."""
+    if len(parts) == 1:
+        kind, value, start, end = parts[0]
+        if kind == "string" or kind == "number":
+            return Value(kind, value)
+        if kind == "word" and value.casefold() == "null":
+            return Value("null", None)
+    elif len(parts) == 2 and parts[0][1] in ("-", "+") and parts[1][0] == "number":
+        return Value("number", parts[0][1] + parts[1][1])
+    source = text[parts[0][2]:parts[-1][3]] if parts else ""
+    if len(parts) >= 3 and parts[0][0] == "word" and parts[1][1] == "(" and parts[-1][1] == ")":
+        return Value("call", source)
+    return Value("expression", source)
+
+def _name(stream, token):
+    """Returns the last part of a [schema.]name starting with token, and the token after it."""
+    name = unquote(token[1])
+    token = next(stream, None)
+    while token is not None and token[1] == ".":
+        token = next(stream, None)
+        if token is None:
+            break
+        name = unquote(token[1])
+        token = next(stream, None)
+    return name, token
+
+def _names(stream):
+    """Returns the names of a parenthesized list whose ( was read, and the token after the )."""
+    names = []
+    token = next(stream, None)
+    while token is not None and token[1] != ")":
+        if token[1] == ",":
+            token = next(stream, None)
+            continue
+        name, token = _name(stream, token)
+        names.append(name)
+    return names, next(stream, None)
+
+def _rows(text, stream):
+    """Yields the rows of a VALUES list, the stream is positioned after VALUES."""
+    token = next(stream, None)
+    while token is not None and token[1] == "(":
+        row = []
+        parts = []
+        depth = 1
+        for token in stream:
+            value = token[1]
+            if token[0] == "punct":
+                if value == "(":
+                    depth += 1
+                elif value == ")":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                elif value == "," and depth == 1:
+                    row.append(_value(text, parts))
+                    parts = []
+                    continue
+            parts.append(token)
+        if parts or row:
+            row.append(_value(text, parts))
+        yield row
+        token = next(stream, None)
+        if token is None or token[1] != ",":
+            return
+        token = next(stream, None)
+
+def insert(text, backslash_escapes=False):
+    """
+    Parses INSERT [INTO] [schema.]table [(columns)] VALUES (...), (...), ...
+
+    Args:
+        text: Statement without comments
+        backslash_escapes: True if backslashes escape characters in strings (MySQL)
+
+    Returns:
+        (table name, column names or None, generator of rows), None if the statement is not an INSERT ... VALUES.
+        Each row is a list of Value tuples.
+    """
+    stream = tokens(text, backslash_escapes)
+    token = next(stream, None)
+    if token is None or token[1].casefold() != "insert":
+        return None
+    token = next(stream, None)
+    if token is not None and token[1].casefold() == "into":
+        token = next(stream, None)
+    if token is None or token[0] not in ("word", "quoted"):
+        return None
+    table_name, token = _name(stream, token)
+    columns = None
+    if token is not None and token[1] == "(":
+        columns, token = _names(stream)
+    if token is None or token[1].casefold() != "values":
+        return None
+    return table_name, columns, _rows(text, stream)
+
+def update(text, backslash_escapes=False):
+    """
+    Parses UPDATE [schema.]table SET column = value, ... [WHERE ...]
+
+    Args:
+        text: Statement without comments
+        backslash_escapes: True if backslashes escape characters in strings (MySQL)
+
+    Returns:
+        (table name, list of (column name, Value)), None if the statement is not an UPDATE ... SET.
+    """
+    stream = tokens(text, backslash_escapes)
+    token = next(stream, None)
+    if token is None or token[1].casefold() != "update":
+        return None
+    token = next(stream, None)
+    if token is None or token[0] not in ("word", "quoted"):
+        return None
+    table_name, token = _name(stream, token)
+    if token is None or token[1].casefold() != "set":
+        return None
+    assignments = []
+    while True:
+        token = next(stream, None)
+        if token is None or token[0] not in ("word", "quoted"):
+            break
+        column_name, token = _name(stream, token)
+        if token is None or token[1] != "=":
+            break
+        parts = []
+        depth = 0
+        for token in stream:
+            if token[0] == "punct":
+                if token[1] == "(":
+                    depth += 1
+                elif token[1] == ")":
+                    depth -= 1
+                elif depth == 0 and token[1] in (",", ";"):
+                    break
+            elif depth == 0 and token[0] == "word" and token[1].casefold() in ("where", "from", "returning"):
+                break
+            parts.append(token)
+        else:
+            token = None
+        assignments.append((column_name, _value(text, parts)))
+        if token is None or token[1] != ",":
+            break
+    return table_name, assignments
@@ -0,0 +1,41 @@
+###
+### Statement verdict memo
+###
+### Changelogs repeat the same statements many times (grants, audit column alters, templated
+### inserts). A rule that has already judged a statement in this run reads its verdict back
+### instead of evaluating the statement again.
+###
+### Verdicts are keyed by (rule id, rule arguments, statement fingerprint, snapshot digest):
+###   rule arguments   the get_arg values the verdict depends on, as a tuple
+###   fingerprint      digest of the normalized statement (see policychecks/statements.py)
+###   snapshot digest  digest of the snapshot the verdict depends on (Model.digest), None if it does not
+###
+### Notes:
+### 1. The memo is a run cache namespace shared by all scripts (see policychecks/cache.py), it holds
+###    the MEMO_SIZE most recently used verdicts (about 200 bytes each)
+### 2. Verdicts must not be modified by the caller, use None, booleans, strings or tuples
+###
+from policychecks import cache
+
+###
+### Run cache namespace and size
+###
+MEMO_NAMESPACE = "verdict_memo"
+MEMO_SIZE = 4096
+
+def verdict(rule_id, args, fingerprint, evaluate, snapshot_digest=None):
+    """
+    Returns the verdict of a rule for a statement, evaluating it only the first time.
+
+    Args:
+        rule_id: Rule name, e.g. the script name
+        args: Tuple of the rule arguments
+        fingerprint: Statement fingerprint (Statement.fingerprint or statements.fingerprint())
+        evaluate: Function returning the verdict
+        snapshot_digest: Digest of the snapshot the verdict depends on, None if it does not
+
+    Returns:
+        The verdict returned by evaluate().
+    """
+    memo = cache.namespace(MEMO_NAMESPACE, max_entries=MEMO_SIZE)
+    return memo.get_or_create((rule_id, args, fingerprint, snapshot_digest), evaluate)
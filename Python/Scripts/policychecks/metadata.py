@@ -0,0 +1,64 @@
+###
+### Database metadata shared by the scripts
+###
+### Product name, short name, version and default schema come from the JVM. They are resolved
+### once per run and kept in the run cache (see policychecks/cache.py), scripts call is_applicable()
+### before doing any work.
+###
+### Notes:
+### 1. Values that cannot be resolved (e.g., no connection) are None
+### 2. Short names are the Liquibase ones (e.g., mongodb, mysql, oracle, postgresql)
+###
+from collections import namedtuple
+import liquibase_database
+import liquibase_utilities
+from policychecks import cache
+
+###
+### Run cache namespace
+###
+METADATA_NAMESPACE = "database_metadata"
+
+Metadata = namedtuple("Metadata", "product_name short_name version default_schema")
+
+def _resolve(function):
+    """Returns the value as a string, None if it is not available."""
+    try:
+        value = function()
+    except Exception:
+        return None
+    return None if value is None else str(value)
+
+def _read_metadata():
+    database = liquibase_utilities.get_database()
+    return Metadata(
+        _resolve(lambda: database.getDatabaseProductName()),
+        _resolve(lambda: liquibase_database.get_short_name(database)),
+        _resolve(lambda: database.getDatabaseProductVersion()),
+        _resolve(lambda: liquibase_database.get_default_schema_name(database)),
+    )
+
+def get_metadata():
+    """Returns the Metadata of the current database, resolving it once per run."""
+    return cache.namespace(METADATA_NAMESPACE, max_entries=1).get_or_create("metadata", _read_metadata)
+
+def is_applicable(short_names=None, product_name=None, version_prefix=None):
+    """
+    Returns True if a rule applies to the current database.
+
+    Args:
+        short_names: Short names the rule supports (e.g., patterns.NOSQL_DATABASES), any if None
+        product_name: Product name the rule supports (e.g., MySQL), any if None
+        version_prefix: Versions the rule supports (e.g., 8.0), any if None
+
+    Returns:
+        True if every given condition matches.
+    """
+    metadata = get_metadata()
+    if short_names is not None and (metadata.short_name or "").casefold() not in short_names:
+        return False
+    if product_name is not None and metadata.product_name != product_name:
+        return False
+    if version_prefix is not None and not (metadata.version or "").startswith(version_prefix):
+        return False
+    return True
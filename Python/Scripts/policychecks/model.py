@@ -0,0 +1,193 @@
+###
+### Compact model of the snapshot tables and columns
+###
+### The JSON snapshot keeps every object as nested dictionaries, e.g.
+###   column["column"]["type"]["columnSize"] == "255!{java.lang.Integer}"
+### The model keeps only the fields the scripts use, in __slots__ classes with interned names
+### and parsed sizes. It is built once per run and shared through the run cache.
+###
+### Notes:
+### 1. Names are looked up exactly first, then case-insensitively
+### 2. Use get_model() in scripts, build() is only needed for snapshots from other sources
+### 3. With SNAPSHOT_FILE and SNAPSHOT_INDEX_DIR the model is persisted between runs, see policychecks/snapshot_index.py
+###
+import sys
+import liquibase_utilities
+from policychecks import cache, snapshot
+
+###
+### Run cache namespace, one model per snapshot file
+###
+MODEL_NAMESPACE = "snapshot_model"
+MODEL_CACHE_SIZE = 4
+
+class Column:
+    """A snapshot column."""
+    __slots__ = ("name", "table", "type_name", "size", "size_type", "nullable", "snapshot_id")
+
+    def __init__(self, name, table, type_name, size, size_type, nullable, snapshot_id):
+        self.name = name
+        self.table = table
+        self.type_name = type_name
+        self.size = size
+        self.size_type = size_type
+        self.nullable = nullable
+        self.snapshot_id = snapshot_id
+
+    def __repr__(self):
+        return f"Column({self.table.name if self.table else None}.{self.name} {self.type_name}({self.size}))"
+
+class Table:
+    """A snapshot table with its columns in table order."""
+    __slots__ = ("name", "schema", "tablespace", "index_count", "primary_key", "columns", "snapshot_id", "_columns_by_name")
+
+    def __init__(self, name, schema, tablespace, index_count, primary_key, snapshot_id):
+        self.name = name
+        self.schema = schema
+        self.tablespace = tablespace
+        self.index_count = index_count
+        self.primary_key = primary_key
+        self.columns = ()
+        self.snapshot_id = snapshot_id
+        self._columns_by_name = None
+
+    def column(self, name):
+        """Returns the column with the given name (exact, then case-insensitive) or None."""
+        if self._columns_by_name is None:
+            self._columns_by_name = _name_index(self.columns)
+        return _lookup(self._columns_by_name, name)
+
+    def __repr__(self):
+        return f"Table({self.name}, {len(self.columns)} columns)"
+
+class Model:
+    """Tables and columns of a snapshot, indexed by name and snapshot id."""
+    __slots__ = ("tables", "columns", "digest", "_tables_by_name", "_columns_by_id")
+
+    def __init__(self, tables, columns):
+        self.tables = tables
+        self.columns = columns
+        self.digest = None
+        self._tables_by_name = _name_index(tables)
+        self._columns_by_id = {column.snapshot_id: column for column in columns}
+
+    def table(self, name):
+        """Returns the table with the given name (exact, then case-insensitive) or None."""
+        return _lookup(self._tables_by_name, name)
+
+    def column_by_id(self, snapshot_id):
+        """Returns the column with the given snapshot id (or reference) or None."""
+        return self._columns_by_id.get(snapshot.reference_id(snapshot_id))
+
+    def table_column(self, table_name, column_name):
+        """Returns the column of a table (exact, then case-insensitive names) or None."""
+        table = self.table(table_name)
+        return table.column(column_name) if table is not None else None
+
+def _name_index(objects):
+    """Returns a dictionary of name and casefolded name to the first object with that name."""
+    index = {}
+    for named_object in objects:
+        index.setdefault(named_object.name, named_object)
+    for named_object in objects:
+        index.setdefault(("casefold", named_object.name.casefold()), named_object)
+    return index
+
+def _lookup(index, name):
+    found = index.get(name)
+    if found is None and name is not None:
+        found = index.get(("casefold", name.casefold()))
+    return found
+
+def parse_column_size(column_size):
+    """
+    Parses a snapshot column size.
+
+    Args:
+        column_size: Snapshot value, e.g. "255!{java.lang.Integer}" or 255
+
+    Returns:
+        (size, size type), e.g. (255, "java.lang.Integer"). Size is None if not numeric.
+    """
+    if column_size is None:
+        return None, None
+    value, _, size_type = str(column_size).partition("!")
+    size_type = size_type.strip("{}") or None
+    try:
+        return int(value), size_type
+    except ValueError:
+        return None, size_type
+
+def build(current_snapshot):
+    """
+    Builds the model from a snapshot dictionary.
+
+    Args:
+        current_snapshot: Snapshot dictionary (see policychecks/snapshot.py)
+
+    Returns:
+        A Model, empty if the snapshot has no tables.
+    """
+    intern = sys.intern
+    tables = []
+    tables_by_id = {}
+    for attributes in snapshot.objects(current_snapshot, "Table") or []:
+        table = Table(
+            intern(attributes["name"]),
+            snapshot.reference_id(attributes["schema"]) if attributes.get("schema") else None,
+            attributes.get("tablespace"),
+            len(attributes.get("indexes") or ()),
+            snapshot.reference_id(attributes["primaryKey"]) if attributes.get("primaryKey") else None,
+            attributes.get("snapshotId"),
+        )
+        tables.append(table)
+        tables_by_id[table.snapshot_id] = table
+    columns = []
+    columns_by_table = {}
+    for attributes in snapshot.objects(current_snapshot, "Column") or []:
+        table = tables_by_id.get(snapshot.reference_id(attributes.get("relation")))
+        data_type = attributes.get("type") or {}
+        size, size_type = parse_column_size(data_type.get("columnSize"))
+        type_name = data_type.get("typeName")
+        column = Column(
+            intern(attributes["name"]),
+            table,
+            intern(type_name) if type_name else None,
+            size,
+            intern(size_type) if size_type else None,
+            attributes.get("nullable"),
+            attributes.get("snapshotId"),
+        )
+        columns.append(column)
+        if table is not None:
+            columns_by_table.setdefault(table, []).append(column)
+    ###
+    ### Keep the table column order when the snapshot lists it
+    ###
+    columns_by_id = {column.snapshot_id: column for column in columns}
+    for attributes, table in zip(snapshot.objects(current_snapshot, "Table") or [], tables):
+        ordered = [columns_by_id.get(snapshot.reference_id(reference)) for reference in attributes.get("columns") or ()]
+        ordered = [column for column in ordered if column is not None]
+        table.columns = tuple(ordered or columns_by_table.get(table, ()))
+        for column in table.columns:
+            if column.table is None:
+                column.table = table
+    return Model(tuple(tables), tuple(columns))
+
+def get_model():
+    """Returns the model of the current snapshot, building it once per run."""
+    models = cache.namespace(MODEL_NAMESPACE, max_entries=MODEL_CACHE_SIZE)
+    cache_key = liquibase_utilities.get_arg("SNAPSHOT_FILE") or ""
+    model = models.get(cache_key)
+    if model is None:
+        snapshot_path = liquibase_utilities.get_arg("SNAPSHOT_FILE")
+        index_dir = liquibase_utilities.get_arg("SNAPSHOT_INDEX_DIR")
+        if snapshot_path and index_dir:
+            from policychecks import snapshot_index
+            model, digest, from_index = snapshot_index.load(snapshot_path, index_dir, lambda: build(snapshot.load(["Table", "Column"])))
+            model.digest = digest
+            liquibase_utilities.get_logger().info(f"Snapshot model {'read from' if from_index else 'written to'} index {digest}")
+        else:
+            model = build(snapshot.load(["Table", "Column"]))
+        models.put(cache_key, model)
+    return model
@@ -0,0 +1,332 @@
+###
+### Mongo shell parser shared by the MongoDB scripts
+###
+### Mongo changes are tokenized once, in a single pass, into a list of operations:
+###   db.createCollection('name', {validator: {$jsonSchema: {...}}})
+###   db.runCommand({collMod: 'name', validator: {...}})
+###   db.name.createIndex({...}, {name: '...'}), db.getCollection('name').drop(), ...
+### Arguments are parsed into Python values (dict, list, str, int, float, bool, None).
+### Function calls such as ISODate("...") or new Date() become Call tuples.
+###
+### Notes:
+### 1. Only literal arguments are evaluated, variables and expressions are kept as Expression tuples
+### 2. Results are memoized by text in the run cache (see policychecks/cache.py), all Mongo scripts
+###    checking a change share one parse
+###
+import re
+from collections import namedtuple
+from policychecks import cache
+
+###
+### Operation found in a change
+### method: shell method or command name (e.g., createCollection, collMod, createIndex)
+### collection: collection name or None, args: parsed arguments
+### start/end: offsets of the call in the text, line: line number of the call
+###
+Operation = namedtuple("Operation", "method collection args start end line")
+
+###
+### Parsed values that are not literals
+###
+Call = namedtuple("Call", "name args")
+Expression = namedtuple("Expression", "text")
+
+###
+### Tokens: whitespace and comments are skipped, anything unknown is kept as a single character
+###
+TOKEN_PATTERN = re.compile(r"""
+     (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+    |(?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)
+    |(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    |(?P<name>[A-Za-z_$][\w$]*)
+    |(?P<punct>[{}\[\]().,:;])
+    |(?P<other>.)
+""", re.VERBOSE | re.DOTALL)
+ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "0": "\0"}
+LITERALS = {"true": True, "false": False, "null": None, "undefined": None}
+CLOSING = {"{": "}", "[": "]", "(": ")"}
+
+###
+### Operations that define a collection (and may carry a validator)
+###
+COLLECTION_DEFINITIONS = frozenset(["createcollection", "collmod", "create"])
+
+###
+### Parsed texts, bounded so long runs do not keep every change
+###
+PARSE_CACHE_SIZE = 256
+PARSED_NAMESPACE = "mongo_parsed"
+INDEXED_NAMESPACE = "mongo_indexed"
+
+def tokenize(text):
+    """Returns a list of (kind, value, offset) tokens, comments and whitespace removed."""
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind != "skip":
+            tokens.append((kind, match.group(), match.start()))
+    return tokens
+
+def _unescape(value):
+    return ESCAPE_PATTERN.sub(lambda match: ESCAPES.get(match.group(1), match.group(1)), value[1:-1])
+
+def _number(value):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+class _Parser:
+    """Recursive descent parser over the token list."""
+
+    def __init__(self, text, tokens):
+        self.text = text
+        self.tokens = tokens
+        self.index = 0
+        self.line_offset = 0
+        self.line = 1
+
+    def peek(self, offset=0):
+        index = self.index + offset
+        if 0 <= index < len(self.tokens):
+            return self.tokens[index]
+        return (None, None, len(self.text))
+
+    def accept(self, value):
+        if self.peek()[1] == value:
+            self.index += 1
+            return True
+        return False
+
+    def line_at(self, offset):
+        """Returns the line number of an offset, offsets must not decrease between calls."""
+        if offset > self.line_offset:
+            self.line += self.text.count("\n", self.line_offset, offset)
+            self.line_offset = offset
+        return self.line
+
+    def skip_group(self):
+        """Skips past the bracket matching the one just consumed."""
+        depth = 1
+        while depth > 0 and self.index < len(self.tokens):
+            value = self.tokens[self.index][1]
+            if value in CLOSING:
+                depth += 1
+            elif value in ("}", "]", ")"):
+                depth -= 1
+            self.index += 1
+
+    def skip_value(self, stop):
+        """Skips an unsupported expression up to a separator, returns it as an Expression."""
+        start = self.peek()[2]
+        while self.index < len(self.tokens):
+            value = self.tokens[self.index][1]
+            if value in stop:
+                break
+            self.index += 1
+            if value in CLOSING:
+                self.skip_group()
+        return Expression(self.text[start:self.peek()[2]].strip())
+
+    def value(self, stop=(",", ")", "]", "}")):
+        """Parses one argument or property value."""
+        kind, token, offset = self.peek()
+        if token == "{":
+            self.index += 1
+            result = self.object()
+        elif token == "[":
+            self.index += 1
+            result = self.array()
+        elif kind == "string":
+            self.index += 1
+            result = _unescape(token)
+        elif kind == "number":
+            self.index += 1
+            result = _number(token)
+        elif token == "-" and self.peek(1)[0] == "number":
+            self.index += 2
+            result = -_number(self.peek(-1)[1])
+        elif kind == "name" and token in LITERALS:
+            self.index += 1
+            result = LITERALS[token]
+        elif token == "new" and self.peek(1)[0] == "name":
+            self.index += 2
+            name = "new " + self.peek(-1)[1]
+            result = Call(name, self.arguments() if self.accept("(") else [])
+        elif kind == "name" and self.peek(1)[1] == "(":
+            self.index += 2
+            result = Call(token, self.arguments())
+        else:
+            return self.skip_value(stop)
+        if self.index < len(self.tokens) and self.peek()[1] not in stop:
+            ###
+            ### Not a literal after all (e.g., "a" + b), keep the whole expression
+            ###
+            self.skip_value(stop)
+            return Expression(self.text[offset:self.peek()[2]].strip())
+        return result
+
+    def object(self):
+        result = {}
+        while self.index < len(self.tokens) and not self.accept("}"):
+            kind, key, offset = self.peek()
+            if kind in ("name", "number"):
+                self.index += 1
+            elif kind == "string":
+                self.index += 1
+                key = _unescape(key)
+            else:
+                self.skip_value((",", "}"))
+                self.accept(",")
+                continue
+            if self.accept(":"):
+                result[key] = self.value((",", "}"))
+            else:
+                result[key] = Expression(key)
+            self.accept(",")
+        return result
+
+    def array(self):
+        result = []
+        while self.index < len(self.tokens) and not self.accept("]"):
+            if self.accept(","):
+                continue
+            result.append(self.value((",", "]")))
+        return result
+
+    def arguments(self):
+        result = []
+        while self.index < len(self.tokens) and not self.accept(")"):
+            if self.accept(","):
+                continue
+            result.append(self.value((",", ")")))
+        return result
+
+    def chain(self, operations):
+        """Parses db[.member|[name]|(args)]... and appends the calls made on it."""
+        start = self.peek()[2]
+        self.index += 1
+        collection = None
+        while True:
+            if self.accept("."):
+                kind, member, offset = self.peek()
+                if kind != "name":
+                    return
+                self.index += 1
+            elif self.peek()[1] == "[" and self.peek(1)[0] == "string" and self.peek(2)[1] == "]":
+                collection = _unescape(self.peek(1)[1])
+                self.index += 3
+                continue
+            else:
+                return
+            if not self.accept("("):
+                if collection is None:
+                    collection = member
+                continue
+            args = self.arguments()
+            end = self.peek(-1)[2] + 1
+            line = self.line_at(start)
+            if member == "getSiblingDB":
+                continue
+            if member == "getCollection" and args and isinstance(args[0], str):
+                collection = args[0]
+                continue
+            method = member
+            target = collection
+            if member in ("runCommand", "adminCommand") and args and isinstance(args[0], dict) and args[0]:
+                method, target = next(iter(args[0].items()))
+                target = target if isinstance(target, str) else None
+            elif member == "createCollection" and args and isinstance(args[0], str):
+                target = args[0]
+            operations.append(Operation(method, target, args, start, end, line))
+
+    def operations(self):
+        operations = []
+        while self.index < len(self.tokens):
+            kind, token, offset = self.peek()
+            if kind == "name" and token == "db" and self.peek(-1)[1] != ".":
+                self.chain(operations)
+            else:
+                self.index += 1
+        return operations
+
+def parse(text):
+    """
+    Parses Mongo shell text into operations.
+
+    Args:
+        text: Mongo shell commands (e.g., liquibase_utilities.generate_sql(change))
+
+    Returns:
+        A tuple of Operation tuples, in text order.
+    """
+    parsed = cache.namespace(PARSED_NAMESPACE, max_entries=PARSE_CACHE_SIZE)
+    return parsed.get_or_create(text, lambda: tuple(_Parser(text, tokenize(text)).operations()))
+
+def index(text):
+    """
+    Returns the operations of a text indexed by method.
+
+    Args:
+        text: Mongo shell commands
+
+    Returns:
+        Dictionary of casefolded method name (e.g., createindex, drop) to a tuple of Operation tuples.
+    """
+    namespace = cache.namespace(INDEXED_NAMESPACE, max_entries=PARSE_CACHE_SIZE)
+    indexed = namespace.get(text)
+    if indexed is None:
+        indexed = {}
+        for operation in parse(text):
+            indexed.setdefault(operation.method.casefold(), []).append(operation)
+        indexed = {method: tuple(operations) for method, operations in indexed.items()}
+        namespace.put(text, indexed)
+    return indexed
+
+def find_call(value, name):
+    """Returns True if a parsed value contains a call with the given name (e.g., new Date)."""
+    if isinstance(value, Call):
+        return value.name == name or any(find_call(arg, name) for arg in value.args)
+    if isinstance(value, dict):
+        return any(find_call(item, name) for item in value.values())
+    if isinstance(value, list):
+        return any(find_call(item, name) for item in value)
+    return False
+
+def get_ignore_case(document, key):
+    """Returns the value of a key of a document, matching the key case-insensitively (exact match first), None if not found."""
+    if not isinstance(document, dict):
+        return None
+    if key in document:
+        return document[key]
+    folded = key.casefold()
+    for name, value in document.items():
+        if isinstance(name, str) and name.casefold() == folded:
+            return value
+    return None
+
+def contains_ignore_case(values, name):
+    """Returns True if a parsed list contains a string equal to name, ignoring case."""
+    if not isinstance(values, list):
+        return False
+    folded = name.casefold()
+    return any(isinstance(value, str) and value.casefold() == folded for value in values)
+
+def is_collection_definition(operation):
+    """Returns True for createCollection and collMod/create commands."""
+    return operation.method.casefold() in COLLECTION_DEFINITIONS
+
+def validator(operation):
+    """Returns the validator document of an operation or None."""
+    for arg in operation.args:
+        if isinstance(arg, dict) and isinstance(arg.get("validator"), dict):
+            return arg["validator"]
+    return None
+
+def json_schema(operation):
+    """Returns the $jsonSchema document of an operation's validator or None."""
+    document = validator(operation)
+    if document is not None and isinstance(document.get("$jsonSchema"), dict):
+        return document["$jsonSchema"]
+    return None
@@ -0,0 +1,106 @@
+###
+### This script checks scans changesets that are referencing a specified key word, such as 'product' 
+### for any any createcollection or modcoll calls. If those functions are not present it exits. 
+### If those function calls exist it does check to ensure the data domain key
+### identifier is inclued in the required field section and properties section and then checks for 
+### additional 
+### 
+### The example code below is using Product data domain as an example and looking for
+### productID in properties and the bsonType is "string" and the MaxLength is set to 15
+###
+### This will fail is there is no validator, no required field section in the validator or
+### if a field called productID is not in the required fields.
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import metadata, mongo, patterns
+
+###
+### Functions
+###
+def max_length(property):
+    """Returns the maxLength of a schema property, the first value if given as a list."""
+    value = property.get("maxLength")
+    if isinstance(value, list) and len(value) > 0:
+        value = value[0]
+    if isinstance(value, mongo.Call) and len(value.args) > 0:
+        value = value.args[0]
+    return value
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Check for Mongo
+    ###
+    if not metadata.is_applicable(short_names=patterns.NOSQL_DATABASES):
+        liquibase_logger.info(f"Database {metadata.get_metadata().short_name} ignored")
+        liquibase_status.fired = False
+        return
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    err_cnt = 0
+    for change in changes:
+        ###
+        ### Retrieve sql as string
+        ###
+        raw_sql = liquibase_utilities.strip_comments(liquibase_utilities.generate_sql(change))
+
+        ###
+        ### Look for reference to 'product' related script if not present exit
+        ###
+        if "product" not in raw_sql:
+            continue
+
+        ###
+        ### Check createCollection and collMod validators (parsed once in policychecks/mongo.py)
+        ###
+        for operation in mongo.parse(raw_sql):
+            if not mongo.is_collection_definition(operation):
+                continue
+            schema = mongo.json_schema(operation) or {}
+            ###
+            ### properties and productID are matched case-insensitively (e.g., productId, ProductID)
+            ###
+            product_id = mongo.get_ignore_case(mongo.get_ignore_case(schema, "properties"), "productID")
+            ###
+            ### productID must be a string of at most 15 characters
+            ###
+            if not isinstance(product_id, dict):
+                problem = "no productID in properties"
+            elif product_id.get("bsonType") != "string":
+                problem = "productID bsonType is not \"string\""
+            elif max_length(product_id) != 15:
+                problem = "productID maxLength is not 15"
+            else:
+                continue
+            liquibase_logger.info(f"{problem} for {operation.method} of {operation.collection} (line {operation.line})")
+            err_cnt += 1
+            break
+
+    if err_cnt != 0:
+        liquibase_status.fired = True
+        liquibase_status.message = liquibase_utilities.get_script_message()
+        return
@@ -0,0 +1,175 @@
+###
+### This script checks collection validators against data domain rules
+###
+### Rules are read from a JSON (or YAML) file named by the RULES_FILE argument, e.g.
+###   {
+###     "product": {
+###       "keywords": ["product"],
+###       "required": ["productID"],
+###       "properties": {"productID": {"bsonType": "string", "minLength": 1, "maxLength": 15}}
+###     }
+###   }
+###
+### Notes:
+### 1. A domain applies to a createCollection or collMod call that mentions one of its keywords
+###    (case-insensitive), the domain name is used when no keywords are listed
+### 2. required: keys that must be listed in the validator required array
+### 3. properties: bsonType must match, minLength/maxLength must be set and within the bounds
+### 4. The rule file is loaded once per run, all domains are checked in one pass over the parsed validator
+### 5. YAML rule files require PyYAML in the Python virtual environment
+###
+
+###
+### Helpers come from Liquibase
+###
+import json
+import os
+import re
+import liquibase_utilities
+from policychecks import metadata, mongo, patterns
+
+###
+### Loaded rule tables, keyed by rule file path
+###
+_RULES = {}
+
+###
+### Functions
+###
+def load_rules(path):
+    """Returns the (rules, keyword pattern, keyword to domains) tuple for a rule file, loading it only once."""
+    rules = _RULES.get(path)
+    if rules is not None:
+        return rules
+    with open(path, "r") as file:
+        if os.path.splitext(path)[-1].lower() in (".yml", ".yaml"):
+            import yaml
+            domains = yaml.safe_load(file)
+        else:
+            domains = json.load(file)
+    keywords = {}
+    for domain, rule in domains.items():
+        for keyword in rule.get("keywords") or [domain]:
+            keywords.setdefault(keyword.casefold(), []).append(domain)
+    alternatives = "|".join(sorted((re.escape(keyword) for keyword in keywords), key=len, reverse=True))
+    keyword_pattern = patterns.get_pattern(alternatives, re.IGNORECASE) if alternatives else None
+    rules = (domains, keyword_pattern, keywords)
+    _RULES[path] = rules
+    return rules
+
+def find_rules_file(path):
+    """Returns the rule file path, relative paths are tried from the working and script directories."""
+    if os.path.isabs(path) or os.path.exists(path):
+        return path
+    return os.path.join(os.path.dirname(os.path.abspath(liquibase_utilities.get_script_path())), path)
+
+def bson_types(value):
+    """Returns the set of bsonType names of a schema or rule value."""
+    if isinstance(value, list):
+        return set(value)
+    return {value}
+
+def check_property(name, schema_property, rule_property):
+    """Returns a description of the first broken property rule or None."""
+    if not isinstance(schema_property, dict):
+        return f"property {name} is missing"
+    if "bsonType" in rule_property and not bson_types(schema_property.get("bsonType")) <= bson_types(rule_property["bsonType"]):
+        return f"property {name} bsonType must be {rule_property['bsonType']}"
+    for bound, sign in (("minLength", 1), ("maxLength", -1)):
+        if bound not in rule_property:
+            continue
+        value = schema_property.get(bound)
+        if isinstance(value, mongo.Call) and len(value.args) > 0:
+            value = value.args[0]
+        if not isinstance(value, (int, float)) or (value - rule_property[bound]) * sign < 0:
+            return f"property {name} {bound} must be at {'least' if sign > 0 else 'most'} {rule_property[bound]}"
+    return None
+
+def check_schema(schema, domain_names, domains):
+    """Returns (domain, issue) for the first domain rule the schema breaks or None."""
+    required = set(schema.get("required") or []) if isinstance(schema.get("required"), list) else set()
+    properties = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
+    for domain in domain_names:
+        rule = domains[domain]
+        for key in rule.get("required") or []:
+            if key not in required:
+                return domain, f"{key} is not required"
+        for name, rule_property in (rule.get("properties") or {}).items():
+            issue = check_property(name, properties.get(name), rule_property)
+            if issue is not None:
+                return domain, issue
+    return None
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Check for Mongo
+    ###
+    if not metadata.is_applicable(short_names=patterns.NOSQL_DATABASES):
+        liquibase_logger.info(f"Database {metadata.get_metadata().short_name} ignored")
+        liquibase_status.fired = False
+        return
+
+    ###
+    ### Retrieve rule table from check definition
+    ###
+    rules_file = liquibase_utilities.get_arg("RULES_FILE")
+    if not rules_file:
+        liquibase_logger.error("Missing RULES_FILE from check definition.")
+        return
+    try:
+        domains, keyword_pattern, keywords = load_rules(find_rules_file(rules_file))
+    except (OSError, ValueError, ImportError) as error:
+        liquibase_logger.error(f"Unable to load data domain rules from {rules_file}: {error}")
+        return
+    if keyword_pattern is None:
+        return
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### Retrieve sql as string, skip changes without any domain keyword
+        ###
+        raw_sql = liquibase_utilities.strip_comments(liquibase_utilities.generate_sql(change))
+        if keyword_pattern.search(raw_sql) is None:
+            continue
+        ###
+        ### Check createCollection and collMod validators against every domain they mention
+        ###
+        for operation in mongo.parse(raw_sql):
+            if not mongo.is_collection_definition(operation):
+                continue
+            domain_names = []
+            for keyword in keyword_pattern.findall(raw_sql, operation.start, operation.end):
+                domain_names.extend(domain for domain in keywords[keyword.casefold()] if domain not in domain_names)
+            if len(domain_names) == 0:
+                continue
+            violation = check_schema(mongo.json_schema(operation) or {}, domain_names, domains)
+            if violation is not None:
+                domain, issue = violation
+                liquibase_status.fired = True
+                status_message = str(liquibase_utilities.get_script_message()).replace("__COLLECTION_NAME__", f"\"{operation.collection}\"")
+                status_message = status_message.replace("__DOMAIN__", f"\"{domain}\"")
+                status_message = status_message.replace("__ISSUE__", f"{issue} (line {operation.line})")
+                liquibase_status.message = status_message
+                return
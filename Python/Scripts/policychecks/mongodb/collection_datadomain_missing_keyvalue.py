@@ -0,0 +1,84 @@
+###
+### This script checks scans changesets that are referencing a specified key word, such as 'product' 
+## for any any createcollection or modcoll calls. If those are not present it exits. 
+### If those function calls exist it does check to ensure the data domain key
+###  identifier is inclued in the required field section of the associated 
+### collection validator.
+### 
+### The example code below is using Product data domain as an example and looking for
+### productID
+###
+### This will fail is there is no validator, no required field section in the validator or
+### if a field called productID is not in the required fields. Keys and field names are matched
+### ignoring case, as in collection_data_attribute_standard_check.py.
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import metadata, mongo, patterns
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Check for Mongo
+    ###
+    if not metadata.is_applicable(short_names=patterns.NOSQL_DATABASES):
+        liquibase_logger.info(f"Database {metadata.get_metadata().short_name} ignored")
+        liquibase_status.fired = False
+        return
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    err_cnt = 0
+    for change in changes:
+        ###
+        ### Retrieve sql as string
+        ###
+        raw_sql = liquibase_utilities.strip_comments(liquibase_utilities.generate_sql(change))
+
+        ###
+        ### Look for reference to 'product' related script if not present exit
+        ###
+        if "product" not in raw_sql:
+            continue
+
+        ###
+        ### Check createCollection and collMod validators (parsed once in policychecks/mongo.py)
+        ###
+        for operation in mongo.parse(raw_sql):
+            if not mongo.is_collection_definition(operation):
+                continue
+            ###
+            ### If no required section or 'productID' is not a required field, report error
+            ###
+            required = mongo.get_ignore_case(mongo.json_schema(operation), "required")
+            if not mongo.contains_ignore_case(required, "productID"):
+                liquibase_logger.info(f"productID is not required by {operation.method} of {operation.collection} (line {operation.line})")
+                err_cnt += 1
+                break
+
+    if err_cnt != 0:
+        liquibase_status.fired = True
+        liquibase_status.message = liquibase_utilities.get_script_message()
+        return
@@ -0,0 +1,62 @@
+###
+### This script checks for camelCase collection names during createCollection
+###
+### Notes:
+### 1. Only basic createCollection statements are supported
+### 2. The convention can be changed with the COLLECTION argument (see policychecks/naming.py)
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import mongo, naming
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve convention from check definition, camelCase by default
+    ###
+    conventions = naming.load_conventions(liquibase_utilities.get_arg, {"collection": "camelCase"})
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### LoadData change types are not currently supported
+        ###
+        if "loaddatachange" in change.getClass().getSimpleName().lower():
+            continue
+        ###
+        ### Retrieve sql as string, check names of created collections
+        ###
+        raw_sql = liquibase_utilities.strip_comments(liquibase_utilities.generate_sql(change))
+        identifiers = []
+        for operation in mongo.parse(raw_sql):
+            if operation.method.casefold() == "createcollection" and operation.collection is not None:
+                identifiers.append(naming.Identifier("collection", operation.collection, None, None))
+        violation = naming.find_violation(identifiers, conventions)
+        if violation is not None:
+            identifier, convention = violation
+            liquibase_status.fired = True
+            status_message = "Collection name \"" + f"{identifier.name}" + "\" is NOT " + f"{convention.expected(identifier)}" + "."
+            liquibase_status.message = status_message
+            return
@@ -0,0 +1,54 @@
+###
+### This script checks for a validator when creating a new collection
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import metadata, mongo, patterns
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Check for Mongo
+    ###
+    if not metadata.is_applicable(short_names=patterns.NOSQL_DATABASES):
+        liquibase_logger.info(f"Database {metadata.get_metadata().short_name} ignored")
+        liquibase_status.fired = False
+        return
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### Retrieve sql as string, parse shell commands (shared with other Mongo checks)
+        ###
+        raw_sql = liquibase_utilities.strip_comments(liquibase_utilities.generate_sql(change))
+        ###
+        ### Look for createCollection without a validator
+        ###
+        for operation in mongo.parse(raw_sql):
+            if operation.method.casefold() == "createcollection" and mongo.validator(operation) is None:
+                liquibase_status.fired = True
+                liquibase_status.message = liquibase_utilities.get_script_message()
+                return
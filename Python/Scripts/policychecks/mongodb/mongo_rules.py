@@ -0,0 +1,193 @@
+###
+### This script evaluates the Regex/MongoDB rules natively in one scan of each change
+###
+### Rules (select with the RULES argument, all rules by default):
+###   mongoNoDropCollection, mongoNoDeleteMany, mongoNoUpdateMany, mongoNoMergeAggregation,
+###   mongoCrIndexNameStdChk, mongoNoDropIndex, mongoNoRenameCollection, mongoCreateIdxWarning,
+###   mongoCrCollectionValidatorChk, mongoUpdateOrInsertMustHaveTimestamp
+###
+### Notes:
+### 1. Changes are parsed once (policychecks/mongo.py) and operations are indexed by method,
+###    each rule only looks at the operations it is about
+### 2. The message reports the offending call and its line, see __RULE__, __CALL__ and __LINE__
+### 3. mongoCrIndexNameStdChk uses the INDEX_PREFIX argument, IDX- by default
+### 4. Repeated changes reuse the violations found the first time (see policychecks/memo.py)
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import memo, metadata, mongo, patterns, statements
+
+###
+### Functions
+###
+def methods(indexed, *names):
+    """Returns the operations for the given (casefolded) methods, in text order."""
+    found = []
+    for name in names:
+        found.extend(indexed.get(name, ()))
+    return sorted(found, key=lambda operation: operation.start) if len(names) > 1 else found
+
+def no_drop_collection(indexed, args):
+    return methods(indexed, "drop")
+
+def no_delete_many(indexed, args):
+    return methods(indexed, "deletemany")
+
+def no_update_many(indexed, args):
+    return methods(indexed, "updatemany")
+
+def no_merge_aggregation(indexed, args):
+    found = []
+    for operation in methods(indexed, "aggregate"):
+        pipeline = operation.args[0] if operation.args else None
+        if isinstance(pipeline, dict):
+            pipeline = pipeline.get("pipeline")
+        if isinstance(pipeline, list) and any(isinstance(stage, dict) and "$merge" in stage for stage in pipeline):
+            found.append(operation)
+    return found
+
+def index_name_standard(indexed, args):
+    found = []
+    for operation in methods(indexed, "createindex", "createindexes"):
+        if operation.method.casefold() == "createindex":
+            options = [operation.args[1] if len(operation.args) > 1 else None]
+        else:
+            options = operation.args[0].get("indexes") if operation.args and isinstance(operation.args[0], dict) else None
+            options = options if isinstance(options, list) else [None]
+        for option in options:
+            name = option.get("name") if isinstance(option, dict) else None
+            if not isinstance(name, str) or not name.startswith(args["INDEX_PREFIX"]):
+                found.append(operation)
+                break
+    return found
+
+def no_drop_index(indexed, args):
+    return methods(indexed, "dropindex", "dropindexes")
+
+def no_rename_collection(indexed, args):
+    return methods(indexed, "renamecollection")
+
+def create_index_warning(indexed, args):
+    return methods(indexed, "createindex", "createindexes", "ensureindex")
+
+def collection_validator(indexed, args):
+    return [operation for operation in methods(indexed, "createcollection") if mongo.validator(operation) is None]
+
+def timestamp_required(indexed, args):
+    found = []
+    for operation in methods(indexed, "insertone", "updateone", "updatemany"):
+        documents = operation.args[:1] if operation.method.casefold() == "insertone" else operation.args[1:2]
+        if not mongo.find_call(documents, "new Date"):
+            found.append(operation)
+    return found
+
+###
+### Rule name to (function, default message)
+###
+RULES = {
+    "mongoNoDropCollection": (no_drop_collection, "Error! DROP COLLECTION not allowed in MongoDB scripts."),
+    "mongoNoDeleteMany": (no_delete_many, "Error! deleteMany() not allowed in MongoDB scripts."),
+    "mongoNoUpdateMany": (no_update_many, "Error! updateMany() not allowed in MongoDB scripts."),
+    "mongoNoMergeAggregation": (no_merge_aggregation, "Error! $merge(aggregation) not allowed in MongoDB scripts."),
+    "mongoCrIndexNameStdChk": (index_name_standard, "The createIndex you are running in Mongo does not meet naming standards"),
+    "mongoNoDropIndex": (no_drop_index, "Error! dropIndex() not allowed in MongoDB scripts."),
+    "mongoNoRenameCollection": (no_rename_collection, "Error! renameCollection() not allowed in MongoDB scripts."),
+    "mongoCreateIdxWarning": (create_index_warning, "There is a Mongo create Index statement in your changelog"),
+    "mongoCrCollectionValidatorChk": (collection_validator, "Every createCollection statement must include a validator."),
+    "mongoUpdateOrInsertMustHaveTimestamp": (timestamp_required, "Error! updateOne, updateMany or insertOne statements must have a timestamp - use \"new Date()\"."),
+}
+RULE_NAMES = {name.casefold(): name for name in RULES}
+
+def select_rules(value):
+    """Returns the rule names selected by the RULES argument, all rules if not set."""
+    if not value:
+        return list(RULES)
+    selected = []
+    for name in str(value).split(","):
+        name = name.strip().casefold()
+        if name not in RULE_NAMES:
+            raise ValueError(f"Unknown Mongo rule \"{name}\".")
+        selected.append(RULE_NAMES[name])
+    return selected
+
+def describe(raw_sql, operation):
+    """Returns the source of an operation on one line, shortened for messages."""
+    source = " ".join(raw_sql[operation.start:operation.end].split())
+    return source if len(source) <= 100 else source[:97] + "..."
+
+def evaluate(raw_sql, rule_names, args):
+    """Returns the (rule name, default message, call, line) violations of a change."""
+    indexed = mongo.index(raw_sql)
+    if len(indexed) == 0:
+        return ()
+    violations = []
+    for rule_name in rule_names:
+        rule, default_message = RULES[rule_name]
+        for operation in rule(indexed, args):
+            violations.append((rule_name, default_message, describe(raw_sql, operation), operation.line))
+    return tuple(violations)
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Check for Mongo
+    ###
+    if not metadata.is_applicable(short_names=patterns.NOSQL_DATABASES):
+        liquibase_logger.info(f"Database {metadata.get_metadata().short_name} ignored")
+        liquibase_status.fired = False
+        return
+
+    ###
+    ### Retrieve rules and arguments from check definition
+    ###
+    try:
+        rule_names = select_rules(liquibase_utilities.get_arg("RULES"))
+    except ValueError as error:
+        liquibase_logger.error(str(error))
+        return
+    args = {"INDEX_PREFIX": liquibase_utilities.get_arg("INDEX_PREFIX") or "IDX-"}
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Evaluate every selected rule against the operation index of each change
+    ###
+    violations = []
+    memo_args = (tuple(rule_names), args["INDEX_PREFIX"])
+    for change in changes:
+        raw_sql = liquibase_utilities.strip_comments(liquibase_utilities.generate_sql(change))
+        violations.extend(memo.verdict("mongo_rules", memo_args, statements.fingerprint(raw_sql), lambda: evaluate(raw_sql, rule_names, args)))
+
+    ###
+    ### Report the first violation, log all of them
+    ###
+    for rule_name, default_message, call, line in violations:
+        liquibase_logger.info(f"{rule_name}: {call} (line {line})")
+    if len(violations) > 0:
+        rule_name, default_message, call, line = violations[0]
+        script_message = liquibase_utilities.get_script_message()
+        status_message = str(script_message) if script_message else f"{default_message} Call: __CALL__ (line __LINE__)"
+        status_message = status_message.replace("__RULE__", rule_name)
+        status_message = status_message.replace("__CALL__", call)
+        status_message = status_message.replace("__LINE__", str(line))
+        liquibase_status.fired = True
+        liquibase_status.message = status_message
@@ -0,0 +1,207 @@
+###
+### This script checks for PascalCase collection names during createCollection
+###
+### Notes:
+### 1. Only basic createCollection statements are supported
+
+###
+### Helpers come from Liquibase
+###
+###
+### This script requires the use of Python virtual environment documented here:
+### https://docs.liquibase.com/liquibase-pro/policy-checks/custom-policy-checks/python-virtual-environment.html
+###
+
+from liquibase_checks_python import liquibase_utilities as lb
+import re
+from policychecks import cache, naming, statements
+
+def extract_table_names(content, delimiter=None):
+    """Extract table names from CREATE TABLE content in SQL file."""
+    table_names = []
+
+    # Identifiers come from the shared naming engine
+    # Handles both [dbo].[TableName] and dbo.TableName formats
+    # Statements are split on ; and GO lines (see policychecks/statements.py)
+    for statement in statements.split(content, "mssql", delimiter):
+        for identifier in naming.extract_identifiers(statement.text):
+            if identifier.kind == "table":
+                table_names.append(identifier.name)
+
+    return table_names
+
+
+###
+### Run cache namespaces and size of the word split cache (see policychecks/cache.py)
+###
+MODEL_NAMESPACE = "table_name_is_PascalCase_model"
+SPLIT_NAMESPACE = "table_name_is_PascalCase_splits"
+SPLIT_CACHE_SIZE = 10000
+
+def get_language_model():
+    """
+    Returns the wordninja language model, loading it once per run.
+
+    The model is kept in the Liquibase run cache so later changesets
+    reuse it instead of reloading the word list.
+    """
+    models = cache.namespace(MODEL_NAMESPACE, max_entries=1)
+    model = models.get("wordninja")
+    if model is None:
+        # wordninja loads its language model on import, only import when needed
+        import wordninja
+        model = wordninja.DEFAULT_LANGUAGE_MODEL
+        models.put("wordninja", model)
+    return model
+
+
+def get_split_cache():
+    """Returns the bounded LRU of word splits kept in the run cache."""
+    return cache.namespace(SPLIT_NAMESPACE, max_entries=SPLIT_CACHE_SIZE)
+
+
+def find_dictionary_words_batch(identifiers):
+    """
+    Splits a list of identifiers into English dictionary words.
+
+    Results are memoized by identifier, only identifiers not seen before
+    in this run are passed to the language model.
+
+    Args:
+        identifiers: A list of mixed case strings (e.g., ["ToDoItem", "todoItem"])
+
+    Returns:
+        Dictionary of identifier to list of dictionary words.
+    """
+    split_cache = get_split_cache()
+    dictionary_words = {}
+    missing = []
+
+    for identifier in identifiers:
+        if identifier in dictionary_words:
+            continue
+        words = split_cache.get(identifier)
+        if words is None:
+            missing.append(identifier)
+            dictionary_words[identifier] = None
+        else:
+            dictionary_words[identifier] = words
+
+    if missing:
+        model = get_language_model()
+        for identifier in missing:
+            words = model.split(identifier)
+            dictionary_words[identifier] = words
+            split_cache.put(identifier, words)
+
+    return dictionary_words
+
+
+def find_dictionary_words(input_data):
+    """
+    Check which words are English dictionary words.
+    
+    Args:
+        input_data:A mixed case string (e.g., "ToDoItem" or "todoItem")
+        
+    Returns:
+        String: dictionary_words
+        
+    Examples:
+        wordninja.split("toDoitem")
+    """
+
+    return find_dictionary_words_batch([input_data])[input_data]
+
+
+def is_pascal_case(input_data):
+    """
+    Checks if a string is in Pascal Case.
+
+    A string is considered Pascal Case if it:
+    - First charater is upper case, all other characters lower case.
+    - Does not start with a number.
+
+    Args:
+        input_data: A list of strings to check.
+
+    Returns:
+        True if the string is in Pascal Case, False otherwise.
+    """
+
+    pascal_case_found = True
+
+    for word in input_data:
+
+        # print ("word :" + word)
+
+        if re.match(r"^[A-Z][a-z]*$", word):
+            pascal_case_found = pascal_case_found and True
+            # return True
+        else:
+            pascal_case_found = pascal_case_found and False
+
+        if word[0].isdigit():
+            # return False
+            pascal_case_found = pascal_case_found and False
+
+    return pascal_case_found
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    # liquibase_logger = liquibase_utilities.get_logger()
+    liquibase_logger = lb.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    # liquibase_status = liquibase_utilities.get_status()
+    liquibase_status = lb.get_status()
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    # changes = liquibase_utilities.get_changeset().getChanges()
+    changes = lb.get_changeset().getChanges()
+
+    ###
+    ### Collect table names from all changes
+    ###
+    table_names_list = []
+    for change in changes:
+        ###
+        ###
+        ### Split SQL into a list of strings to remove whitespace
+        ###
+        # sql_list = liquibase_utilities.generate_sql(change).split()
+        # print ("sql_list:" + str(sql_list))
+
+        ### 
+        ### Send the SQL to extract_table_names(string)
+        ###
+        # table_names_list = extract_table_names( liquibase_utilities.generate_sql(change) )
+        table_names_list.extend(extract_table_names( lb.generate_sql(change), statements.change_delimiter(change) ))
+    liquibase_logger.debug(f"Table names: {table_names_list}")
+
+    ###
+    ### Split all table names in one batch
+    ###
+    dictionary_words_all = find_dictionary_words_batch(table_names_list)
+
+    for table_name in table_names_list:
+
+        dictionary_words = dictionary_words_all[table_name]
+        isPascalCase = is_pascal_case(dictionary_words)
+        liquibase_logger.debug(f"Table name: {table_name}, dictionary words: {dictionary_words}, PascalCase: {isPascalCase}")
+
+        if not isPascalCase:
+            liquibase_status.fired = True
+            status_message = "Table name \"" + f"{table_name}" + "\" is NOT PascalCase."
+            liquibase_status.message = status_message
+            return
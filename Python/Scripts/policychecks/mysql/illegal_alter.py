@@ -0,0 +1,139 @@
+import re
+import liquibase_utilities
+from policychecks import metadata, model, statements
+
+#
+# This check addresses this MySQL 8.0 issue
+#
+# https://www.bytebase.com/blog/fault-in-schema-migration-outage/
+#
+# Every MODIFY clause of an ALTER TABLE statement is checked, e.g.
+# ALTER TABLE <table> MODIFY <column> VARCHAR(300), MODIFY COLUMN <column> VARCHAR(400)
+#
+
+#
+# Statement patterns
+#
+ALTER_TABLE = re.compile(r"^\s*alter\s+(?:online\s+|ignore\s+)*table\s+(?P<table>(?:`[^`]+`|[\w$]+)(?:\s*\.\s*(?:`[^`]+`|[\w$]+))?)\s+(?P<clauses>.*)$", re.IGNORECASE | re.DOTALL)
+MODIFY_VARCHAR = re.compile(r"^modify\s+(?:column\s+)?(?P<column>`[^`]+`|[\w$]+)\s+varchar\s*\(\s*(?P<size>\d+)\s*\)", re.IGNORECASE)
+
+def isMySQL8(logger):
+    #
+    # Product and version are resolved once per run (policychecks/metadata.py)
+    #
+    if not metadata.is_applicable(product_name="MySQL", version_prefix="8.0"):
+        database_metadata = metadata.get_metadata()
+        logger.info("Skipping " + str(database_metadata.product_name) + " version " + str(database_metadata.version))
+        return False
+    return True
+
+def unquote(name):
+    return name.strip().strip("`")
+
+def split_clauses(clauses):
+    #
+    # Split on commas outside of parentheses and quotes, in one pass
+    #
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    for index, character in enumerate(clauses):
+        if quote is not None:
+            if character == quote:
+                quote = None
+        elif character in "'\"`":
+            quote = character
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "," and depth == 0:
+            parts.append(clauses[start:index].strip())
+            start = index + 1
+    parts.append(clauses[start:].strip())
+    return parts
+
+def varchar_modifications(statement):
+    #
+    # Returns the table name and a list of (column name, new size) for each MODIFY ... VARCHAR(n) clause
+    #
+    match = ALTER_TABLE.match(statement)
+    if match is None:
+        return None, []
+    table_name = unquote(re.split(r"\s*\.\s*", match.group("table"))[-1])
+    modifications = []
+    for clause in split_clauses(match.group("clauses").rstrip().rstrip(";")):
+        modify = MODIFY_VARCHAR.match(clause)
+        if modify is not None:
+            modifications.append((unquote(modify.group("column")), int(modify.group("size"))))
+    return table_name, modifications
+
+###
+### main
+###
+def run():
+    #
+    # Get the logger handle
+    #
+    logger = liquibase_utilities.get_logger()
+
+    if not isMySQL8(logger):
+        status = liquibase_utilities.get_status()
+        status.fired = False
+        return
+
+    script_name = liquibase_utilities.get_script_path()
+    message = "The script name is '" + script_name + "'"
+    logger.info(message)
+
+    #
+    # Get the snapshot tables and columns (built once per run)
+    #
+    snapshot_model = model.get_model()
+
+    #
+    # Get the SQL
+    #
+    changes = liquibase_utilities.get_changeset().getChanges()
+    for change in changes:
+        sql = liquibase_utilities.generate_sql(change)
+        logger.info("Processing SQL " + sql)
+        #
+        # Split into statements, without comments (see policychecks/statements.py)
+        #
+        for statement in statements.of_change(change, "mysql"):
+            #
+            # Find the columns modified to VARCHAR
+            #
+            table_name, modifications = varchar_modifications(statement.code)
+            for column_name, mod_size in modifications:
+                #
+                # Check to see if the table and column exist and the data type is VARCHAR
+                #
+                column = snapshot_model.table_column(table_name, column_name)
+                if column is None or column.type_name != "VARCHAR" or column.size is None:
+                    continue
+
+                #
+                # Check the size
+                # If it is out of range then set the status.fired to True and create a message
+                #
+                col_size = column.size
+                if col_size < 256 and mod_size >= 256:
+                    status = liquibase_utilities.get_status()
+                    status.fired = True
+                    script_message = liquibase_utilities.get_script_message()
+                    if script_message:
+                        status.message = str(script_message)
+                        status.message = status.message.replace("<TABLE_NAME>",column.table.name)
+                        status.message = status.message.replace("<COLUMN_NAME>",column.name)
+                        status.message = status.message.replace("<OLD_SIZE>", str(col_size))
+                        status.message = status.message.replace("<NEW_SIZE>", str(mod_size))
+                        status.message = status.message.replace("<SQL>", sql)
+                    else:
+                        status.message = \
+                            "Column '" + column.table.name + "." + column.name + \
+                            "' has an illegal size modification from '" + str(col_size) + "' to '" + str(mod_size) + "' in SQL %n'" + \
+                            sql + "'"
+                    return
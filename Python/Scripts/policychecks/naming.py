@@ -0,0 +1,297 @@
+###
+### Naming convention engine shared by the naming checks
+###
+### Identifiers (tables, collections, primary keys, foreign keys, indexes) are extracted
+### once per statement and matched against convention rules.
+###
+### Conventions:
+### 1. Built-in styles: camelCase, PascalCase, UPPERCASE, lowercase, snake_case
+### 2. Templates: any value containing {table} or {parent}, e.g. PK_{table} or FK_{table}_{parent}.
+###    The identifier must include the expanded template.
+### 3. Regular expressions: values starting with re:, e.g. re:^IDX_
+###
+### Notes:
+### 1. Only basic CREATE/ALTER TABLE, CREATE INDEX and createCollection statements are supported
+### 2. Constraint names must be provided (not auto-generated)
+###
+import re
+from collections import namedtuple
+
+###
+### Identifier found in a statement
+### kind: table, collection, pk, fk or index
+### table: owning table (pk, fk, index), parent: referenced table (fk)
+###
+Identifier = namedtuple("Identifier", "kind name table parent")
+
+###
+### Identifier kinds and the check argument used to configure each one
+###
+KINDS = {
+    "table": "TABLE",
+    "collection": "COLLECTION",
+    "pk": "PK",
+    "fk": "FK",
+    "index": "INDEX",
+}
+
+###
+### Built-in styles
+###
+STYLES = {
+    "camelcase": re.compile(r"^(?=[a-zA-Z0-9]*[a-z])(?=[a-zA-Z0-9]*[A-Z])[a-zA-Z][a-zA-Z0-9]*$"),
+    "pascalcase": re.compile(r"^(?:[A-Z][a-z0-9]+)+$"),
+    "uppercase": re.compile(r"^[A-Z0-9_$#]*[A-Z][A-Z0-9_$#]*$"),
+    "lowercase": re.compile(r"^[a-z0-9_$#]*[a-z][a-z0-9_$#]*$"),
+    "snake_case": re.compile(r"^[a-z][a-z0-9]*(?:_[a-z0-9]+)*$"),
+}
+
+###
+### Tokens: string literals, (qualified) identifiers and punctuation
+###
+_PART = r'"[^"]*"|\[[^\]]*\]|`[^`]*`|[\w$#@]+'
+TOKEN_PATTERN = re.compile(rf"'(?:[^']|'')*'|(?:{_PART})(?:\s*\.\s*(?:{_PART}))*|[(),;]")
+PART_PATTERN = re.compile(_PART)
+
+###
+### Keywords allowed between CREATE and TABLE/INDEX
+###
+TABLE_MODIFIERS = {"or", "replace", "global", "local", "temporary", "temp", "transient", "volatile", "unlogged", "external", "multiset", "set"}
+INDEX_MODIFIERS = {"unique", "clustered", "nonclustered", "bitmap", "fulltext", "spatial", "or", "replace"}
+EXISTS_KEYWORDS = {"if", "not", "exists", "only", "concurrently"}
+
+###
+### Object name positions, for qualifiers(): keywords followed by an object name, the words allowed
+### between the keyword and the name, the keywords followed by a list of objects with aliases
+### (FROM a.t1 x, b.t2 y) and the words that follow an object but are not an alias
+###
+OBJECT_KEYWORDS = {"from", "join", "into", "update", "delete", "table", "view", "index", "sequence", "synonym", "procedure",
+                   "function", "package", "trigger", "type", "references", "execute", "exec", "call", "using", "on", "for"}
+OBJECT_MODIFIERS = {"if", "not", "exists", "only", "body", "lateral"}
+LIST_KEYWORDS = {"from", "join", "into", "update", "using"}
+NOT_ALIAS = {"where", "join", "inner", "left", "right", "full", "outer", "cross", "natural", "on", "using", "set",
+             "group", "order", "having", "union", "intersect", "minus", "except", "connect", "start", "values",
+             "select", "partition", "with", "for", "when", "then", "returning", "default", "log", "fetch", "limit"}
+
+###
+### Compiled conventions, kept for the life of the interpreter
+###
+_CONVENTIONS = {}
+
+class Convention:
+    """A naming convention for one kind of identifier."""
+    __slots__ = ("kind", "standard", "pattern", "template")
+
+    def __init__(self, kind, standard):
+        self.kind = kind
+        self.standard = standard
+        self.pattern = None
+        self.template = None
+        if standard.startswith("re:"):
+            self.pattern = re.compile(standard[3:])
+        elif "{" in standard:
+            self.template = standard
+        elif standard.casefold() in STYLES:
+            self.pattern = STYLES[standard.casefold()]
+        else:
+            raise ValueError(f"Unknown naming convention \"{standard}\" for {kind}.")
+
+    def expected(self, identifier):
+        """Returns the expected name (templates) or the convention itself."""
+        if self.template is not None:
+            return self.template.format(table=identifier.table or "", parent=identifier.parent or "")
+        return self.standard
+
+    def matches(self, identifier):
+        """Returns True if the identifier follows the convention."""
+        if self.template is not None:
+            return self.expected(identifier) in identifier.name
+        return self.pattern.search(identifier.name) is not None
+
+def convention(kind, standard):
+    """Returns a compiled convention, compiling it only once per interpreter."""
+    key = (kind, standard)
+    compiled = _CONVENTIONS.get(key)
+    if compiled is None:
+        compiled = Convention(kind, standard)
+        _CONVENTIONS[key] = compiled
+    return compiled
+
+def load_conventions(get_arg, defaults=None):
+    """
+    Returns a dictionary of kind to convention from check arguments.
+
+    Args:
+        get_arg: Function returning a check argument (e.g., liquibase_utilities.get_arg)
+        defaults: Dictionary of kind to standard used when the argument is not set
+
+    Returns:
+        Dictionary of kind to Convention, only for configured kinds.
+    """
+    conventions = {}
+    defaults = defaults or {}
+    for kind, arg_name in KINDS.items():
+        standard = get_arg(arg_name) or defaults.get(kind)
+        if standard:
+            conventions[kind] = convention(kind, str(standard).strip())
+    return conventions
+
+def unquote(token):
+    """Returns the last part of a (qualified) identifier without quotes or brackets."""
+    parts = PART_PATTERN.findall(token)
+    if len(parts) == 0:
+        return token
+    name = parts[-1]
+    if name[0] in "\"[`":
+        name = name[1:-1]
+    return name
+
+def tokenize(statement):
+    """Returns the list of tokens in a statement."""
+    return TOKEN_PATTERN.findall(statement)
+
+def qualifiers(statement):
+    """
+    Yields the qualifier parts (e.g., schema of schema.table) of the object names in a statement, without quotes.
+
+    Names in object positions are read (after FROM, JOIN, INTO, UPDATE, DELETE, TABLE, ON, FOR,
+    REFERENCES, EXECUTE, CALL, ...), so column references (alias.column, table.column) and numbers (1.5)
+    are not qualifiers. Aliases of FROM and JOIN lists are skipped, an ON after JOIN or MERGE is a join
+    condition. Elsewhere the first part of a name of three or more parts is a schema (schema.package.procedure).
+    """
+    tokens = tokenize(statement)
+    keywords = [token.casefold() for token in tokens]
+    found = []
+    read = set()
+    joined = False
+    for index, keyword in enumerate(keywords):
+        if keyword in ("join", "merge"):
+            joined = True
+        if keyword not in OBJECT_KEYWORDS or (keyword == "on" and joined):
+            continue
+        position = _skip(keywords, index + 1, OBJECT_MODIFIERS)
+        while position < len(tokens) and tokens[position][0] not in "'(),;":
+            found.extend(PART_PATTERN.findall(tokens[position])[:-1])
+            read.add(position)
+            position += 1
+            if keyword not in LIST_KEYWORDS:
+                break
+            ###
+            ### [AS] alias, then , and the next object of the list
+            ###
+            if position < len(tokens) and keywords[position] == "as":
+                position += 1
+            if position < len(tokens) and tokens[position][0] not in "'(),;" and keywords[position] not in NOT_ALIAS:
+                position += 1
+            if position >= len(tokens) or tokens[position] != ",":
+                break
+            position += 1
+    for position, token in enumerate(tokens):
+        if position not in read and token[0] != "'":
+            parts = PART_PATTERN.findall(token)
+            if len(parts) >= 3:
+                found.append(parts[0])
+    for part in found:
+        name = part[1:-1] if part[0] in "\"[`" else part
+        if not name.isdigit():
+            yield name
+
+def _skip(keywords, index, skip_words):
+    while index < len(keywords) and keywords[index] in skip_words:
+        index += 1
+    return index
+
+def _constraints(tokens, keywords, table_name, start):
+    """Yields named primary and foreign keys found after start."""
+    for index in range(start, len(keywords) - 2):
+        if keywords[index] != "constraint":
+            continue
+        name = unquote(tokens[index + 1])
+        if keywords[index + 2] == "primary":
+            yield Identifier("pk", name, table_name, None)
+        elif keywords[index + 2] == "foreign":
+            try:
+                reference = keywords.index("references", index + 2)
+                parent_name = unquote(tokens[reference + 1])
+            except (ValueError, IndexError):
+                continue
+            yield Identifier("fk", name, table_name, parent_name)
+
+def _collections(tokens, keywords):
+    """Yields collections created with createCollection('name')."""
+    for index in range(len(keywords) - 2):
+        if keywords[index].endswith("createcollection") and tokens[index + 1] == "(":
+            name = tokens[index + 2]
+            if name[0] in "'\"":
+                yield Identifier("collection", name[1:-1], None, None)
+
+def extract_identifiers(statement):
+    """
+    Extracts identifiers from a single statement.
+
+    Args:
+        statement: A single SQL statement or Mongo shell command
+
+    Returns:
+        A list of Identifier tuples, in statement order.
+    """
+    tokens = tokenize(statement)
+    keywords = [token.casefold() for token in tokens]
+    identifiers = []
+    if len(keywords) < 3:
+        return identifiers
+    try:
+        ###
+        ### CREATE [OR REPLACE] [TEMPORARY] TABLE [IF NOT EXISTS] NAME (...) [CONSTRAINT NAME PRIMARY|FOREIGN KEY ...]
+        ### ALTER TABLE [IF EXISTS] NAME ADD CONSTRAINT NAME PRIMARY|FOREIGN KEY ...
+        ###
+        if keywords[0] in ("create", "alter"):
+            index = _skip(keywords, 1, TABLE_MODIFIERS)
+            if keywords[index] == "table":
+                index = _skip(keywords, index + 1, EXISTS_KEYWORDS)
+                table_name = unquote(tokens[index])
+                if keywords[0] == "create":
+                    identifiers.append(Identifier("table", table_name, None, None))
+                identifiers.extend(_constraints(tokens, keywords, table_name, index + 1))
+                return identifiers
+        ###
+        ### CREATE [UNIQUE] INDEX [IF NOT EXISTS] NAME ON [SCHEMA.]TABLE (column1, column2, ...)
+        ###
+        if keywords[0] == "create":
+            index = _skip(keywords, 1, INDEX_MODIFIERS)
+            if keywords[index] == "index":
+                index = _skip(keywords, index + 1, EXISTS_KEYWORDS)
+                index_name = unquote(tokens[index])
+                table_name = unquote(tokens[keywords.index("on", index) + 1])
+                identifiers.append(Identifier("index", index_name, table_name, None))
+                return identifiers
+    except (IndexError, ValueError):
+        return identifiers
+    ###
+    ### db.createCollection('name', {...})
+    ###
+    identifiers.extend(_collections(tokens, keywords))
+    return identifiers
+
+def find_violation(identifiers, conventions):
+    """
+    Returns the first (identifier, convention) pair that breaks a convention.
+
+    Args:
+        identifiers: A list of Identifier tuples
+        conventions: Dictionary of kind to Convention
+
+    Returns:
+        (identifier, convention) or None if all identifiers follow the conventions.
+    """
+    for identifier in identifiers:
+        rule = conventions.get(identifier.kind)
+        if rule is not None and not rule.matches(identifier):
+            return identifier, rule
+    return None
+
+def check(convention, identifier):
+    """Returns (current name, expected name) if the identifier breaks the convention, otherwise None."""
+    if convention.matches(identifier):
+        return None
+    return identifier.name, convention.expected(identifier)
@@ -0,0 +1,203 @@
+###
+### Offline implementation of the Liquibase helper modules, used by the batch runner (policychecks/runner.py)
+###
+### Liquibase provides liquibase_utilities and liquibase_database to the scripts it runs. install()
+### registers this module under those names (and liquibase_checks_python.liquibase_utilities), so
+### the scripts run unchanged outside of Liquibase, against changesets read from changelog files.
+###
+### Notes:
+### 1. Only the helpers used by changelog scope scripts are provided, there is no database connection:
+###    query_for_list() returns an empty list and get_database_object() returns None
+### 2. generate_sql() returns the SQL of the changeset as written in the changelog
+### 3. strip_comments() uses policychecks/statements.py, sqlparse is only imported by split_statements() and tokenize()
+### 4. The run cache lives as long as the process, like the Liquibase cache lives as long as a run
+###
+import logging
+import sys
+import types
+
+###
+### Changesets and changes, with the Java method names the scripts call
+###
+class _ClassName:
+    def __init__(self, name):
+        self.name = name
+
+    def getSimpleName(self):
+        return self.name
+
+class Change:
+    """A change of an offline changeset, SQL as written in the changelog."""
+    def __init__(self, sql, end_delimiter=None, split_statements=True):
+        self.sql = sql
+        self.end_delimiter = end_delimiter
+        self.split_statements = split_statements
+
+    def getClass(self):
+        return _ClassName("RawSQLChange")
+
+    def getEndDelimiter(self):
+        return self.end_delimiter
+
+    def isSplitStatements(self):
+        return self.split_statements
+
+class ChangeSet:
+    """An offline changeset: file, id, author and its changes."""
+    def __init__(self, file_path, changeset_id, author, changes):
+        self.file_path = file_path
+        self.changeset_id = changeset_id
+        self.author = author
+        self.changes = changes
+
+    def getFilePath(self):
+        return self.file_path
+
+    def getId(self):
+        return self.changeset_id
+
+    def getAuthor(self):
+        return self.author
+
+    def getChanges(self):
+        return self.changes
+
+class Status:
+    """Status of a check for the current changeset."""
+    def __init__(self):
+        self.fired = False
+        self.message = None
+
+class Database:
+    """Database settings given to the runner, there is no connection."""
+    def __init__(self, short_name=None, product_name=None, product_version=None, default_schema=None):
+        self.short_name = short_name
+        self.product_name = product_name
+        self.product_version = product_version
+        self.default_schema = default_schema
+
+    def getShortName(self):
+        return self.short_name
+
+    def getDatabaseProductName(self):
+        return self.product_name
+
+    def getDatabaseProductVersion(self):
+        return self.product_version
+
+    def getDefaultSchemaName(self):
+        return self.default_schema
+
+class _Context:
+    """Current check and changeset of the process."""
+    def __init__(self):
+        self.database = Database()
+        self.changeset = None
+        self.script_path = None
+        self.script_message = None
+        self.args = {}
+        self.status = Status()
+        self.cache = {}
+        self.snapshot = None
+        self.snapshot_file = None
+
+_context = _Context()
+_logger = logging.getLogger("policychecks")
+
+###
+### Runner side
+###
+def configure(database=None, snapshot_file=None):
+    """Sets the database and snapshot file of the process."""
+    if database is not None:
+        _context.database = database
+    _context.snapshot_file = snapshot_file
+    _context.snapshot = None
+
+def start(changeset, script_path, script_message=None, args=None):
+    """Starts a check of a changeset, returns its Status."""
+    _context.changeset = changeset
+    _context.script_path = script_path
+    _context.script_message = script_message
+    _context.args = dict(args or {})
+    _context.status = Status()
+    return _context.status
+
+def install():
+    """Registers this module as liquibase_utilities and a database module as liquibase_database."""
+    module = sys.modules[__name__]
+    database_module = types.ModuleType("liquibase_database")
+    database_module.get_short_name = lambda database: database.getShortName() if database is not None else None
+    database_module.get_default_schema_name = lambda database: database.getDefaultSchemaName() if database is not None else None
+    package = types.ModuleType("liquibase_checks_python")
+    package.liquibase_utilities = module
+    package.liquibase_database = database_module
+    sys.modules["liquibase_utilities"] = module
+    sys.modules["liquibase_database"] = database_module
+    sys.modules["liquibase_checks_python"] = package
+    sys.modules["liquibase_checks_python.liquibase_utilities"] = module
+
+###
+### liquibase_utilities
+###
+def get_logger():
+    return _logger
+
+def get_status():
+    return _context.status
+
+def get_changeset():
+    return _context.changeset
+
+def get_database():
+    return _context.database
+
+def get_database_object():
+    return None
+
+def get_script_path():
+    return _context.script_path
+
+def get_script_message():
+    return _context.script_message
+
+def get_arg(name):
+    return _context.args.get(name)
+
+def get_cache(key, default):
+    return _context.cache.get(key, default)
+
+def put_cache(key, value):
+    _context.cache[key] = value
+
+def get_snapshot():
+    """Returns the snapshot file read as a whole (see policychecks/snapshot.py for streaming), None without one."""
+    if _context.snapshot is None and _context.snapshot_file:
+        from policychecks import snapshot
+        _context.snapshot = snapshot.read(_context.snapshot_file)
+    return _context.snapshot
+
+def generate_sql(change):
+    return change.sql
+
+def strip_comments(sql):
+    from policychecks import statements
+    return statements.strip_comments(sql, _context.database.getShortName())
+
+def split_statements(sql):
+    import sqlparse
+    return [statement for statement in sqlparse.split(sql) if statement.strip()]
+
+def tokenize(sql):
+    import sqlparse
+    parsed = sqlparse.parse(sql)
+    return parsed[0].tokens if parsed else []
+
+def query_for_list(sql, *args):
+    return []
+
+def is_table(database_object):
+    return False
+
+def is_column(database_object):
+    return False
@@ -0,0 +1,89 @@
+###
+### This script ensures only changes using current schema are allowed
+###
+### Notes:
+### 1. Only checks for schemas available in snapshot
+### 2. Schema qualified object names (e.g., other_schema.table, "OTHER"."TABLE", other_schema.package.procedure)
+###    are checked, column references (alias.column, table.column) and numbers are not (see naming.qualifiers)
+###
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import cache, metadata, naming, snapshot, statements
+
+###
+### Functions
+###
+def other_schemas(current_schema):
+    """Returns the casefolded names of the snapshot schemas other than the current one, None if schema data is missing."""
+    other_schema_names = cache.namespace("current_schema_only", max_entries=8)
+    schema_names = other_schema_names.get(current_schema)
+    if schema_names is None:
+        schemas = snapshot.objects(snapshot.load(["Schema"]), "Schema")
+        if schemas is None:
+            return None
+        current_name = (current_schema or "").casefold()
+        schema_names = frozenset(schema["name"].casefold() for schema in schemas if schema["name"].casefold() != current_name)
+        other_schema_names.put(current_schema, schema_names)
+    return schema_names
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve current schema name and the other schemas from snapshot (once per run)
+    ###
+    current_schema = metadata.get_metadata().default_schema
+    schema_names = other_schemas(current_schema)
+
+    ###
+    ### Exit if schema data is missing
+    ###
+    if schema_names is None:
+        liquibase_status.fired = False
+        liquibase_logger.warning("Schema data missing from snapshot. Check skipped.")
+        return
+
+    ###
+    ### Retrieve all changes in changeset
+    ###
+    changes = liquibase_utilities.get_changeset().getChanges()
+
+    ###
+    ### Loop through all changes
+    ###
+    for change in changes:
+        ###
+        ### LoadData change types are not currently supported
+        ###
+        if "loaddatachange" in change.getClass().getSimpleName().lower():
+            liquibase_logger.info("LoadData change type not supported. Statement skipped.")
+            continue
+        ###
+        ### Split sql into statements, without comments (see policychecks/statements.py)
+        ###
+        for statement in statements.of_change(change, "oracle"):
+            raw_statement = statement.code
+            ###
+            ### Check schema qualifiers against the other schemas from snapshot
+            ###
+            for qualifier in naming.qualifiers(raw_statement):
+                if qualifier.casefold() in schema_names:
+                    liquibase_status.fired = True
+                    status_message = str(liquibase_utilities.get_script_message()).replace("__SCHEMA_NAME__", f"\"{current_schema}\"")
+                    liquibase_status.message = status_message
+                    return
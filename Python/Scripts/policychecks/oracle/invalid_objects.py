@@ -0,0 +1,64 @@
+###
+### This script reports database objects with an INVALID status (e.g., packages that fail to compile)
+###
+### Notes:
+### 1. Scope is database, the script is called once for each database object
+### 2. USER_OBJECTS is queried once per run, the invalid objects are kept in the run cache by schema and name
+###
+### % liquibase checks customize --check-name=CustomCheckTemplate
+### Short name:         InvalidCompiles
+### Severity:           0-4
+### Script description: List all objects
+### Script scope:       database
+### Script message:     <empty>
+### Script type:        python
+### Script path:        Scripts/invalid_objects.py
+### Script_Args:        <empty>
+### Requires snapshot:  false
+### % liquibase checks run --checks-scope=database
+
+###
+### Helpers come from Liquibase
+###
+import liquibase_utilities
+from policychecks import batch
+
+###
+### Functions
+###
+def query_invalid_objects():
+    """Returns a dictionary of (schema name, object name) to object type for all INVALID objects."""
+    sql = """
+        SELECT USER AS owner, object_type, object_name, status, created
+        FROM user_objects
+        WHERE status = 'INVALID'
+        ORDER BY object_type, object_name
+    """
+    rows = liquibase_utilities.query_for_list(sql, None, None)
+    results = {}
+    for row in rows or []:
+        results[(str(row.get("OWNER")), str(row.get("OBJECT_NAME")))] = str(row.get("OBJECT_TYPE"))
+    return results
+
+###
+### main
+###
+def run():
+    logger = liquibase_utilities.get_logger()
+    status = liquibase_utilities.get_status()
+
+    ###
+    ### First invocation runs the query once, later invocations look up their own object
+    ###
+    invalid_objects = batch.verdicts("invalid_objects", query_invalid_objects)
+
+    ###
+    ### Only fire for the current database object if it's in the invalid list
+    ###
+    database_object = liquibase_utilities.get_database_object()
+    current_name = database_object.getName()
+    object_type = invalid_objects.get((batch.schema_name(database_object), current_name))
+    if object_type is not None:
+        status.fired = True
+        status.message = ( object_type + " '" + current_name + "' has INVALID status" )
+        return
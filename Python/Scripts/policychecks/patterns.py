@@ -0,0 +1,40 @@
+###
+### Compiled regular expressions and lookup tables shared by the scripts
+###
+### Notes:
+### 1. Scripts are re-executed for every changeset, this module is imported once per interpreter
+### 2. Patterns built from check arguments should use get_pattern() so they are compiled only once
+###
+import re
+
+###
+### Patterns compiled by get_pattern(), keyed by (pattern, flags)
+###
+_COMPILED = {}
+
+def get_pattern(pattern, flags=0):
+    """Returns a compiled regular expression, compiling it only once per interpreter."""
+    key = (pattern, flags)
+    compiled = _COMPILED.get(key)
+    if compiled is None:
+        compiled = re.compile(pattern, flags)
+        _COMPILED[key] = compiled
+    return compiled
+
+###
+### Lookup tables
+###
+NOSQL_DATABASES = frozenset(["mongodb"])
+
+###
+### Db2 z/OS tablespace database name and buffer pool
+###
+DB2_TABLESPACE_DATABASE = re.compile(r"(?is)CREATE\s+TABLESPACE\s+\w+\s+IN\s+(\w+)")
+DB2_BUFFERPOOL = re.compile(r"(?is)BUFFERPOOL\s+(\S+)")
+
+###
+### Raw PII in data fixes
+### PAN: 13-19 digits, adjust pattern if needed for dashes/spaces
+###
+PII_SSN = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
+PII_PAN = re.compile(r"\b(?:\d[ -]*?){13,19}\b")
@@ -0,0 +1,63 @@
+###
+### This script ensures all primary key names have the pattern tablename_pkey.
+### Sakila database
+###
+
+###
+### Script helper comes from jar
+###
+import liquibase_utilities
+from policychecks import batch, naming
+
+###
+### main
+###
+def run():
+    ###
+    ### Retrieve log handler
+    ### Ex. liquibase_logger.info(message)
+    ###
+    liquibase_logger = liquibase_utilities.get_logger()
+
+    ###
+    ### Retrieve status handler
+    ###
+    liquibase_status = liquibase_utilities.get_status()
+
+    ###
+    ### Retrieve database object
+    ###
+    database_object = liquibase_utilities.get_database_object()
+
+    ###
+    ### Skip if not a table
+    ###
+    if "table" not in database_object.getObjectTypeName().lower():
+        return
+    table_name = database_object.getName()
+    pk_convention = naming.convention("pk", "{table}_" + liquibase_utilities.get_arg("STANDARD"))
+
+    ###
+    ### All tables in the snapshot are evaluated on the first call, look up this table
+    ###
+    results = batch.verdicts(f"pk_names_pg_verdicts:{pk_convention.standard}", lambda: batch.primary_key_verdicts(pk_convention))
+    table_key = (batch.schema_name(database_object), table_name)
+    if table_key in results:
+        verdict = results[table_key]
+    else:
+        pk_object = database_object.getPrimaryKey()
+        ###
+        ### Skip if table doesn't have PK
+        ###
+        if pk_object == None:
+            return
+        pk_identifier = naming.Identifier("pk", pk_object.getName(), table_name, None)
+        liquibase_logger.debug(f"Standard: {pk_convention.expected(pk_identifier)} Current: {pk_identifier.name}")
+        verdict = naming.check(pk_convention, pk_identifier)
+    if verdict is not None:
+        pk_name_current, pk_name_standard = verdict
+        liquibase_status.fired = True
+        status_message = str(liquibase_utilities.get_script_message()).replace("__CURRENT_NAME__", f"\"{pk_name_current}\"")
+        status_message = status_message.replace("__NAME_STANDARD__", f"\"{pk_name_standard}\"")
+        liquibase_status.message = status_message
+        return
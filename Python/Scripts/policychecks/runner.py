@@ -0,0 +1,575 @@
+###
+### Offline batch runner
+###
+### Runs changelog scope checks against formatted SQL changelogs without Liquibase, spreading the
+### changesets over a pool of processes:
+###   python Scripts/policychecks/runner.py --checks checks.json [--snapshot snapshot.json] changelog.sql ...
+###
+### The checks file is a JSON list, one entry per check:
+###   {"name": "NoDeleteWithoutWhere", "script": "Any/delete_without_where.py", "severity": 2,
+###    "message": "DELETE without WHERE", "args": {}, "ordered": false}
+###   script    path relative to the Scripts folder
+###   severity  0 (INFO) to 4 (BLOCKER), or the severity name
+###   ordered   the check keeps state from one changeset to the next (e.g., CreateIndexCount), its
+###             changesets are checked in changelog order by a single process
+###
+### The snapshot tables and columns are written once to a snapshot index file (see
+### policychecks/snapshot_index.py) in --snapshot-index-dir or a temporary folder. Every process maps
+### the same index file instead of reading the JSON snapshot, so the pages are shared by the processes.
+###
+### Results are sorted by changelog order and check order before they are written, so the report does
+### not depend on the number of processes. The report ends with the hits, misses and evictions of each
+### cache namespace (see policychecks/cache.py), summed over the processes. The exit code is the highest severity of the fired checks
+### (as for liquibase checks run), at least 1 when a script failed.
+###
+### Sharding across CI nodes (every node reads the same changelogs and checks file):
+###   runner.py --shard 2/4 [--shard-by changeset|check] [--timings timings.json] ... changelog.sql
+###   runner.py merge policychecks-shard-*.json [--output results.json] [--record-timings timings.json]
+###   --shard      runs shard INDEX/COUNT of the changesets (or checks), assigned by a stable hash of the
+###                changeset key (file::id::author) or check name. Ordered checks are assigned whole
+###   --timings    assigns by cost instead: the units with the highest recorded time go first to the
+###                least loaded shard. Units without a recorded time cost the average
+###   merge        checks that every shard of the run is present, merges their results in changelog
+###                order and returns the exit code of the whole run. --record-timings writes the
+###                timings of all shards for the next run
+### Each shard writes its report to --output or policychecks-shard-INDEX-of-COUNT.json.
+###
+### Notes:
+### 1. Only formatted SQL changelogs are read (--changeset author:id, endDelimiter and splitStatements
+###    attributes), other SQL files are one changeset each. XML, YAML and JSON changelogs are not parsed
+### 2. There is no database connection, checks that use database objects (database scope) do not fire
+###    and database queries return no rows (e.g., CheckBufferPool reports the default buffer pool as
+###    not found, leave such checks out of the checks file). Use --database to set the database short
+###    name (e.g., oracle)
+###
+import argparse
+import hashlib
+import heapq
+import json
+import logging
+import math
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+if __package__ in (None, ""):
+    ###
+    ### Called as a script, the policychecks folder is imported from the Scripts folder
+    ###
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from policychecks import offline
+
+###
+### Liquibase check severities
+###
+SEVERITIES = {"INFO": 0, "MINOR": 1, "MAJOR": 2, "CRITICAL": 3, "BLOCKER": 4}
+SEVERITY_NAMES = {value: key for key, value in SEVERITIES.items()}
+ERROR_EXIT_CODE = 1
+
+###
+### Scripts keeping state from one changeset to the next, checked in changelog order
+###
+ORDERED_SCRIPTS = {"create_index_count.py"}
+
+###
+### Formatted SQL
+###
+CHANGESET_PATTERN = re.compile(r"^\s*--\s*changeset\s+(?:\"([^\"]*)\"|([^:\s]+)):(?:\"([^\"]*)\"|(\S+))(.*)$", re.IGNORECASE)
+ATTRIBUTE_PATTERN = re.compile(r"(\w+):(?:\"([^\"]*)\"|(\S+))")
+ROLLBACK_PATTERN = re.compile(r"^\s*--\s*rollback\b", re.IGNORECASE)
+HEADER_PATTERN = re.compile(r"^\s*--\s*liquibase\s+formatted\s+sql", re.IGNORECASE)
+SQL_EXTENSIONS = (".sql",)
+
+###
+### Shard units: changesets (and ordered checks) or checks
+###
+SHARD_BY_CHANGESET = "changeset"
+SHARD_BY_CHECK = "check"
+
+###
+### Changesets per task: about TASKS_PER_WORKER tasks for each process
+###
+TASKS_PER_WORKER = 4
+
+###
+### Process state, set by _initialize()
+###
+_checks = []
+
+def read_changelog(path):
+    """
+    Reads the changesets of a SQL changelog.
+
+    Args:
+        path: Changelog file
+
+    Returns:
+        A list of offline.ChangeSet, in changelog order.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    if not lines or not HEADER_PATTERN.match(lines[0]):
+        return [offline.ChangeSet(path, os.path.basename(path), "", [offline.Change("\n".join(lines))])]
+    changesets = []
+    header = None
+    body = []
+    def finish():
+        if header is None:
+            return
+        author, changeset_id, attributes = header
+        end_delimiter = attributes.get("enddelimiter")
+        split = attributes.get("splitstatements", "true").lower() != "false"
+        changesets.append(offline.ChangeSet(path, changeset_id, author, [offline.Change("\n".join(body).strip(), end_delimiter, split)]))
+    for line in lines[1:]:
+        match = CHANGESET_PATTERN.match(line)
+        if match:
+            finish()
+            attributes = {name.lower(): quoted if quoted is not None else value for name, quoted, value in ATTRIBUTE_PATTERN.findall(match.group(5))}
+            header = (match.group(1) or match.group(2), match.group(3) or match.group(4), attributes)
+            body = []
+        elif header is not None and not ROLLBACK_PATTERN.match(line):
+            body.append(line)
+    finish()
+    return changesets
+
+def read_checks(path, scripts_path):
+    """
+    Reads the checks file.
+
+    Args:
+        path: JSON checks file (see the top of this file)
+        scripts_path: Scripts folder
+
+    Returns:
+        A list of check dictionaries with name, script (absolute path), severity (0 to 4), message, args and ordered.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        entries = json.load(file)
+    checks = []
+    for entry in entries:
+        script = os.path.abspath(os.path.join(scripts_path, entry["script"]))
+        severity = entry.get("severity", 0)
+        if isinstance(severity, str):
+            severity = SEVERITIES[severity.upper()]
+        if severity not in SEVERITY_NAMES:
+            raise ValueError(f"Invalid severity {severity} for check {entry.get('name')}")
+        checks.append({
+            "name": entry.get("name") or os.path.splitext(os.path.basename(script))[0],
+            "script": script,
+            "severity": severity,
+            "message": entry.get("message"),
+            "args": dict(entry.get("args") or {}),
+            "ordered": entry.get("ordered", os.path.basename(script) in ORDERED_SCRIPTS),
+        })
+    return checks
+
+def build_index(snapshot_path, index_dir):
+    """
+    Writes (or finds) the snapshot index file of a snapshot.
+
+    Returns:
+        (index file, snapshot digest), the index file is None if it could not be written. Without an
+        index file every process reads the JSON snapshot itself.
+    """
+    from policychecks import model, snapshot, snapshot_index
+    try:
+        snapshot_model, snapshot_digest, from_index = snapshot_index.load(snapshot_path, index_dir, lambda: model.build(snapshot.read(snapshot_path, ["Table", "Column"])))
+    except Exception as error:
+        offline.get_logger().warning(f"Snapshot index not built, the processes read {snapshot_path}: {type(error).__name__}: {error}")
+        return None, None
+    path = snapshot_index.index_path(index_dir, snapshot_digest)
+    return (path if os.path.isfile(path) else None), snapshot_digest
+
+def _initialize(checks, database, snapshot_path, index_file, snapshot_digest, log_level):
+    """Sets up a process: offline modules, compiled scripts and the snapshot model read from the index file."""
+    global _checks
+    logging.basicConfig(level=log_level, format="%(levelname)s %(message)s")
+    offline.install()
+    offline.configure(database, snapshot_path)
+    _checks = []
+    for check in checks:
+        with open(check["script"], "r", encoding="utf-8") as file:
+            _checks.append((check, compile(file.read(), check["script"], "exec")))
+    if index_file:
+        from policychecks import cache, model, snapshot_index
+        try:
+            snapshot_model = snapshot_index.read(index_file)
+        except (OSError, ValueError) as error:
+            offline.get_logger().warning(f"Snapshot index not read, reading {snapshot_path}: {error}")
+            return
+        snapshot_model.digest = snapshot_digest
+        cache.namespace(model.MODEL_NAMESPACE, max_entries=model.MODEL_CACHE_SIZE).put(snapshot_path, snapshot_model)
+
+def _run_task(task):
+    """
+    Runs checks on changesets.
+
+    Returns:
+        (results, process id, cache statistics of the process), results are (changeset number, check number,
+        fired, message, error, seconds) tuples.
+    """
+    from policychecks import cache
+    changesets, check_numbers = task
+    results = []
+    for changeset_number, changeset in changesets:
+        for check_number in check_numbers:
+            check, code = _checks[check_number]
+            status = offline.start(changeset, check["script"], check["message"], check["args"])
+            started = time.perf_counter()
+            try:
+                exec(code, {"__name__": "__main__", "__file__": check["script"]})
+            except Exception as error:
+                results.append((changeset_number, check_number, False, None, f"{type(error).__name__}: {error}", time.perf_counter() - started))
+                continue
+            message = (status.message or check["message"]) if status.fired else None
+            results.append((changeset_number, check_number, bool(status.fired), message, None, time.perf_counter() - started))
+    return results, os.getpid(), cache.stats()
+
+def add_cache_stats(totals, stats):
+    """Adds the cache statistics of a process (or shard) to totals, by namespace."""
+    for name, counts in stats.items():
+        total = totals.setdefault(name, {key: 0 for key in counts})
+        for key, count in counts.items():
+            total[key] = total.get(key, 0) + count
+    return totals
+
+def changeset_key(changeset):
+    """Returns the key of a changeset in shard assignments and timings."""
+    return f"{changeset.getFilePath()}::{changeset.getId()}::{changeset.getAuthor()}"
+
+def stable_hash(key):
+    """Returns a hash of a key that is the same on every machine and Python process."""
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big")
+
+def assign(keys, shard_count, costs=None):
+    """
+    Assigns keys to shards.
+
+    Args:
+        keys: Unit keys (changeset keys or check names)
+        shard_count: Number of shards
+        costs: Seconds recorded for the keys (see timings), None to assign by stable hash
+
+    Returns:
+        A dictionary of key to shard number (0 based).
+    """
+    if costs is None:
+        return {key: stable_hash(key) % shard_count for key in keys}
+    ###
+    ### Costliest first to the least loaded shard. Keys without a recorded time cost the average,
+    ### ties are broken by key and shard number so every node computes the same assignment
+    ###
+    recorded = [costs[key] for key in keys if key in costs]
+    default_cost = sum(recorded) / len(recorded) if recorded else 1.0
+    loads = [(0.0, number) for number in range(shard_count)]
+    heapq.heapify(loads)
+    assignment = {}
+    for cost, key in sorted(((costs.get(key, default_cost), key) for key in set(keys)), key=lambda unit: (-unit[0], unit[1])):
+        load, number = heapq.heappop(loads)
+        assignment[key] = number
+        heapq.heappush(loads, (load + cost, number))
+    return assignment
+
+def select(changesets, checks, shard, shard_count, shard_by=SHARD_BY_CHANGESET, timings=None):
+    """
+    Returns the work of a shard.
+
+    Args:
+        changesets: offline.ChangeSet list, in changelog order
+        checks: Checks (see read_checks)
+        shard: Shard number (0 based)
+        shard_count: Number of shards
+        shard_by: SHARD_BY_CHANGESET or SHARD_BY_CHECK
+        timings: Timings of an earlier run (see timings) for cost balanced shards, None for stable hash shards
+
+    Returns:
+        (changeset numbers, unordered check numbers, ordered check numbers). Ordered checks are always
+        assigned whole, they run on every changeset of the shard they are assigned to.
+    """
+    check_costs = timings.get("checks", {}) if timings is not None else None
+    unordered = [number for number, check in enumerate(checks) if not check["ordered"]]
+    ordered = [number for number, check in enumerate(checks) if check["ordered"]]
+    if shard_by == SHARD_BY_CHECK:
+        shards = assign([check["name"] for check in checks], shard_count, check_costs)
+        mine = [number for number, check in enumerate(checks) if shards[check["name"]] == shard]
+        return list(range(len(changesets))), [number for number in mine if number in unordered], [number for number in mine if number in ordered]
+    ###
+    ### Changesets and ordered checks are balanced together, an ordered check is one unit
+    ###
+    keys = [changeset_key(changeset) for changeset in changesets]
+    check_keys = ["check:" + checks[number]["name"] for number in ordered]
+    costs = None
+    if timings is not None:
+        costs = dict(timings.get("changesets", {}))
+        costs.update(("check:" + name, seconds) for name, seconds in check_costs.items())
+    shards = assign(keys + check_keys, shard_count, costs)
+    return ([number for number, key in enumerate(keys) if shards[key] == shard], unordered,
+            [number for number, key in zip(ordered, check_keys) if shards[key] == shard])
+
+def tasks(changesets, checks, workers, selection=None):
+    """
+    Splits the work in tasks: contiguous changeset chunks for the unordered checks, and one task with
+    every changeset for the ordered checks.
+
+    Args:
+        changesets: offline.ChangeSet list, in changelog order
+        checks: Checks (see read_checks)
+        workers: Number of processes
+        selection: Work of a shard (see select), None for all changesets and checks
+    """
+    numbered = list(enumerate(changesets))
+    if selection is None:
+        selection = (range(len(changesets)),
+                     [number for number, check in enumerate(checks) if not check["ordered"]],
+                     [number for number, check in enumerate(checks) if check["ordered"]])
+    changeset_numbers, unordered, ordered = selection
+    selected = [numbered[number] for number in changeset_numbers]
+    result = []
+    if ordered:
+        result.append((numbered, ordered))
+    if unordered and selected:
+        size = max(1, math.ceil(len(selected) / (workers * TASKS_PER_WORKER)))
+        result.extend((selected[start:start + size], unordered) for start in range(0, len(selected), size))
+    return result
+
+def run(changesets, checks, workers=1, database=None, snapshot_path=None, index_dir=None, log_level=logging.WARNING, selection=None):
+    """
+    Runs the checks on the changesets.
+
+    Args:
+        changesets: offline.ChangeSet list, in changelog order
+        checks: Checks (see read_checks)
+        workers: Number of processes, 1 runs in this process
+        database: offline.Database, None for no database
+        snapshot_path: JSON snapshot file, None for no snapshot
+        index_dir: Folder of the snapshot index files, a temporary folder if None
+        log_level: Logging level of the scripts
+        selection: Work of a shard (see select), None for all changesets and checks
+
+    Returns:
+        (results, cache statistics). Results are (changeset number, check number, fired, message, error, seconds)
+        tuples sorted by changeset and check, cache statistics are the hits, misses and evictions of each
+        cache namespace (see policychecks/cache.py), summed over the processes.
+    """
+    offline.install()
+    temporary_dir = None
+    index_file = snapshot_digest = None
+    try:
+        if snapshot_path:
+            if not index_dir:
+                index_dir = temporary_dir = tempfile.mkdtemp(prefix="policychecks")
+            for check in checks:
+                check["args"].setdefault("SNAPSHOT_FILE", snapshot_path)
+                check["args"].setdefault("SNAPSHOT_INDEX_DIR", index_dir)
+            index_file, snapshot_digest = build_index(snapshot_path, index_dir)
+        initargs = (checks, database, snapshot_path, index_file, snapshot_digest, log_level)
+        work = tasks(changesets, checks, workers, selection)
+        results = []
+        ###
+        ### Cache statistics are counted from the start of each process, the last ones of a process are kept
+        ###
+        process_stats = {}
+        if workers <= 1 or len(work) <= 1:
+            _initialize(*initargs)
+            for task in work:
+                task_results, process, stats = _run_task(task)
+                results.extend(task_results)
+                process_stats[process] = stats
+        else:
+            with multiprocessing.Pool(workers, _initialize, initargs) as pool:
+                for task_results, process, stats in pool.imap_unordered(_run_task, work):
+                    results.extend(task_results)
+                    process_stats[process] = stats
+    finally:
+        if temporary_dir:
+            shutil.rmtree(temporary_dir, ignore_errors=True)
+    results.sort(key=lambda result: (result[0], result[1]))
+    cache_stats = {}
+    for stats in process_stats.values():
+        add_cache_stats(cache_stats, stats)
+    return results, cache_stats
+
+def timings(changesets, checks, results):
+    """Returns the seconds spent on each changeset (unordered checks) and on each check, for cost balanced shards."""
+    changeset_seconds = {}
+    check_seconds = {}
+    for changeset_number, check_number, fired, message, error, seconds in results:
+        check = checks[check_number]
+        if not check["ordered"]:
+            key = changeset_key(changesets[changeset_number])
+            changeset_seconds[key] = changeset_seconds.get(key, 0.0) + seconds
+        check_seconds[check["name"]] = check_seconds.get(check["name"], 0.0) + seconds
+    return {"changesets": {key: round(seconds, 6) for key, seconds in changeset_seconds.items()},
+            "checks": {key: round(seconds, 6) for key, seconds in check_seconds.items()}}
+
+def merge_timings(documents):
+    """Returns the timings of several shards as one timings document."""
+    merged = {"changesets": {}, "checks": {}}
+    for document in documents:
+        for section in merged:
+            for key, seconds in document.get(section, {}).items():
+                merged[section][key] = round(merged[section].get(key, 0.0) + seconds, 6)
+    return merged
+
+def exit_code(entries):
+    """Returns the exit code of report entries: the highest fired severity, at least 1 when a script failed."""
+    code = 0
+    for entry in entries:
+        code = max(code, ERROR_EXIT_CODE if entry["error"] else SEVERITIES[entry["severity"]])
+    return code
+
+def report(changesets, checks, results):
+    """Returns the JSON report of the results and the exit code."""
+    entries = []
+    for changeset_number, check_number, fired, message, error, seconds in results:
+        changeset = changesets[changeset_number]
+        check = checks[check_number]
+        if fired or error:
+            entries.append({
+                "changeset": changeset_number,
+                "file": changeset.getFilePath(),
+                "id": changeset.getId(),
+                "author": changeset.getAuthor(),
+                "check_number": check_number,
+                "check": check["name"],
+                "severity": SEVERITY_NAMES[check["severity"]],
+                "message": message,
+                "error": error,
+            })
+    code = exit_code(entries)
+    return {"changesets": len(changesets), "checks": len(checks), "results": entries, "exit_code": code}, code
+
+def merge(documents):
+    """
+    Merges the reports of the shards of a run.
+
+    Args:
+        documents: Shard reports, in any order
+
+    Returns:
+        (report, exit code), the report is the one an unsharded run writes. Raises ValueError if the
+        reports are not the shards of one run or a shard is missing.
+    """
+    if not documents:
+        raise ValueError("No shard reports")
+    first = documents[0]
+    shard_count = first.get("shard", {}).get("count")
+    found = set()
+    for document in documents:
+        shard = document.get("shard")
+        if shard is None:
+            raise ValueError("Not a shard report")
+        if (shard["count"], shard["by"], document["changesets"], document["checks"]) != (shard_count, first["shard"]["by"], first["changesets"], first["checks"]):
+            raise ValueError(f"Shard {shard['index']}/{shard['count']} is not from the same run as shard {first['shard']['index']}/{shard_count}")
+        if shard["index"] in found:
+            raise ValueError(f"Shard {shard['index']}/{shard['count']} is given twice")
+        found.add(shard["index"])
+    missing = sorted(set(range(1, shard_count + 1)) - found)
+    if missing:
+        raise ValueError(f"Missing shards: {', '.join(f'{index}/{shard_count}' for index in missing)}")
+    entries = [entry for document in documents for entry in document["results"]]
+    entries.sort(key=lambda entry: (entry["changeset"], entry["check_number"]))
+    code = exit_code(entries)
+    cache_stats = {}
+    for document in documents:
+        add_cache_stats(cache_stats, document.get("cache", {}))
+    return {"changesets": first["changesets"], "checks": first["checks"], "results": entries, "exit_code": code, "cache": cache_stats}, code
+
+def print_report(document, seconds):
+    for entry in document["results"]:
+        text = f"ERROR {entry['error']}" if entry["error"] else entry["message"]
+        print(f"{entry['file']}::{entry['id']}::{entry['author']} {entry['check']} ({entry['severity']}): {text}")
+    for name, stats in sorted(document.get("cache", {}).items()):
+        print(f"Cache {name}: {stats['entries']} entries, {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+    print(f"{document['changesets']} changesets, {document['checks']} checks, {len(document['results'])} results in {seconds:.1f}s, exit code {document['exit_code']}")
+
+def write_json(path, document):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+
+def read_json(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+def parse_shard(value):
+    """Parses a shard argument: INDEX/COUNT, INDEX from 1 to COUNT."""
+    match = re.fullmatch(r"(\d+)/(\d+)", value)
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise argparse.ArgumentTypeError(f"Expected INDEX/COUNT with INDEX from 1 to COUNT: {value}")
+    return int(match.group(1)), int(match.group(2))
+
+def merge_main(argv):
+    parser = argparse.ArgumentParser(prog="runner.py merge", description="Merges the shard reports of a run")
+    parser.add_argument("reports", nargs="+", help="Shard report files")
+    parser.add_argument("--output", help="Merged JSON report file")
+    parser.add_argument("--record-timings", help="Writes the timings of all shards to this file, for --timings")
+    options = parser.parse_args(argv)
+    started = time.monotonic()
+    documents = [read_json(path) for path in options.reports]
+    try:
+        document, code = merge(documents)
+    except ValueError as error:
+        parser.error(str(error))
+    if options.output:
+        write_json(options.output, document)
+    if options.record_timings:
+        write_json(options.record_timings, merge_timings(shard.get("timings", {}) for shard in documents))
+    print_report(document, time.monotonic() - started)
+    return code
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["merge"]:
+        return merge_main(argv[1:])
+    parser = argparse.ArgumentParser(description="Runs changelog scope policy checks on SQL changelogs without Liquibase. "
+                                                 "Use 'runner.py merge' to merge shard reports.")
+    parser.add_argument("changelogs", nargs="+", help="Formatted SQL changelog files, in changelog order")
+    parser.add_argument("--checks", required=True, help="JSON checks file")
+    parser.add_argument("--snapshot", help="JSON snapshot file (liquibase snapshot --snapshot-format=json)")
+    parser.add_argument("--snapshot-index-dir", help="Folder of the snapshot index files, a temporary folder by default")
+    parser.add_argument("--database", help="Database short name, e.g., oracle, mysql, postgresql, mssql")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of processes")
+    parser.add_argument("--output", help="JSON report file (policychecks-shard-INDEX-of-COUNT.json for a shard)")
+    parser.add_argument("--shard", type=parse_shard, help="Runs shard INDEX/COUNT of the work, e.g., 2/4")
+    parser.add_argument("--shard-by", choices=(SHARD_BY_CHANGESET, SHARD_BY_CHECK), default=SHARD_BY_CHANGESET, help="Unit of work assigned to shards")
+    parser.add_argument("--timings", help="Timings file of an earlier run, balances the shards by recorded cost instead of hash")
+    parser.add_argument("--record-timings", help="Writes the time spent on each changeset and check to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show the script log messages")
+    options = parser.parse_args(argv)
+    scripts_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    changesets = []
+    for path in options.changelogs:
+        if not path.lower().endswith(SQL_EXTENSIONS):
+            parser.error(f"Only SQL changelogs are supported: {path}")
+        changesets.extend(read_changelog(path))
+    checks = read_checks(options.checks, scripts_path)
+    database = offline.Database(options.database) if options.database else None
+    selection = None
+    if options.shard:
+        shard_index, shard_count = options.shard
+        selection = select(changesets, checks, shard_index - 1, shard_count, options.shard_by,
+                           read_json(options.timings) if options.timings else None)
+    started = time.monotonic()
+    results, cache_stats = run(changesets, checks, max(1, options.workers), database, options.snapshot, options.snapshot_index_dir,
+                               logging.INFO if options.verbose else logging.WARNING, selection)
+    document, code = report(changesets, checks, results)
+    document["cache"] = cache_stats
+    run_timings = timings(changesets, checks, results)
+    output = options.output
+    if options.shard:
+        document["shard"] = {"index": shard_index, "count": shard_count, "by": options.shard_by}
+        document["timings"] = run_timings
+        output = output or f"policychecks-shard-{shard_index}-of-{shard_count}.json"
+    if output:
+        write_json(output, document)
+    if options.record_timings:
+        write_json(options.record_timings, run_timings)
+    print_report(document, time.monotonic() - started)
+    return code
+
+if __name__ == "__main__":
+    sys.exit(main())
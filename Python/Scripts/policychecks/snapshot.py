@@ -0,0 +1,204 @@
+###
+### Snapshot access shared by the scripts
+###
+### Scripts declare the object types they use (e.g., Table, Column). When the SNAPSHOT_FILE
+### argument names a JSON snapshot (liquibase snapshot --snapshot-format=json), the file is read
+### incrementally and only the declared types are kept, so memory follows what the check uses.
+### Otherwise the snapshot provided by Liquibase (get_snapshot) is used.
+###
+### Notes:
+### 1. Other object types are decoded one object at a time and discarded, never kept as a whole
+### 2. Each file is read once per run for a given set of types, the result is kept in the run cache
+###    (SNAPSHOT_CACHE_SIZE most recently used, see policychecks/cache.py)
+###
+import json
+import re
+import liquibase_utilities
+from policychecks import cache
+
+###
+### Snapshot object types
+###
+SNAPSHOT_TYPE_PREFIX = "liquibase.structure.core."
+
+###
+### Reader settings
+###
+CHUNK_SIZE = 1 << 20
+DECODER = json.JSONDecoder()
+WHITESPACE = re.compile(r"\s*")
+
+###
+### Run cache namespace of the files read
+###
+SNAPSHOT_NAMESPACE = "snapshot_file"
+SNAPSHOT_CACHE_SIZE = 8
+
+class _Stream:
+    """Incremental reader over a JSON text file."""
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Reads the next chunk, dropping consumed text. Returns False at end of file."""
+        if self.eof:
+            return False
+        data = self.file.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Returns the next character after whitespace without consuming it, empty at end of file."""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, character):
+        if self.peek() != character:
+            raise ValueError(f"Invalid snapshot, expected '{character}' near: {self.buffer[self.pos:self.pos + 40]}")
+        self.pos += 1
+
+    def value(self):
+        """Decodes the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            ###
+            ### A number at the end of the buffer may continue in the next chunk
+            ###
+            if end == len(self.buffer) and isinstance(value, (int, float)) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def skip(self):
+        """Skips the next JSON value, arrays are decoded one element at a time and discarded."""
+        if self.peek() != "[":
+            self.value()
+            return
+        for element in self.elements():
+            pass
+
+    def members(self):
+        """Yields the keys of the next object, the caller reads or skips each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            character = self.peek()
+            self.pos += 1
+            if character == "}":
+                return
+            if character != ",":
+                raise ValueError(f"Invalid snapshot, expected ',' or '}}' near: {self.buffer[self.pos - 1:self.pos + 40]}")
+
+    def elements(self):
+        """Yields the decoded elements of the next array, one at a time."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            character = self.peek()
+            self.pos += 1
+            if character == "]":
+                return
+            if character != ",":
+                raise ValueError(f"Invalid snapshot, expected ',' or ']' near: {self.buffer[self.pos - 1:self.pos + 40]}")
+
+def full_type_name(type_name):
+    """Returns the full snapshot type name (e.g., Table to liquibase.structure.core.Table)."""
+    return type_name if "." in type_name else SNAPSHOT_TYPE_PREFIX + type_name
+
+def read(path, type_names=None, chunk_size=CHUNK_SIZE):
+    """
+    Reads a JSON snapshot file, keeping only some object types.
+
+    Args:
+        path: Snapshot file (liquibase snapshot --snapshot-format=json)
+        type_names: Object types to keep (e.g., ["Table", "Column"]), all types if None
+        chunk_size: Characters read at a time
+
+    Returns:
+        The snapshot in the same layout as liquibase_utilities.get_snapshot().
+    """
+    wanted = None if type_names is None else {full_type_name(type_name) for type_name in type_names}
+    result = {}
+    with open(path, "r", encoding="utf-8") as file:
+        stream = _Stream(file, chunk_size)
+        for key in stream.members():
+            if key != "snapshot":
+                result[key] = stream.value()
+                continue
+            snapshot = {}
+            for snapshot_key in stream.members():
+                if snapshot_key != "objects":
+                    snapshot[snapshot_key] = stream.value()
+                    continue
+                objects = {}
+                for type_name in stream.members():
+                    if wanted is None or type_name in wanted:
+                        objects[type_name] = list(stream.elements())
+                    else:
+                        stream.skip()
+                snapshot["objects"] = objects
+            result["snapshot"] = snapshot
+    return result
+
+def load(type_names):
+    """
+    Returns the snapshot for a check that uses the given object types.
+
+    Args:
+        type_names: Object types used by the check (e.g., ["Table", "PrimaryKey"])
+
+    Returns:
+        The snapshot streamed from SNAPSHOT_FILE (declared types only) or the Liquibase snapshot.
+    """
+    path = liquibase_utilities.get_arg("SNAPSHOT_FILE")
+    if not path:
+        return liquibase_utilities.get_snapshot()
+    cache_key = path + ":" + ",".join(sorted(full_type_name(type_name) for type_name in type_names))
+    return cache.namespace(SNAPSHOT_NAMESPACE, max_entries=SNAPSHOT_CACHE_SIZE).get_or_create(cache_key, lambda: read(path, type_names))
+
+def reference_id(reference):
+    """Returns the snapshot id of a reference (e.g., liquibase.structure.core.Table#123)."""
+    return str(reference).split("#")[-1]
+
+def objects(snapshot, type_name):
+    """
+    Returns the snapshot objects of a type.
+
+    Args:
+        snapshot: Snapshot dictionary (see load)
+        type_name: Short type name (e.g., Table, Column, PrimaryKey)
+
+    Returns:
+        A list of object attribute dictionaries or None if the type is not in the snapshot.
+    """
+    if snapshot is None or full_type_name(type_name) not in snapshot["snapshot"]["objects"]:
+        return None
+    key = type_name[0].lower() + type_name[1:]
+    return [entry[key] for entry in snapshot["snapshot"]["objects"][full_type_name(type_name)]]
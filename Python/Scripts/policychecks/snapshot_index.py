@@ -0,0 +1,201 @@
+###
+### Persisted snapshot index
+###
+### The snapshot model (policychecks/model.py) is rebuilt by every run, even though the snapshot
+### of a production schema rarely changes. When the SNAPSHOT_INDEX_DIR argument is set, the model
+### of a SNAPSHOT_FILE is written to <SNAPSHOT_INDEX_DIR>/<digest>.v<version>.idx, where digest is the SHA-256
+### of the snapshot file. Later runs against the same snapshot read the index file instead of the JSON.
+###
+### File layout (little endian, fixed size records so the file can be memory mapped):
+###   header   MAGIC, version, string count, table count, column count, column order count
+###   strings  one offset per string (string count + 1) then the UTF-8 text of all strings
+###   tables   name, schema, tablespace, primary key, snapshot id, index count, first column order, column count
+###   columns  name, table, type name, size type, snapshot id, size, nullable
+###   order    column numbers of each table, in table order
+### Strings and rows are referenced by number, -1 is None. Sizes, counts and offsets are 64 bit
+### (e.g., the MySQL LONGTEXT size 4294967295 does not fit in 32 bits).
+###
+### Notes:
+### 1. Index files are only written when the snapshot comes from SNAPSHOT_FILE
+### 2. Unreadable or outdated index files are ignored and rewritten, a failed write only skips the file
+###
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from policychecks import model
+
+###
+### File format
+###
+MAGIC = b"LBSI"
+VERSION = 2
+HEADER = struct.Struct("<4sIQQQQ")
+OFFSET = struct.Struct("<Q")
+TABLE = struct.Struct("<iiiiiqqq")
+COLUMN = struct.Struct("<iiiiiqb")
+ORDER = struct.Struct("<i")
+NULLABLE = {None: -1, False: 0, True: 1}
+NULLABLE_VALUES = {value: key for key, value in NULLABLE.items()}
+
+###
+### Digest settings
+###
+DIGEST_CHUNK_SIZE = 1 << 20
+
+def digest(path):
+    """Returns the SHA-256 hex digest of a snapshot file."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK_SIZE), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def index_path(index_dir, snapshot_digest):
+    """Returns the index file for a snapshot digest."""
+    return os.path.join(index_dir, f"{snapshot_digest}.v{VERSION}.idx")
+
+def write(snapshot_model, path):
+    """
+    Writes the snapshot model to an index file.
+
+    Args:
+        snapshot_model: Model to write (see policychecks/model.py)
+        path: Index file, replaced atomically
+    """
+    strings = []
+    string_numbers = {}
+    def string_number(value):
+        if value is None:
+            return -1
+        number = string_numbers.get(value)
+        if number is None:
+            number = string_numbers[value] = len(strings)
+            strings.append(value)
+        return number
+    table_numbers = {id(table): number for number, table in enumerate(snapshot_model.tables)}
+    column_numbers = {id(column): number for number, column in enumerate(snapshot_model.columns)}
+    table_rows = []
+    order = []
+    for table in snapshot_model.tables:
+        table_rows.append(TABLE.pack(
+            string_number(table.name), string_number(table.schema), string_number(table.tablespace),
+            string_number(table.primary_key), string_number(table.snapshot_id),
+            table.index_count, len(order), len(table.columns)))
+        order.extend(column_numbers[id(column)] for column in table.columns)
+    column_rows = []
+    for column in snapshot_model.columns:
+        column_rows.append(COLUMN.pack(
+            string_number(column.name), table_numbers.get(id(column.table), -1), string_number(column.type_name),
+            string_number(column.size_type), string_number(column.snapshot_id),
+            -1 if column.size is None else column.size, NULLABLE.get(column.nullable, -1)))
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    ###
+    ### Everything is packed before the file is opened, a value that does not fit leaves no temporary file
+    ###
+    parts = [HEADER.pack(MAGIC, VERSION, len(strings), len(table_rows), len(column_rows), len(order)),
+             b"".join(OFFSET.pack(offset) for offset in offsets), b"".join(encoded),
+             b"".join(table_rows), b"".join(column_rows), b"".join(ORDER.pack(number) for number in order)]
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as file:
+        for part in parts:
+            file.write(part)
+    os.replace(temporary_path, path)
+
+def read(path):
+    """
+    Reads a snapshot model from an index file.
+
+    Args:
+        path: Index file written by write()
+
+    Returns:
+        The Model. Raises ValueError if the file is not a valid index file.
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        view = memoryview(data)
+        try:
+            magic, version, string_count, table_count, column_count, order_count = HEADER.unpack_from(view, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Not a version {VERSION} snapshot index: {path}")
+            position = HEADER.size
+            if position + OFFSET.size * (string_count + 1) > len(view):
+                raise ValueError(f"Truncated snapshot index: {path}")
+            offsets = [offset for offset, in OFFSET.iter_unpack(view[position:position + OFFSET.size * (string_count + 1)])]
+            position += OFFSET.size * (string_count + 1)
+            ###
+            ### The counts and offsets of the header must describe the whole file
+            ###
+            if position + offsets[-1] + TABLE.size * table_count + COLUMN.size * column_count + ORDER.size * order_count != len(view):
+                raise ValueError(f"Inconsistent snapshot index: {path}")
+            text = bytes(view[position:position + offsets[-1]])
+            position += offsets[-1]
+            ###
+            ### Byte and character offsets are the same for ASCII text, slice the decoded text directly
+            ###
+            decoded = text.decode("utf-8")
+            intern = sys.intern
+            if len(decoded) == len(text):
+                strings = [intern(decoded[offsets[number]:offsets[number + 1]]) for number in range(string_count)]
+            else:
+                strings = [intern(text[offsets[number]:offsets[number + 1]].decode("utf-8")) for number in range(string_count)]
+            table_rows = list(TABLE.iter_unpack(view[position:position + TABLE.size * table_count]))
+            position += TABLE.size * table_count
+            column_rows = list(COLUMN.iter_unpack(view[position:position + COLUMN.size * column_count]))
+            position += COLUMN.size * column_count
+            order = [number for number, in ORDER.iter_unpack(view[position:position + ORDER.size * order_count])]
+        except struct.error as error:
+            raise ValueError(f"Invalid snapshot index {path}: {error}")
+        finally:
+            view.release()
+    ###
+    ### Numbers out of range (a corrupted file) make the index invalid
+    ###
+    try:
+        ###
+        ### Number -1 is None
+        ###
+        strings.append(None)
+        tables = [model.Table(strings[name], strings[schema], strings[tablespace], index_count, strings[primary_key], strings[snapshot_id])
+                  for name, schema, tablespace, primary_key, snapshot_id, index_count, first, count in table_rows]
+        tables.append(None)
+        columns = [model.Column(strings[name], tables[table], strings[type_name], None if size < 0 else size, strings[size_type], NULLABLE_VALUES[nullable], strings[snapshot_id])
+                   for name, table, type_name, size_type, snapshot_id, size, nullable in column_rows]
+        tables.pop()
+        for table, row in zip(tables, table_rows):
+            first, count = row[6], row[7]
+            table.columns = tuple([columns[number] for number in order[first:first + count]])
+    except (IndexError, KeyError) as error:
+        raise ValueError(f"Invalid snapshot index {path}: {error}")
+    return model.Model(tuple(tables), tuple(columns))
+
+def load(snapshot_path, index_dir, build):
+    """
+    Returns the model of a snapshot file, from its index file when there is one.
+
+    Args:
+        snapshot_path: Snapshot file (SNAPSHOT_FILE)
+        index_dir: Folder of the index files (SNAPSHOT_INDEX_DIR)
+        build: Function building the model from the snapshot file
+
+    Returns:
+        (model, snapshot digest, True if read from the index file)
+    """
+    snapshot_digest = digest(snapshot_path)
+    path = index_path(index_dir, snapshot_digest)
+    if os.path.isfile(path):
+        try:
+            return read(path), snapshot_digest, True
+        except (OSError, ValueError):
+            pass
+    snapshot_model = build()
+    try:
+        os.makedirs(index_dir, exist_ok=True)
+        write(snapshot_model, path)
+    except (OSError, struct.error, ValueError):
+        pass
+    return snapshot_model, snapshot_digest, False
@@ -0,0 +1,393 @@
+###
+### Dialect aware SQL statement splitter
+###
+### Statements are found in one scan of the original text and yielded one at a time as views
+### (offset and length into the text), no normalized copy of the changeset is made.
+###
+### Understood by all dialects: -- and /* */ comments, 'strings' and "identifiers" (doubled quotes),
+### BEGIN/CASE ... END blocks (a ; inside a block does not end the statement) and custom delimiters.
+### Dialects (Liquibase short names) add:
+###   oracle              q'[...]' strings, SQL*Plus / on its own line. PL/SQL units (DECLARE, BEGIN,
+###                       CREATE PROCEDURE/FUNCTION/PACKAGE/TRIGGER/TYPE ...) end at / only, as in SQL*Plus
+###   mssql               [identifiers], GO on its own line. CREATE/ALTER PROCEDURE/FUNCTION/TRIGGER/VIEW end at GO only
+###   mysql, mariadb      `identifiers`, # comments, backslash escapes, DELIMITER commands
+###   postgresql, edb     $$ and $tag$ quoted bodies
+###
+### Notes:
+### 1. Statements are trimmed of surrounding whitespace, comments inside a statement are kept
+### 2. Statements containing only comments are skipped
+### 3. Unterminated strings and comments run to the end of the text
+###
+import functools
+import hashlib
+import re
+
+###
+### Dialect families by Liquibase short name
+###
+DIALECTS = {
+    "oracle": "oracle",
+    "mssql": "mssql",
+    "mysql": "mysql",
+    "mariadb": "mysql",
+    "postgresql": "postgresql",
+    "edb": "postgresql",
+}
+
+###
+### Statements that end at a delimiter line only
+###
+_UNIT_PATTERNS = {
+    "oracle": re.compile(r"(?:declare|begin)\b|create\s+(?:or\s+replace\s+)?(?:(?:editionable|noneditionable|editioning)\s+)?(?:procedure|function|package|trigger|type|library|java)\b", re.IGNORECASE),
+    "mssql": re.compile(r"(?:create\s+(?:or\s+alter\s+)?|alter\s+)(?:procedure|proc|function|trigger|view)\b", re.IGNORECASE),
+}
+
+###
+### Delimiters written on their own line
+###
+LINE_DELIMITERS = {"/", "go"}
+
+###
+### Tokens of a statement: quoted text, words and single characters
+###
+TOKEN_PATTERN = re.compile(r"'(?:[^']|'')*'?|\"(?:[^\"]|\"\")*\"?|`[^`]*`?|\[[^\]]*\]?|[\w$#@]+|\S")
+WORD_CHARACTERS = re.compile(r"[\w$#@]")
+
+class Statement:
+    """
+    A statement of a SQL text, kept as an offset and length into the text.
+
+    Views of the statement (text, code, normalized, casefolded, words, tokens, keywords, fingerprint) are
+    computed on first use and kept, so all rules inspecting a statement share them.
+    """
+    __slots__ = ("buffer", "start", "length", "family", "_text", "_code", "_normalized", "_casefolded", "_words", "_tokens", "_keywords", "_fingerprint")
+
+    def __init__(self, buffer, start, length, family=None):
+        self.buffer = buffer
+        self.start = start
+        self.length = length
+        self.family = family
+        self._text = None
+        self._code = None
+        self._normalized = None
+        self._casefolded = None
+        self._words = None
+        self._tokens = None
+        self._keywords = None
+        self._fingerprint = None
+
+    @property
+    def end(self):
+        return self.start + self.length
+
+    @property
+    def text(self):
+        """Returns the statement text as written."""
+        if self._text is None:
+            self._text = self.buffer[self.start:self.end]
+        return self._text
+
+    @property
+    def code(self):
+        """Returns the statement text without comments."""
+        if self._code is None:
+            text = self.text
+            if "--" in text or "/*" in text or (self.family == "mysql" and "#" in text):
+                self._code = _comment_pattern(self.family).sub(_uncomment, text)
+            else:
+                self._code = text
+        return self._code
+
+    @property
+    def normalized(self):
+        """Returns the statement without comments and extra whitespace."""
+        if self._normalized is None:
+            self._normalized = " ".join(self.code.split())
+        return self._normalized
+
+    @property
+    def casefolded(self):
+        """Returns the normalized statement, casefolded."""
+        if self._casefolded is None:
+            self._casefolded = self.normalized.casefold()
+        return self._casefolded
+
+    @property
+    def words(self):
+        """Returns the casefolded statement split on whitespace."""
+        if self._words is None:
+            self._words = tuple(self.casefolded.split())
+        return self._words
+
+    @property
+    def tokens(self):
+        """Returns the tokens of the statement: quoted text, words and other characters."""
+        if self._tokens is None:
+            self._tokens = tuple(TOKEN_PATTERN.findall(self.code))
+        return self._tokens
+
+    @property
+    def keywords(self):
+        """Returns the casefolded unquoted words of the statement (keywords and plain identifiers), in order."""
+        if self._keywords is None:
+            self._keywords = tuple(token.casefold() for token in self.tokens if WORD_CHARACTERS.match(token))
+        return self._keywords
+
+    @property
+    def fingerprint(self):
+        """Returns the fingerprint of the normalized statement (see fingerprint())."""
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(self.normalized)
+        return self._fingerprint
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return f"Statement({self.start}, {self.length})"
+
+@functools.lru_cache(maxsize=None)
+def _comment_pattern(family):
+    """Returns the pattern of comments and the quoted text that may contain comment markers."""
+    quoted = r"'(?:[^'\\]|\\.|'')*'?|\"(?:[^\"\\]|\\.|\"\")*\"?|`[^`]*`?" if family == "mysql" else r"'(?:[^']|'')*'?|\"(?:[^\"]|\"\")*\"?"
+    if family == "mssql":
+        quoted += r"|\[[^\]]*\]?"
+    if family == "postgresql":
+        quoted = r"\$(?P<tag>[A-Za-z_]\w*|)\$.*?(?:\$(?P=tag)\$|\Z)|" + quoted
+    comments = r"--[^\n]*|/\*.*?(?:\*/|\Z)" + (r"|#[^\n]*" if family == "mysql" else "")
+    return re.compile(rf"(?P<quoted>{quoted})|(?P<comment>{comments})", re.DOTALL)
+
+def _uncomment(match):
+    return " " if match.group("comment") is not None else match.group()
+
+def strip_comments(text, dialect=None):
+    """Returns a SQL text with its comments replaced by a space, quoted text is kept."""
+    return _comment_pattern(dialect_family(dialect)).sub(_uncomment, text)
+
+def fingerprint(text):
+    """Returns a 16 byte BLAKE2b digest of a text, statements with the same text have the same fingerprint."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+def dialect_family(dialect):
+    """Returns the dialect family of a Liquibase short name, None for other databases."""
+    return DIALECTS.get((dialect or "").casefold())
+
+def change_delimiter(change):
+    """Returns the end delimiter set on a change (e.g., sql, sqlFile), None if not set."""
+    get_end_delimiter = getattr(change, "getEndDelimiter", None)
+    if get_end_delimiter is None:
+        return None
+    try:
+        delimiter = get_end_delimiter()
+    except Exception:
+        return None
+    return str(delimiter) if delimiter else None
+
+@functools.lru_cache(maxsize=None)
+def _skip_pattern(family):
+    comments = r"--[^\n]*|/\*.*?(?:\*/|\Z)" + (r"|#[^\n]*" if family == "mysql" else "")
+    return re.compile(rf"(?:\s+|{comments})*", re.DOTALL)
+
+def _line_delimiters(family, delimiter):
+    """
+    Returns the pattern of the delimiters written on their own line (or None) and the remaining inline
+    delimiter, "" when a custom line delimiter (endDelimiter / or GO) replaces ;.
+    """
+    line_delimiters = set()
+    if family == "oracle":
+        line_delimiters.add("/")
+    if family == "mssql":
+        line_delimiters.add("go")
+    if delimiter is not None and delimiter.strip().casefold() in LINE_DELIMITERS:
+        line_delimiters.add(delimiter.strip().casefold())
+        delimiter = ""
+    if not line_delimiters:
+        return None, delimiter
+    return "|".join(r"/" if line_delimiter == "/" else r"(?i:go)(?:[ \t]+\d+)?" for line_delimiter in sorted(line_delimiters)), delimiter
+
+@functools.lru_cache(maxsize=64)
+def _scan_pattern(family, delimiter, unit):
+    """
+    Returns the pattern of everything that matters to the splitter, in one alternation.
+
+    Every alternative starts with one character of a set, so the regex engine can jump from one
+    candidate character to the next. The alternatives check that character with a lookbehind.
+    """
+    alternatives = [
+        ("-", r"(?P<comment>-[^\n]*)"),
+        ("/", r"(?P<block_comment>\*.*?(?:\*/|\Z))"),
+    ]
+    if family == "mysql":
+        alternatives.append(("#", r"(?P<hash_comment>[^\n]*)"))
+        alternatives.append(("'", r"(?P<string>(?:[^'\\]|\\.|'')*(?:'|\Z))"))
+        alternatives.append(('"', r'(?P<quoted>(?:[^"\\]|\\.|"")*(?:"|\Z))'))
+        alternatives.append(("`", r"(?P<backquoted>[^`]*(?:`|\Z))"))
+        alternatives.append(("\n", r"(?P<delimiter_command>[ \t]*(?i:delimiter)[ \t]+(?P<new_delimiter>\S+)[ \t\r]*$)"))
+    else:
+        if family == "oracle":
+            alternatives.append(("nNqQ", r"(?<![\w$#@].)(?P<q_string>(?<=[nN])[qQ]'(?:\[.*?\]|\{.*?\}|\(.*?\)|<.*?>|(?P<q_quote>\S).*?(?P=q_quote))(?:'|\Z)|(?<=[qQ])'(?:\[.*?\]|\{.*?\}|\(.*?\)|<.*?>|(?P<q_quote2>\S).*?(?P=q_quote2))(?:'|\Z))"))
+        if family == "postgresql":
+            alternatives.append(("$", r"(?P<dollar_string>(?P<tag>[A-Za-z_]\w*|)\$.*?(?:\$(?P=tag)\$|\Z))"))
+        if family == "mssql":
+            alternatives.append(("[", r"(?P<bracketed>[^\]]*(?:\]|\Z))"))
+        alternatives.append(("'", r"(?P<string>(?:[^']|'')*(?:'|\Z))"))
+        alternatives.append(('"', r'(?P<quoted>(?:[^"]|"")*(?:"|\Z))'))
+    line_delimiters, delimiter = _line_delimiters(family, delimiter)
+    if line_delimiters is not None:
+        alternatives.append(("\n", rf"(?P<line_delimiter>[ \t]*(?:{line_delimiters})[ \t\r]*$)"))
+    ###
+    ### Inside a unit only the line delimiter ends the statement
+    ###
+    if not unit and delimiter != "":
+        if delimiter is None or delimiter == ";":
+            alternatives.append(("bBcCeE", r"(?<![\w$#@].)(?P<block>(?<=[bB])(?i:egin)(?![ \t\r\n]*(?:;|(?i:tran|transaction|work|distributed|dialog|conversation)\b))|(?<=[cC])(?i:ase)|(?<=[eE])(?i:nd)(?![ \t\r\n]+(?i:if|loop|while|repeat|conversation)\b))(?![\w$#@])"))
+            alternatives.append((";", r"(?P<delimiter>)"))
+        else:
+            alternatives.append((delimiter[0], rf"(?P<delimiter>{re.escape(delimiter[1:])})"))
+    characters = "".join(sorted(set("".join(first for first, alternative in alternatives))))
+    branches = "|".join(f"(?<=[{re.escape(first)}]){alternative}" for first, alternative in alternatives)
+    return re.compile(f"[{re.escape(characters)}](?:{branches})", re.MULTILINE | re.DOTALL)
+
+@functools.lru_cache(maxsize=64)
+def _start_pattern(family, delimiter):
+    """Returns the pattern of a delimiter line or DELIMITER command at the start of a statement, None if the dialect has none."""
+    line_delimiters, delimiter = _line_delimiters(family, delimiter)
+    alternatives = []
+    if line_delimiters is not None:
+        alternatives.append(rf"(?P<line_delimiter>[ \t]*(?:{line_delimiters})[ \t\r]*$)")
+    if family == "mysql":
+        alternatives.append(r"(?P<delimiter_command>[ \t]*(?i:delimiter)[ \t]+(?P<new_delimiter>\S+)[ \t\r]*$)")
+    return re.compile("|".join(alternatives), re.MULTILINE) if alternatives else None
+
+def split(text, dialect=None, delimiter=None):
+    """
+    Yields the statements of a SQL text.
+
+    Args:
+        text: SQL text, e.g. liquibase_utilities.generate_sql(change)
+        dialect: Liquibase short name (e.g., oracle, mssql), generic SQL if None or not listed
+        delimiter: Custom delimiter (e.g., the change's endDelimiter), ; if None. / and GO must be on their own line.
+
+    Returns:
+        A generator of Statement views into text.
+    """
+    if not text:
+        return
+    family = dialect_family(dialect)
+    skip = _skip_pattern(family)
+    unit_pattern = _UNIT_PATTERNS.get(family)
+    position = 0
+    while True:
+        ###
+        ### Start of the next statement, after whitespace and comments
+        ###
+        start = skip.match(text, position).end()
+        if start >= len(text):
+            return
+        ###
+        ### A delimiter line or DELIMITER command before any statement text
+        ###
+        start_pattern = _start_pattern(family, delimiter)
+        match = start_pattern.match(text, start) if start_pattern is not None else None
+        if match is not None:
+            if match.lastgroup == "delimiter_command":
+                delimiter = match.group("new_delimiter")
+            position = match.end()
+            continue
+        unit = unit_pattern is not None and unit_pattern.match(text, start) is not None
+        scan = _scan_pattern(family, delimiter, unit)
+        depth = 0
+        ###
+        ### Scan tokens until the statement ends
+        ###
+        position = start
+        while True:
+            match = scan.search(text, position)
+            if match is None:
+                end = position = len(text)
+                break
+            kind = match.lastgroup
+            position = match.end()
+            if kind == "line_delimiter":
+                end = match.start()
+                break
+            if kind == "delimiter_command":
+                end = match.start()
+                delimiter = match.group("new_delimiter")
+                break
+            if kind == "delimiter":
+                if depth > 0:
+                    continue
+                end = match.start()
+                break
+            if kind == "block":
+                if match.group().casefold() == "end":
+                    depth = max(depth - 1, 0)
+                else:
+                    depth += 1
+        statement = _trimmed(text, start, end, skip, family)
+        if statement is not None:
+            yield statement
+
+def _trimmed(text, start, end, skip, family):
+    """Returns the statement between start and end without surrounding whitespace, None if it only has comments."""
+    if skip.match(text, start, end).end() >= end:
+        return None
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return Statement(text, start, end - start, family)
+
+def texts(text, dialect=None, delimiter=None):
+    """Returns the statement texts of a SQL text (see split)."""
+    return [statement.text for statement in split(text, dialect, delimiter)]
+
+###
+### Statements of recently seen changes, shared by all scripts of a run (see policychecks/cache.py)
+### Bounded by count and by the total length of their SQL text
+###
+STATEMENTS_NAMESPACE = "statements"
+STATEMENTS_CACHE_SIZE = 32
+STATEMENTS_CACHE_WEIGHT = 1 << 24
+
+def _text_length(found):
+    return len(found[0].buffer) if found else 0
+
+def change_key(change):
+    """
+    Returns the run cache key of a change without generating its SQL.
+
+    The key is the current changeset (file, id, author) and the position of the change in it,
+    or the identity of the change when it is not part of the current changeset.
+    """
+    import liquibase_utilities
+    changeset = liquibase_utilities.get_changeset()
+    if changeset is not None:
+        for position, candidate in enumerate(changeset.getChanges()):
+            if candidate is change or candidate == change:
+                return (str(changeset.getFilePath()), str(changeset.getId()), str(changeset.getAuthor()), position)
+    return ("change", id(change))
+
+def of_change(change, dialect=None):
+    """
+    Returns the statements of a change.
+
+    The SQL of a change is generated and split once per run: scripts checking the same change get
+    the same Statement objects (and the views already computed by other scripts), keyed by the
+    change (see change_key), not by its SQL text.
+
+    Args:
+        change: Liquibase change
+        dialect: Liquibase short name, the current database if None (see policychecks/metadata.py)
+
+    Returns:
+        A tuple of Statement views.
+    """
+    import liquibase_utilities
+    from policychecks import cache
+    if dialect is None:
+        from policychecks import metadata
+        dialect = metadata.get_metadata().short_name
+    delimiter = change_delimiter(change)
+    key = (change_key(change), dialect_family(dialect), delimiter)
+    namespace = cache.namespace(STATEMENTS_NAMESPACE, max_entries=STATEMENTS_CACHE_SIZE, max_weight=STATEMENTS_CACHE_WEIGHT, weigh=_text_length)
+    return namespace.get_or_create(key, lambda: tuple(split(liquibase_utilities.generate_sql(change), dialect, delimiter)))
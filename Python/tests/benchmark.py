@@ -0,0 +1,105 @@
+###
+### Benchmarks of the check scripts
+###
+###   python tests/benchmark.py startup [--runs 20]
+###   python tests/benchmark.py patterns [--changesets 6000]
+###
+### startup  first run (policychecks modules imported) and average later run of each script in a fresh
+###          process, against a changeset the script has nothing to check in, and the import time of the
+###          heavy modules the scripts only import when a changeset needs them
+### patterns time spent on the regular expressions of the Db2 and PII scripts over a run of CHANGESETS
+###          changesets: patterns compiled by the script body on every run (as before policychecks/patterns.py),
+###          the same with the re module cache cleared (interpreters with a small or no pattern cache), and
+###          the precompiled patterns of policychecks/patterns.py
+###
+import argparse
+import re
+import subprocess
+import sys
+import time
+import harness
+
+sys.path.insert(0, harness.SCRIPTS_PATH)
+from policychecks import patterns
+
+###
+### Script bodies of the patterns benchmark, run once per changeset like a script
+###
+INLINE_BODY = """
+import re
+SSN_PATTERN = re.compile(r"\\b\\d{3}-\\d{2}-\\d{4}\\b")
+PAN_PATTERN = re.compile(r"\\b(?:\\d[ -]*?){13,19}\\b")
+regex_pattern_database = r"(?is)CREATE\\s+TABLESPACE\\s+\\w+\\s+IN\\s+(\\w+)"
+regex_pattern_bufferpool = r"(?is)BUFFERPOOL\\s+(\\S+)"
+found = (SSN_PATTERN.findall(sql), PAN_PATTERN.findall(sql), re.findall(regex_pattern_database, sql), re.findall(regex_pattern_bufferpool, sql))
+"""
+SHARED_BODY = """
+from policychecks import patterns
+found = (patterns.PII_SSN.findall(sql), patterns.PII_PAN.findall(sql), patterns.DB2_TABLESPACE_DATABASE.findall(sql), patterns.DB2_BUFFERPOOL.findall(sql))
+"""
+SAMPLE_SQL = [
+    "insert into customer (id, ssn) values (1, '123-45-6789');",
+    "update card set pan = '4111 1111 1111 1111' where id = 2;",
+    "CREATE TABLESPACE SBA01003 IN DBA0001 USING STOGROUP SYSPOOL1 PRIQTY 720 BUFFERPOOL BP0 LOCKSIZE ANY;",
+    "create table orders (id int primary key, amount decimal(10, 2));",
+]
+
+def import_seconds(module):
+    """Returns the seconds taken to import a module in a fresh process."""
+    code = f"import time; started = time.perf_counter(); import {module}; print(time.perf_counter() - started)"
+    return float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+
+def startup(runs):
+    """Prints the startup time of each script and the import time of the heavy modules."""
+    print(f"{'script':<55} {'first ms':>9} {'later ms':>9}")
+    for script in harness.scripts():
+        result = harness.run_script(script, runs=runs)
+        first, *later = result["seconds"]
+        print(f"{script:<55} {first * 1000:9.2f} {sum(later) / len(later) * 1000:9.3f}")
+    for module in harness.HEAVY_MODULES:
+        print(f"import {module:<48} {import_seconds(module) * 1000:9.2f}")
+
+def run_bodies(body, changesets, purge=False):
+    """Returns the seconds taken to run a script body once per changeset."""
+    code = compile(body, "<script>", "exec")
+    started = time.perf_counter()
+    for number in range(changesets):
+        if purge:
+            re.purge()
+        exec(code, {"__name__": "__main__", "sql": SAMPLE_SQL[number % len(SAMPLE_SQL)]})
+    return time.perf_counter() - started
+
+def patterns_benchmark(changesets):
+    """Prints the time spent on regular expressions with patterns compiled per run and precompiled."""
+    for sql in SAMPLE_SQL:
+        inline_globals, shared_globals = {"sql": sql}, {"sql": sql}
+        exec(INLINE_BODY, inline_globals)
+        exec(SHARED_BODY, shared_globals)
+        if inline_globals["found"] != shared_globals["found"]:
+            raise AssertionError(f"Patterns differ for {sql}")
+    results = [
+        ("compiled by the script", run_bodies(INLINE_BODY, changesets)),
+        ("compiled by the script, no re cache", run_bodies(INLINE_BODY, changesets, purge=True)),
+        ("policychecks/patterns.py", run_bodies(SHARED_BODY, changesets)),
+    ]
+    shared = results[-1][1]
+    print(f"{changesets} changesets")
+    print(f"{'patterns':<40} {'total ms':>9} {'per run us':>11} {'saving us':>10}")
+    for name, seconds in results:
+        print(f"{name:<40} {seconds * 1000:9.1f} {seconds / changesets * 1e6:11.2f} {(seconds - shared) / changesets * 1e6:10.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks of the check scripts")
+    commands = parser.add_subparsers(dest="command", required=True)
+    startup_parser = commands.add_parser("startup", help="startup time of each script")
+    startup_parser.add_argument("--runs", type=int, default=20, help="runs of each script, the first one imports the modules")
+    patterns_parser = commands.add_parser("patterns", help="precompiled patterns against patterns compiled on every run")
+    patterns_parser.add_argument("--changesets", type=int, default=6000, help="changesets of the run")
+    options = parser.parse_args()
+    if options.command == "startup":
+        startup(max(options.runs, 2))
+    else:
+        patterns_benchmark(max(options.changesets, 1))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+###
+### The tests import the policychecks modules from the Scripts folder, with the offline helper
+### modules (policychecks/offline.py) registered as liquibase_utilities
+###
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Scripts"))
+
+from policychecks import offline
+offline.install()
@@ -0,0 +1,92 @@
+###
+### Test harness: runs a policy check script in a fresh Python process
+###
+### Scripts are run as Liquibase runs them, with the offline helper modules (policychecks/offline.py)
+### registered as liquibase_utilities. A fresh process shows what the first run of a script imports
+### and costs, later runs in the same process show the cost of each following changeset.
+###
+import json
+import os
+import subprocess
+import sys
+
+###
+### Folders
+###
+TESTS_PATH = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_PATH = os.path.join(os.path.dirname(TESTS_PATH), "Scripts")
+
+###
+### Modules that must only be imported when a changeset needs them
+###
+HEAVY_MODULES = ("sqlparse", "wordninja")
+
+###
+### Changeset no script has anything to check in
+###
+IRRELEVANT_SQL = "select 1 from dual;"
+
+###
+### Script arguments, for the scripts that need them
+###
+SCRIPT_ARGS = {
+    "billing_mode.py": {"BILLING_MODE": "PAY_PER_REQUEST"},
+    "count_rows.py": {"TABLE_NAME": "t"},
+    "create_index_count.py": {"MAX_INDEX": "3"},
+    "pk_names_pg.py": {"STANDARD": "pkey"},
+    "table_column_disallow.py": {"DATA_TYPE": "clob"},
+    "table_column_name_size.py": {"MAX_SIZE": "30"},
+    "timestamp_column_name.py": {"COLUMN_TYPE": "timestamp", "COLUMN_POSTFIX": "_ts"},
+    "varchar_max_size.py": {"VARCHAR_MAX": "4000"},
+}
+
+_CHILD = """
+import json, sys, time
+script, sql, args, runs = json.loads(sys.argv[1])
+sys.path.insert(0, {scripts_path!r})
+from policychecks import offline
+offline.install()
+changeset = offline.ChangeSet("changelog.sql", "1", "test", [offline.Change(sql)])
+with open(script, "r", encoding="utf-8") as file:
+    code = compile(file.read(), script, "exec")
+seconds = []
+error = None
+for run in range(runs):
+    offline.start(changeset, script, "message", args)
+    started = time.perf_counter()
+    try:
+        exec(code, {{"__name__": "__main__", "__file__": script}})
+    except Exception as exception:
+        error = f"{{type(exception).__name__}}: {{exception}}"
+    seconds.append(time.perf_counter() - started)
+print(json.dumps({{"seconds": seconds, "error": error, "modules": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+def scripts():
+    """Returns the check scripts (thin wrappers in the database folders), relative to the Scripts folder."""
+    found = []
+    for folder in sorted(os.listdir(SCRIPTS_PATH)):
+        path = os.path.join(SCRIPTS_PATH, folder)
+        if folder == "policychecks" or not os.path.isdir(path):
+            continue
+        found.extend(f"{folder}/{name}" for name in sorted(os.listdir(path)) if name.endswith(".py"))
+    return found
+
+def run_script(script, sql=IRRELEVANT_SQL, runs=1):
+    """
+    Runs a script in a fresh process.
+
+    Args:
+        script: Script relative to the Scripts folder (e.g., Any/delete_without_where.py)
+        sql: SQL of the changeset
+        runs: Number of runs, the first one imports the modules
+
+    Returns:
+        Dictionary with the seconds of each run, the error of the script (None if it ran) and the heavy modules imported.
+    """
+    path = os.path.join(SCRIPTS_PATH, script)
+    args = SCRIPT_ARGS.get(os.path.basename(script), {})
+    child = _CHILD.format(scripts_path=SCRIPTS_PATH, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", child, json.dumps([path, sql, args, runs])],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
@@ -0,0 +1,51 @@
+###
+### SQL literal tokenizer (policychecks/literals.py)
+###
+from policychecks import literals
+from policychecks.literals import Value
+
+def rows(text, backslash_escapes=False):
+    table_name, columns, found = literals.insert(text, backslash_escapes)
+    return table_name, columns, list(found)
+
+def test_multi_row_values():
+    assert rows("insert into s.t (a, \"B\", c) values (1, 'x', null), (2, 'y', null)") == (
+        "t", ["a", "B", "c"],
+        [[Value("number", "1"), Value("string", "x"), Value("null", None)],
+         [Value("number", "2"), Value("string", "y"), Value("null", None)]],
+    )
+
+def test_missing_column_list():
+    assert rows("insert t values ('a', 1)") == ("t", None, [[Value("string", "a"), Value("number", "1")]])
+
+def test_doubled_quotes():
+    assert rows("insert into t values ('it''s', N'x''y')")[2] == [[Value("string", "it's"), Value("string", "x'y")]]
+
+def test_backslash_escapes():
+    assert rows("insert into t values ('a\\'b', 'c\\nd')", backslash_escapes=True)[2] == [[Value("string", "a'b"), Value("string", "c\nd")]]
+    assert rows("insert into t values ('c\\d')")[2] == [[Value("string", "c\\d")]]
+
+def test_postgresql_escape_strings():
+    assert rows("insert into t values (E'q\\'z', e'a\\tb', 'c\\d')")[2] == [[Value("string", "q'z"), Value("string", "a\tb"), Value("string", "c\\d")]]
+
+def test_null_numbers_calls_and_expressions():
+    assert rows("insert into t values (NULL, -2.5, +3, 3e2, upper('x'), to_date('2024-01-01', 'YYYY-MM-DD'), a + 1, default)")[2] == [[
+        Value("null", None), Value("number", "-2.5"), Value("number", "+3"), Value("number", "3e2"),
+        Value("call", "upper('x')"), Value("call", "to_date('2024-01-01', 'YYYY-MM-DD')"),
+        Value("expression", "a + 1"), Value("expression", "default"),
+    ]]
+
+def test_rows_are_generated():
+    table_name, columns, found = literals.insert("insert into t values (1), (2), (3)")
+    assert next(found) == [Value("number", "1")]
+    assert next(found) == [Value("number", "2")]
+
+def test_update():
+    assert literals.update("update s.t set a = 'x', b = -1, c = now(), d = coalesce(e, 1) where id = 1") == (
+        "t", [("a", Value("string", "x")), ("b", Value("number", "-1")), ("c", Value("call", "now()")), ("d", Value("call", "coalesce(e, 1)"))],
+    )
+
+def test_other_statements():
+    assert literals.insert("insert into t select * from u") is None
+    assert literals.insert("select 1") is None
+    assert literals.update("update t where x = 1") is None
@@ -0,0 +1,54 @@
+###
+### Mongo shell parser (policychecks/mongo.py)
+###
+from policychecks import mongo
+from policychecks.mongo import Call, Expression
+
+CHANGE = """// products
+db.createCollection("products", {validator: {$jsonSchema: {bsonType: "object", required: ["productID"], properties: {productID: {bsonType: "string", maxLength: 10}}}}});
+/* orders */ db.runCommand({collMod: 'orders', validator: {$jsonSchema: {Required: ['ProductId']}}});
+db.orders.createIndex({a: 1, b: -1}, {name: 'IDX-a', unique: true});
+db.getCollection('items').drop();
+"""
+
+def test_operations():
+    operations = mongo.parse(CHANGE)
+    assert [(operation.method, operation.collection, operation.line) for operation in operations] == [
+        ("createCollection", "products", 2), ("collMod", "orders", 3), ("createIndex", "orders", 4), ("drop", "items", 5),
+    ]
+    assert operations[2].args == [{"a": 1, "b": -1}, {"name": "IDX-a", "unique": True}]
+    assert CHANGE[operations[3].start:operations[3].end] == "db.getCollection('items').drop()"
+
+def test_validators():
+    create, collmod, create_index, drop = mongo.parse(CHANGE)
+    assert mongo.is_collection_definition(create) and mongo.is_collection_definition(collmod)
+    assert not mongo.is_collection_definition(create_index)
+    assert mongo.json_schema(create)["properties"] == {"productID": {"bsonType": "string", "maxLength": 10}}
+    assert mongo.json_schema(create_index) is None
+
+def test_values():
+    operation, = mongo.parse("db.events.insertOne({at: ISODate(\"2024-01-01\"), now: new Date(), n: 1.5e3, s: 'it\\'s', ok: false, x: null, v: someVar})")
+    assert operation.args == [{
+        "at": Call("ISODate", ["2024-01-01"]), "now": Call("new Date", []), "n": 1500.0, "s": "it's",
+        "ok": False, "x": None, "v": Expression("someVar"),
+    }]
+    assert mongo.find_call(operation.args, "new Date")
+    assert not mongo.find_call(operation.args, "ObjectId")
+
+def test_index():
+    indexed = mongo.index(CHANGE)
+    assert sorted(indexed) == ["collmod", "createcollection", "createindex", "drop"]
+    assert indexed["createindex"][0].collection == "orders"
+
+def test_incomplete_text():
+    assert mongo.parse("") == ()
+    operation, = mongo.parse("db.x.find({a: ")
+    assert operation.method == "find" and operation.collection == "x"
+
+def test_ignore_case():
+    create, collmod, create_index, drop = mongo.parse(CHANGE)
+    assert mongo.get_ignore_case({"productID": 1, "productid": 2}, "productID") == 1
+    assert mongo.get_ignore_case({"ProductId": 2}, "productID") == 2
+    assert mongo.get_ignore_case(None, "productID") is None
+    assert mongo.contains_ignore_case(mongo.get_ignore_case(mongo.json_schema(collmod), "required"), "productID")
+    assert not mongo.contains_ignore_case(["product"], "productID")
@@ -0,0 +1,34 @@
+###
+### Startup budget of the check scripts
+###
+### Scripts are run again for every changeset, a changeset a script has nothing to check in must
+### not import sqlparse or wordninja (see policychecks/any/identifiers_without_quotes.py) and must
+### stay within the startup budget. Run benchmark.py to see the import time of each script.
+###
+import functools
+import pytest
+import harness
+
+###
+### Seconds allowed for the first run of a script (policychecks modules imported) and for each
+### later run, generous enough for slow CI machines
+###
+FIRST_RUN_BUDGET = 0.5
+RUN_BUDGET = 0.02
+RUNS = 3
+
+@functools.lru_cache(maxsize=None)
+def result_of(script):
+    return harness.run_script(script, runs=RUNS)
+
+@pytest.mark.parametrize("script", harness.scripts())
+def test_irrelevant_changeset_skips_heavy_imports(script):
+    result = result_of(script)
+    assert result["modules"] == [], result["error"]
+
+@pytest.mark.parametrize("script", harness.scripts())
+def test_startup_budget(script):
+    result = result_of(script)
+    first, *later = result["seconds"]
+    assert first < FIRST_RUN_BUDGET
+    assert max(later) < RUN_BUDGET
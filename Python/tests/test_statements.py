@@ -0,0 +1,78 @@
+###
+### Statement splitter (policychecks/statements.py)
+###
+from policychecks import statements
+
+def test_plain_statements():
+    assert statements.texts("create table t (a int);\n\nselect 1 from t;") == ["create table t (a int)", "select 1 from t"]
+
+def test_comments_and_quoted_delimiters():
+    assert statements.texts("-- only a comment\n; select 'a;b', \"c;d\" from t; /* ; */ ;") == ["select 'a;b', \"c;d\" from t"]
+
+def test_oracle_plsql_unit_ends_at_slash():
+    sql = "create table t (a int);\ncreate or replace procedure p as\nbegin\n  insert into t values (1);\n  commit;\nend;\n/\nselect 1 from dual;"
+    assert statements.texts(sql, "oracle") == [
+        "create table t (a int)",
+        "create or replace procedure p as\nbegin\n  insert into t values (1);\n  commit;\nend;",
+        "select 1 from dual",
+    ]
+
+def test_oracle_anonymous_block_ends_at_slash():
+    assert statements.texts("declare\n  n int;\nbegin\n  n := 1;\nend;\n/\nselect 1 from dual;", "oracle") == [
+        "declare\n  n int;\nbegin\n  n := 1;\nend;",
+        "select 1 from dual",
+    ]
+
+def test_oracle_q_quotes():
+    assert statements.texts("select q'[it's; here]' from dual; select Nq'{a;b}' from dual; select q'!x;!' from dual", "oracle") == [
+        "select q'[it's; here]' from dual",
+        "select Nq'{a;b}' from dual",
+        "select q'!x;!' from dual",
+    ]
+
+def test_postgresql_dollar_quoted_bodies():
+    assert statements.texts("create function f() returns int as $body$ begin return 1; end; $body$ language plpgsql; select 1;", "postgresql") == [
+        "create function f() returns int as $body$ begin return 1; end; $body$ language plpgsql",
+        "select 1",
+    ]
+    assert statements.texts("create function g() returns int as $$ select 1; $$ language sql; select 2;", "postgresql") == [
+        "create function g() returns int as $$ select 1; $$ language sql",
+        "select 2",
+    ]
+
+def test_mssql_go():
+    sql = "create procedure p as\nbegin\n  select 1;\n  select 2;\nend\nGO\nselect 3\ngo 2\nselect 4"
+    assert statements.texts(sql, "mssql") == ["create procedure p as\nbegin\n  select 1;\n  select 2;\nend", "select 3", "select 4"]
+
+def test_mysql_delimiter_commands():
+    sql = "DELIMITER //\ncreate procedure p() begin select 1; select 2; end//\nDELIMITER ;\nselect 3;"
+    assert statements.texts(sql, "mysql") == ["create procedure p() begin select 1; select 2; end", "select 3"]
+
+def test_mysql_backslash_escapes():
+    assert statements.texts("select 'it\\'s; x' from t; select 2", "mysql") == ["select 'it\\'s; x' from t", "select 2"]
+
+def test_begin_transaction_is_not_a_block():
+    assert statements.texts("begin transaction; update t set a = 1; commit;") == ["begin transaction", "update t set a = 1", "commit"]
+    assert statements.texts("begin; update t set a = 1; commit;") == ["begin", "update t set a = 1", "commit"]
+    assert statements.texts("begin tran; update t set a = 1; commit tran;", "mssql") == ["begin tran", "update t set a = 1", "commit tran"]
+
+def test_begin_block():
+    assert statements.texts("do begin select 1; select 2; end; select 3;") == ["do begin select 1; select 2; end", "select 3"]
+
+def test_case_end():
+    assert statements.texts("select case when a = 1 then 2 else 3 end from t; select 4;") == [
+        "select case when a = 1 then 2 else 3 end from t",
+        "select 4",
+    ]
+    assert statements.texts("do begin update t set a = case when b then 1 end; select 2; end; select 3;") == [
+        "do begin update t set a = case when b then 1 end; select 2; end",
+        "select 3",
+    ]
+
+def test_custom_delimiter():
+    assert statements.texts("select 1 $$ select 2 $$", delimiter="$$") == ["select 1", "select 2"]
+    assert statements.texts("select 1;\n/\nselect 2\n/", delimiter="/") == ["select 1;", "select 2"]
+    assert statements.texts("update t set a = 1; update t set b = 2\nGO\nselect 3", delimiter="GO") == ["update t set a = 1; update t set b = 2", "select 3"]
+
+def test_strip_comments():
+    assert statements.strip_comments("select '--x' /* c */ from t -- end") == "select '--x'   from t  "